@@ -3,11 +3,80 @@
 DaVinci Resolve Color Page Operations
 """
 
+import os
+import re
+import base64
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Union
+import tempfile
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .helpers import OpResult, is_success, resolve_call
+from .timeline_item_operations import (Track, forget_current_item, get_active_timeline, get_current_timeline_item,
+                                       get_timeline_item, get_track_items, resolve_scope)
 
 logger = logging.getLogger("davinci-resolve-mcp.color")
 
+# LUT file types accepted by apply_lut
+LUT_FILE_EXTENSIONS = ('.cube', '.3dl', '.lut', '.mga')
+
+NODE_TYPES = ('serial', 'parallel', 'layer')
+
+COPY_GRADE_MODES = ('full', 'current_node', 'all_nodes')
+
+# Color wheel parameter names -> channel identifiers used in the API
+WHEEL_PARAM_CHANNELS = MappingProxyType({
+    'red': 'R',
+    'green': 'G',
+    'blue': 'B',
+    'master': 'Y'
+})
+
+# Color wheel names -> getter/setter function name suffixes used in the API
+COLOR_WHEEL_FUNCTIONS = MappingProxyType({
+    'lift': 'Lift',
+    'gamma': 'Gamma',
+    'gain': 'Gain',
+    'offset': 'Offset'
+})
+
+# Separators accepted between the values of a CDL triple given as a string ("1.0 1.0 1.0")
+CDL_VALUE_SEPARATOR = re.compile(r"[\s,]+")
+
+# Target clips per CopyGrades call
+GRADE_COPY_CHUNK_SIZE = 8
+
+def get_current_grade(resolve) -> Tuple[Optional[Any], Optional[Any], Optional[str]]:
+    """Get the current clip and its grade on the Color page.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+    
+    Returns:
+        Tuple containing (clip, grade, error_message); error_message is None on success
+    """
+    if resolve is None:
+        return None, None, "Not connected to DaVinci Resolve"
+    
+    # First, ensure we're on the color page
+    current_page = resolve.GetCurrentPage()
+    if current_page.lower() != "color":
+        return None, None, f"Not on Color page. Current page is: {current_page}"
+    
+    current_clip, error = get_current_timeline_item(resolve)
+    if error:
+        return None, None, error
+    
+    # Get the clip's grade
+    current_grade = current_clip.GetCurrentGrade()
+    if not current_grade:
+        return None, None, "Failed to get current grade"
+    
+    return current_clip, current_grade, None
+
+@resolve_call("getting current node")
 def get_current_node(resolve) -> Dict[str, Any]:
     """Get information about the current node in the color page.
     
@@ -17,92 +86,61 @@ def get_current_node(resolve) -> Dict[str, Any]:
     Returns:
         Dictionary with current node information
     """
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+    current_clip, current_grade, error = get_current_grade(resolve)
+    if error:
+        return {"error": error}
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return {"error": "Failed to get Project Manager"}
+    # Get the currently selected node
+    current_node_index = current_grade.GetCurrentNode()
+    if current_node_index < 1:
+        return {"error": "No node is currently selected"}
     
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return {"error": "No project currently open"}
+    # Get node count
+    node_count = current_grade.GetNodeCount()
     
-    # First, ensure we're on the color page
-    current_page = resolve.GetCurrentPage()
-    if current_page.lower() != "color":
-        return {"error": f"Not on Color page. Current page is: {current_page}"}
+    # Get information about the current node
+    node_info = {
+        "clip_name": current_clip.GetName(),
+        "node_index": current_node_index,
+        "node_count": node_count,
+        "is_serial": current_grade.IsSerial(current_node_index),
+        "is_parallel": current_grade.IsParallel(current_node_index),
+        "is_layer": current_grade.IsLayer(current_node_index),
+    }
     
-    # Get the current timeline
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return {"error": "No timeline currently active"}
+    # Try to get node name
+    try:
+        node_name = current_grade.GetNodeName(current_node_index)
+        node_info["name"] = node_name
+    except:
+        node_info["name"] = f"Node {current_node_index}"
     
+    # Try to get additional node properties if available
     try:
-        # Access color-specific functionality through the timeline
-        # First get the current clip in the timeline
-        current_clip = current_timeline.GetCurrentVideoItem()
-        if not current_clip:
-            return {"error": "No clip is currently selected in the timeline"}
-        
-        # Get the clip's grade
-        current_grade = current_clip.GetCurrentGrade()
-        if not current_grade:
-            return {"error": "Failed to get current grade"}
-        
-        # Get the currently selected node
-        current_node_index = current_grade.GetCurrentNode()
-        if current_node_index < 1:
-            return {"error": "No node is currently selected"}
+        # Check for common node properties that might be available
+        properties = {}
         
-        # Get node count
-        node_count = current_grade.GetNodeCount()
-        
-        # Get information about the current node
-        node_info = {
-            "clip_name": current_clip.GetName(),
-            "node_index": current_node_index,
-            "node_count": node_count,
-            "is_serial": current_grade.IsSerial(current_node_index),
-            "is_parallel": current_grade.IsParallel(current_node_index),
-            "is_layer": current_grade.IsLayer(current_node_index),
-        }
-        
-        # Try to get node name
+        # Check if node is enabled
         try:
-            node_name = current_grade.GetNodeName(current_node_index)
-            node_info["name"] = node_name
+            properties["enabled"] = current_grade.IsNodeEnabled(current_node_index)
         except:
-            node_info["name"] = f"Node {current_node_index}"
+            pass
         
-        # Try to get additional node properties if available
+        # Get node type if available
         try:
-            # Check for common node properties that might be available
-            properties = {}
-            
-            # Check if node is enabled
-            try:
-                properties["enabled"] = current_grade.IsNodeEnabled(current_node_index)
-            except:
-                pass
-            
-            # Get node type if available
-            try:
-                properties["type"] = current_grade.GetNodeType(current_node_index)
-            except:
-                pass
-            
-            # Add properties if we found any
-            if properties:
-                node_info["properties"] = properties
+            properties["type"] = current_grade.GetNodeType(current_node_index)
         except:
             pass
         
-        return node_info
-        
-    except Exception as e:
-        return {"error": f"Error getting current node: {str(e)}"}
+        # Add properties if we found any
+        if properties:
+            node_info["properties"] = properties
+    except:
+        pass
+    
+    return node_info
 
+@resolve_call("applying LUT", as_dict=False)
 def apply_lut(resolve, lut_path: str, node_index: int = None) -> str:
     """Apply a LUT to a node in the color page.
     
@@ -121,15 +159,13 @@ def apply_lut(resolve, lut_path: str, node_index: int = None) -> str:
     if not lut_path:
         return "Error: LUT path cannot be empty"
     
-    import os
     if not os.path.exists(lut_path):
         return f"Error: LUT file '{lut_path}' does not exist"
     
     # Check file extension for supported LUT types
-    valid_extensions = ['.cube', '.3dl', '.lut', '.mga']
     file_extension = os.path.splitext(lut_path)[1].lower()
-    if file_extension not in valid_extensions:
-        return f"Error: Unsupported LUT file format. Supported formats: {', '.join(valid_extensions)}"
+    if file_extension not in LUT_FILE_EXTENSIONS:
+        return f"Error: Unsupported LUT file format. Supported formats: {', '.join(LUT_FILE_EXTENSIONS)}"
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
@@ -152,45 +188,41 @@ def apply_lut(resolve, lut_path: str, node_index: int = None) -> str:
     if not current_timeline:
         return "Error: No timeline currently active"
     
-    try:
-        # Get the current clip in the timeline
-        current_clip = current_timeline.GetCurrentVideoItem()
-        if not current_clip:
-            return "Error: No clip is currently selected in the timeline"
-        
-        # Get the clip's grade
-        current_grade = current_clip.GetCurrentGrade()
-        if not current_grade:
-            return "Error: Failed to get current grade"
-        
-        # Determine which node to apply the LUT to
-        target_node_index = node_index
-        if target_node_index is None:
-            # Use the currently selected node
-            target_node_index = current_grade.GetCurrentNode()
-            if target_node_index < 1:
-                return "Error: No node is currently selected"
-        else:
-            # Validate the provided node index
-            node_count = current_grade.GetNodeCount()
-            if target_node_index < 1 or target_node_index > node_count:
-                return f"Error: Invalid node index {target_node_index}. Valid range: 1-{node_count}"
-        
-        # Apply the LUT to the node
-        result = current_grade.ApplyLUT(target_node_index, lut_path)
-        
-        if result:
-            # Try to get the node name for a better message
-            try:
-                node_name = current_grade.GetNodeName(target_node_index)
-                return f"Successfully applied LUT '{os.path.basename(lut_path)}' to node '{node_name}' (index {target_node_index})"
-            except:
-                return f"Successfully applied LUT '{os.path.basename(lut_path)}' to node {target_node_index}"
-        else:
-            return f"Failed to apply LUT to node {target_node_index}"
-        
-    except Exception as e:
-        return f"Error applying LUT: {str(e)}"
+    # Get the current clip in the timeline
+    current_clip = current_timeline.GetCurrentVideoItem()
+    if not current_clip:
+        return "Error: No clip is currently selected in the timeline"
+    
+    # Get the clip's grade
+    current_grade = current_clip.GetCurrentGrade()
+    if not current_grade:
+        return "Error: Failed to get current grade"
+    
+    # Determine which node to apply the LUT to
+    target_node_index = node_index
+    if target_node_index is None:
+        # Use the currently selected node
+        target_node_index = current_grade.GetCurrentNode()
+        if target_node_index < 1:
+            return "Error: No node is currently selected"
+    else:
+        # Validate the provided node index
+        node_count = current_grade.GetNodeCount()
+        if target_node_index < 1 or target_node_index > node_count:
+            return f"Error: Invalid node index {target_node_index}. Valid range: 1-{node_count}"
+    
+    # Apply the LUT to the node
+    result = current_grade.ApplyLUT(target_node_index, lut_path)
+    
+    if result:
+        # Try to get the node name for a better message
+        try:
+            node_name = current_grade.GetNodeName(target_node_index)
+            return f"Successfully applied LUT '{os.path.basename(lut_path)}' to node '{node_name}' (index {target_node_index})"
+        except:
+            return f"Successfully applied LUT '{os.path.basename(lut_path)}' to node {target_node_index}"
+    else:
+        return f"Failed to apply LUT to node {target_node_index}"
 
 def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
     """Add a new node to the current grade in the color page.
@@ -207,11 +239,10 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
         return "Error: Not connected to DaVinci Resolve"
     
     # Validate node type
-    valid_node_types = ['serial', 'parallel', 'layer']
-    if node_type.lower() not in valid_node_types:
-        return f"Error: Invalid node type. Must be one of: {', '.join(valid_node_types)}"
+    if node_type.lower() not in NODE_TYPES:
+        return f"Error: Invalid node type. Must be one of: {', '.join(NODE_TYPES)}"
     
-    logger.info(f"Adding {node_type} node with label: {label if label else 'None'}")
+    logger.info("Adding %s node with label: %s", node_type, label if label else 'None')
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
@@ -227,10 +258,10 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
     current_page = resolve.GetCurrentPage()
     if current_page.lower() != "color":
         # Try to switch to color page
-        logger.info(f"Currently on {current_page} page, switching to color page")
+        logger.info("Currently on %s page, switching to color page", current_page)
         result = resolve.OpenPage("color")
         if not result:
-            logger.error(f"Failed to switch to Color page. Current page is: {current_page}")
+            logger.error("Failed to switch to Color page. Current page is: %s", current_page)
             return f"Error: Failed to switch to Color page. Current page is: {current_page}"
         logger.info("Successfully switched to color page")
     
@@ -248,7 +279,7 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
             logger.error("No clip could be selected automatically")
             return f"Error: {message}. Please select a clip manually in DaVinci Resolve."
         
-        logger.info(f"Working with clip: {current_clip.GetName()}")
+        logger.info("Working with clip: %s", current_clip.GetName())
         
         # Get the clip's grade
         # This is where the NoneType error typically occurs
@@ -262,7 +293,7 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
             else:
                 logger.warning("GetCurrentGrade() returned None")
         except Exception as e:
-            logger.error(f"Error getting current grade via GetCurrentGrade(): {str(e)}")
+            logger.error("Error getting current grade via GetCurrentGrade(): %s", e)
             current_grade = None
         
         # Alternative approach if the first method failed
@@ -274,14 +305,15 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
                 # Ensure clip is selected in the timeline
                 logger.info("Trying to select the clip in timeline again")
                 current_timeline.SetCurrentVideoItem(current_clip)
-                logger.info(f"Selected clip {current_clip.GetName()} in timeline")
+                forget_current_item()
+                logger.info("Selected clip %s in timeline", current_clip.GetName())
                 
                 # Try to get grade again after selection
                 current_grade = current_clip.GetCurrentGrade()
                 if current_grade:
                     logger.info("Successfully got current grade after selection")
             except Exception as e:
-                logger.error(f"Error in alternative selection approach: {str(e)}")
+                logger.error("Error in alternative selection approach: %s", e)
         
         # Direct node creation if we still don't have a grade object
         if not current_grade:
@@ -306,9 +338,9 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
                         if result:
                             return f"Successfully added {node_type} node using direct NodeGraph approach"
                         else:
-                            logger.error(f"Failed to add {node_type} node using NodeGraph")
+                            logger.error("Failed to add %s node using NodeGraph", node_type)
             except Exception as e:
-                logger.error(f"Error in direct node creation attempt: {str(e)}")
+                logger.error("Error in direct node creation attempt: %s", e)
             
             return f"Error adding {node_type} node: Cannot access grade object. The clip may not be properly graded yet."
         
@@ -320,50 +352,77 @@ def add_node(resolve, node_type: str = "serial", label: str = None) -> str:
         if node_type.lower() == "serial":
             # Add a serial node after the current node
             method_name = "AddSerialNode"
-            logger.info(f"Calling {method_name}()")
+            logger.info("Calling %s()", method_name)
             result = current_grade.AddSerialNode()
         elif node_type.lower() == "parallel":
             # Add a parallel node
             method_name = "AddParallelNode"
-            logger.info(f"Calling {method_name}()")
+            logger.info("Calling %s()", method_name)
             result = current_grade.AddParallelNode()
         elif node_type.lower() == "layer":
             # Add a layer node
             method_name = "AddLayerNode"
-            logger.info(f"Calling {method_name}()")
+            logger.info("Calling %s()", method_name)
             result = current_grade.AddLayerNode()
         
         if not result:
-            logger.error(f"Failed to add {node_type} node using {method_name}()")
+            logger.error("Failed to add %s node using %s()", node_type, method_name)
             return f"Failed to add {node_type} node using {method_name}()"
         
         # Get the new node count and find the newly added node
         new_node_count = current_grade.GetNodeCount()
-        logger.info(f"New node count: {new_node_count}")
+        logger.info("New node count: %s", new_node_count)
         
         # Get the new node index - it should be the currently selected node
         new_node_index = current_grade.GetCurrentNode()
-        logger.info(f"New node index: {new_node_index}")
+        logger.info("New node index: %s", new_node_index)
         
         # Set label if provided
         if label and new_node_index > 0:
             try:
-                logger.info(f"Setting node label to '{label}'")
+                logger.info("Setting node label to '%s'", label)
                 current_grade.SetNodeLabel(new_node_index, label)
                 node_label_info = f" with label '{label}'"
             except Exception as e:
-                logger.warning(f"Failed to set node label: {str(e)}")
+                logger.warning("Failed to set node label: %s", e)
                 node_label_info = f" (couldn't set label to '{label}')"
         else:
             node_label_info = ""
         
-        logger.info(f"Successfully added {node_type} node (index {new_node_index}){node_label_info}")
+        logger.info("Successfully added %s node (index %s)%s", node_type, new_node_index, node_label_info)
         return f"Successfully added {node_type} node (index {new_node_index}){node_label_info}"
         
     except Exception as e:
-        logger.error(f"Error adding {node_type} node: {str(e)}")
+        logger.error("Error adding %s node: %s", node_type, e)
         return f"Error adding {node_type} node: {str(e)}"
 
+def find_clips_by_name(clips: Iterable[Any], names: Sequence[str]) -> Dict[str, Any]:
+    """Find the first clip with each of the given names in one pass.
+    
+    Each clip's name is fetched from Resolve at most once, and the scan stops as
+    soon as every name has been found.
+    
+    Args:
+        clips: Timeline items to search
+        names: Clip names to look for
+    
+    Returns:
+        Dictionary mapping each name that was found to its clip
+    """
+    remaining = set(names)
+    found = {}
+    for clip in clips:
+        if not clip:
+            continue
+        name = clip.GetName()
+        if name in remaining:
+            found[name] = clip
+            remaining.discard(name)
+            if not remaining:
+                break
+    return found
+
+@resolve_call("copying grade", as_dict=False)
 def copy_grade(resolve, source_clip_name: str = None, target_clip_name: str = None, mode: str = "full") -> str:
     """Copy a grade from one clip to another in the color page.
     
@@ -380,9 +439,8 @@ def copy_grade(resolve, source_clip_name: str = None, target_clip_name: str = No
         return "Error: Not connected to DaVinci Resolve"
     
     # Validate copy mode
-    valid_modes = ['full', 'current_node', 'all_nodes']
-    if mode.lower() not in valid_modes:
-        return f"Error: Invalid copy mode. Must be one of: {', '.join(valid_modes)}"
+    if mode.lower() not in COPY_GRADE_MODES:
+        return f"Error: Invalid copy mode. Must be one of: {', '.join(COPY_GRADE_MODES)}"
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
@@ -405,133 +463,186 @@ def copy_grade(resolve, source_clip_name: str = None, target_clip_name: str = No
     if not current_timeline:
         return "Error: No timeline currently active"
     
-    try:
-        # Get all clips in the timeline
-        all_video_clips = []
-        
-        # Get video track count
+    # Look up the named source and target clips in a single pass over the video tracks
+    clip_names = [name for name in (source_clip_name, target_clip_name) if name]
+    clips_by_name = {}
+    if clip_names:
         video_track_count = current_timeline.GetTrackCount("video")
+        all_video_clips = chain.from_iterable(get_track_items(current_timeline, "video", track_index)
+                                              for track_index in range(1, video_track_count + 1))
+        clips_by_name = find_clips_by_name(all_video_clips, clip_names)
+    
+    # Get the source clip
+    if source_clip_name:
+        source_clip = clips_by_name.get(source_clip_name)
+        if not source_clip:
+            return f"Error: Source clip '{source_clip_name}' not found in timeline"
+    else:
+        # Use the current clip as source
+        source_clip = current_timeline.GetCurrentVideoItem()
+        if not source_clip:
+            return "Error: No clip is currently selected to use as source"
+        source_clip_name = source_clip.GetName()
+    
+    # Get the source grade
+    source_grade = source_clip.GetCurrentGrade()
+    if not source_grade:
+        return f"Error: Failed to get grade from source clip '{source_clip_name}'"
+    
+    # Get the target clip
+    if target_clip_name:
+        # Check if target is same as source
+        if target_clip_name == source_clip_name:
+            return f"Error: Source and target clips cannot be the same (both are '{source_clip_name}')"
+        
+        target_clip = clips_by_name.get(target_clip_name)
+        if not target_clip:
+            return f"Error: Target clip '{target_clip_name}' not found in timeline"
+    else:
+        # Use the current clip as target (need to select a different clip first)
+        current_clip = current_timeline.GetCurrentVideoItem()
         
-        # Gather all clips from video tracks
-        for track_index in range(1, video_track_count + 1):
-            track_items = current_timeline.GetItemListInTrack("video", track_index)
-            if track_items:
-                all_video_clips.extend(track_items)
+        if not current_clip:
+            return "Error: No clip is currently selected to use as target"
         
-        # Get the source clip
-        source_clip = None
-        if source_clip_name:
-            # Find the source clip by name
-            for clip in all_video_clips:
-                if clip and clip.GetName() == source_clip_name:
-                    source_clip = clip
-                    break
-            
-            if not source_clip:
-                return f"Error: Source clip '{source_clip_name}' not found in timeline"
-        else:
-            # Use the current clip as source
-            source_clip = current_timeline.GetCurrentVideoItem()
-            if not source_clip:
-                return "Error: No clip is currently selected to use as source"
-            source_clip_name = source_clip.GetName()
+        if current_clip.GetName() == source_clip_name:
+            return "Error: Cannot copy grade to the same clip. Please specify a different target clip."
         
-        # Get the source grade
-        source_grade = source_clip.GetCurrentGrade()
-        if not source_grade:
-            return f"Error: Failed to get grade from source clip '{source_clip_name}'"
-        
-        # Get the target clip
-        target_clip = None
-        if target_clip_name:
-            # Check if target is same as source
-            if target_clip_name == source_clip_name:
-                return f"Error: Source and target clips cannot be the same (both are '{source_clip_name}')"
-            
-            # Find the target clip by name
-            for clip in all_video_clips:
-                if clip and clip.GetName() == target_clip_name:
-                    target_clip = clip
-                    break
-            
-            if not target_clip:
-                return f"Error: Target clip '{target_clip_name}' not found in timeline"
-        else:
-            # Use the current clip as target (need to select a different clip first)
-            current_clip = current_timeline.GetCurrentVideoItem()
-            
-            if not current_clip:
-                return "Error: No clip is currently selected to use as target"
-            
-            if current_clip.GetName() == source_clip_name:
-                return "Error: Cannot copy grade to the same clip. Please specify a different target clip."
+        target_clip = current_clip
+        target_clip_name = target_clip.GetName()
+    
+    # Get the target grade
+    target_grade = target_clip.GetCurrentGrade()
+    if not target_grade:
+        return f"Error: Failed to get grade from target clip '{target_clip_name}'"
+    
+    # Select the target clip to make it active for grade operations
+    current_timeline.SetCurrentVideoItem(target_clip)
+    forget_current_item()
+    
+    # Execute the copy based on the specified mode
+    result = False
+    if mode.lower() == "full":
+        # Copy the entire grade including all nodes
+        result = target_clip.CopyGrade(source_clip)
+    elif mode.lower() == "current_node":
+        # Copy only the current node from source to target
+        source_node_index = source_grade.GetCurrentNode()
+        target_node_index = target_grade.GetCurrentNode()
+        
+        if source_node_index < 1:
+            return "Error: No node selected in source clip"
+        
+        if target_node_index < 1:
+            return "Error: No node selected in target clip"
+        
+        # Copy the current node
+        result = target_grade.CopyFromNodeToNode(source_grade, source_node_index, target_node_index)
+    elif mode.lower() == "all_nodes":
+        # Copy all nodes but keep other grade settings
+        source_node_count = source_grade.GetNodeCount()
+        
+        if source_node_count < 1:
+            return "Error: Source clip has no nodes to copy"
+        
+        # First, clear all nodes in target
+        target_node_count = target_grade.GetNodeCount()
+        for i in range(target_node_count, 0, -1):
+            target_grade.DeleteNode(i)
+        
+        # Then, add nodes matching the source structure
+        for i in range(1, source_node_count + 1):
+            # Determine node type
+            if source_grade.IsSerial(i):
+                target_grade.AddSerialNode()
+            elif source_grade.IsParallel(i):
+                target_grade.AddParallelNode()
+            elif source_grade.IsLayer(i):
+                target_grade.AddLayerNode()
             
-            target_clip = current_clip
-            target_clip_name = target_clip.GetName()
-        
-        # Get the target grade
-        target_grade = target_clip.GetCurrentGrade()
-        if not target_grade:
-            return f"Error: Failed to get grade from target clip '{target_clip_name}'"
-        
-        # Select the target clip to make it active for grade operations
-        current_timeline.SetCurrentVideoItem(target_clip)
+            # Copy node settings
+            new_node_index = target_grade.GetCurrentNode()
+            if new_node_index > 0:
+                target_grade.CopyFromNodeToNode(source_grade, i, new_node_index)
         
-        # Execute the copy based on the specified mode
-        result = False
-        if mode.lower() == "full":
-            # Copy the entire grade including all nodes
-            result = target_clip.CopyGrade(source_clip)
-        elif mode.lower() == "current_node":
-            # Copy only the current node from source to target
-            source_node_index = source_grade.GetCurrentNode()
-            target_node_index = target_grade.GetCurrentNode()
-            
-            if source_node_index < 1:
-                return "Error: No node selected in source clip"
-            
-            if target_node_index < 1:
-                return "Error: No node selected in target clip"
-            
-            # Copy the current node
-            result = target_grade.CopyFromNodeToNode(source_grade, source_node_index, target_node_index)
-        elif mode.lower() == "all_nodes":
-            # Copy all nodes but keep other grade settings
-            source_node_count = source_grade.GetNodeCount()
-            
-            if source_node_count < 1:
-                return "Error: Source clip has no nodes to copy"
-            
-            # First, clear all nodes in target
-            target_node_count = target_grade.GetNodeCount()
-            for i in range(target_node_count, 0, -1):
-                target_grade.DeleteNode(i)
-            
-            # Then, add nodes matching the source structure
-            for i in range(1, source_node_count + 1):
-                # Determine node type
-                if source_grade.IsSerial(i):
-                    target_grade.AddSerialNode()
-                elif source_grade.IsParallel(i):
-                    target_grade.AddParallelNode()
-                elif source_grade.IsLayer(i):
-                    target_grade.AddLayerNode()
-                
-                # Copy node settings
-                new_node_index = target_grade.GetCurrentNode()
-                if new_node_index > 0:
-                    target_grade.CopyFromNodeToNode(source_grade, i, new_node_index)
-            
-            result = True
+        result = True
+    
+    if result:
+        return f"Successfully copied grade from '{source_clip_name}' to '{target_clip_name}' using mode '{mode}'"
+    else:
+        return f"Failed to copy grade from '{source_clip_name}' to '{target_clip_name}' using mode '{mode}'"
+
+@resolve_call("copying grade to clips")
+def copy_grade_to_clips(resolve, target_clip_names: List[str], source_clip_name: str = None) -> Dict[str, Any]:
+    """Copy one clip's grade to several clips with CopyGrades.
+    
+    Targets are sent in chunks of GRADE_COPY_CHUNK_SIZE, one call after another.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        target_clip_names: Names of the clips to apply the grade to
+        source_clip_name: Name of the clip to copy the grade from (uses current clip if None)
+    
+    Returns:
+        Dictionary with the number of clips graded, any target names not found
+        and any targets skipped because they are the source clip
+    """
+    if not target_clip_names:
+        return {"error": "No target clips specified"}
+    
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
+    
+    # First, ensure we're on the color page
+    current_page = resolve.GetCurrentPage()
+    if current_page.lower() != "color" and not resolve.OpenPage("color"):
+        return {"error": f"Failed to switch to Color page. Current page is: {current_page}"}
+    
+    try:
+        # Look up the source and every target in a single pass over the video tracks
+        video_track_count = current_timeline.GetTrackCount("video")
+        all_video_clips = chain.from_iterable(get_track_items(current_timeline, "video", track_index)
+                                              for track_index in range(1, video_track_count + 1))
+        wanted = list(target_clip_names) + ([source_clip_name] if source_clip_name else [])
+        clips_by_name = find_clips_by_name(all_video_clips, wanted)
         
-        if result:
-            return f"Successfully copied grade from '{source_clip_name}' to '{target_clip_name}' using mode '{mode}'"
+        if source_clip_name:
+            source_clip = clips_by_name.get(source_clip_name)
+            if not source_clip:
+                return {"error": f"Source clip '{source_clip_name}' not found in timeline"}
         else:
-            return f"Failed to copy grade from '{source_clip_name}' to '{target_clip_name}' using mode '{mode}'"
+            source_clip, error = get_current_timeline_item(resolve)
+            if error:
+                return {"error": error}
+            source_clip_name = source_clip.GetName()
         
-    except Exception as e:
-        return f"Error copying grade: {str(e)}"
+        missing = [name for name in target_clip_names if name not in clips_by_name]
+        skipped = [name for name in target_clip_names if name == source_clip_name]
+        target_clips = [clips_by_name[name] for name in dict.fromkeys(target_clip_names)
+                        if name in clips_by_name and name != source_clip_name]
+        if len(skipped) == len(target_clip_names):
+            return {"error": f"All target clips are the source clip '{source_clip_name}'", "skipped": skipped}
+        if not target_clips:
+            return {"error": "None of the target clips were found in the timeline",
+                    "missing": missing, "skipped": skipped}
+        
+        chunks = [target_clips[i:i + GRADE_COPY_CHUNK_SIZE]
+                  for i in range(0, len(target_clips), GRADE_COPY_CHUNK_SIZE)]
+        copied_count = sum(len(chunk) for chunk in chunks if is_success(source_clip.CopyGrades(chunk)))
+        return {
+            "success": copied_count == len(target_clips),
+            "source_clip": source_clip_name,
+            "copied_count": copied_count,
+            "missing": missing,
+            "skipped": skipped
+        }
+    finally:
+        # Return to the original page if we switched
+        if current_page.lower() != "color":
+            resolve.OpenPage(current_page)
 
+@resolve_call("getting color wheel parameters")
 def get_color_wheels(resolve, node_index: int = None) -> Dict[str, Any]:
     """Get color wheel parameters for a specific node.
     
@@ -542,139 +653,119 @@ def get_color_wheels(resolve, node_index: int = None) -> Dict[str, Any]:
     Returns:
         Dictionary with color wheel parameters
     """
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+    current_clip, current_grade, error = get_current_grade(resolve)
+    if error:
+        return {"error": error}
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return {"error": "Failed to get Project Manager"}
+    # Determine which node to get color wheels from
+    target_node_index = node_index
+    if target_node_index is None:
+        # Use the currently selected node
+        target_node_index = current_grade.GetCurrentNode()
+        if target_node_index < 1:
+            return {"error": "No node is currently selected"}
+    else:
+        # Validate the provided node index
+        node_count = current_grade.GetNodeCount()
+        if target_node_index < 1 or target_node_index > node_count:
+            return {"error": f"Invalid node index {target_node_index}. Valid range: 1-{node_count}"}
     
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return {"error": "No project currently open"}
+    # Get node name if available
+    node_name = ""
+    try:
+        node_name = current_grade.GetNodeName(target_node_index)
+    except:
+        node_name = f"Node {target_node_index}"
     
-    # First, ensure we're on the color page
-    current_page = resolve.GetCurrentPage()
-    if current_page.lower() != "color":
-        return {"error": f"Not on Color page. Current page is: {current_page}"}
+    # Get color wheel parameters
+    color_wheels = {
+        "node_index": target_node_index,
+        "node_name": node_name,
+        "clip_name": current_clip.GetName(),
+        "wheels": {}
+    }
     
-    # Get the current timeline
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return {"error": "No timeline currently active"}
+    # Try to get each of the color wheels
+    for wheel_name, function_suffix in COLOR_WHEEL_FUNCTIONS.items():
+        prefix = f"Get{function_suffix}"
+        
+        wheel_data = {}
+        try:
+            # Try to get R, G, B, and Y (master) values
+            for channel_name, channel in WHEEL_PARAM_CHANNELS.items():
+                # Build the function name dynamically
+                function_name = f"{prefix}{channel}"
+                
+                if hasattr(current_grade, function_name):
+                    # Call the function with the node index
+                    getter_func = getattr(current_grade, function_name)
+                    value = getter_func(target_node_index)
+                    wheel_data[channel_name] = value
+            
+            if wheel_data:
+                color_wheels["wheels"][wheel_name] = wheel_data
+        except Exception as e:
+            color_wheels["wheels"][wheel_name] = {"error": f"Could not get {wheel_name} wheel: {str(e)}"}
     
+    # Try to get additional common color controls
     try:
-        # Get the current clip in the timeline
-        current_clip = current_timeline.GetCurrentVideoItem()
-        if not current_clip:
-            return {"error": "No clip is currently selected in the timeline"}
+        additional_controls = {}
         
-        # Get the clip's grade
-        current_grade = current_clip.GetCurrentGrade()
-        if not current_grade:
-            return {"error": "Failed to get current grade"}
-        
-        # Determine which node to get color wheels from
-        target_node_index = node_index
-        if target_node_index is None:
-            # Use the currently selected node
-            target_node_index = current_grade.GetCurrentNode()
-            if target_node_index < 1:
-                return {"error": "No node is currently selected"}
-        else:
-            # Validate the provided node index
-            node_count = current_grade.GetNodeCount()
-            if target_node_index < 1 or target_node_index > node_count:
-                return {"error": f"Invalid node index {target_node_index}. Valid range: 1-{node_count}"}
-        
-        # Get node name if available
-        node_name = ""
+        # Try to get contrast
         try:
-            node_name = current_grade.GetNodeName(target_node_index)
+            if hasattr(current_grade, "GetContrast"):
+                additional_controls["contrast"] = current_grade.GetContrast(target_node_index)
         except:
-            node_name = f"Node {target_node_index}"
-        
-        # Get color wheel parameters
-        color_wheels = {
-            "node_index": target_node_index,
-            "node_name": node_name,
-            "clip_name": current_clip.GetName(),
-            "wheels": {}
-        }
+            pass
         
-        # Try to get each of the color wheels
-        wheels_to_get = [
-            {"name": "lift", "function_prefix": "GetLift"},
-            {"name": "gamma", "function_prefix": "GetGamma"},
-            {"name": "gain", "function_prefix": "GetGain"},
-            {"name": "offset", "function_prefix": "GetOffset"},
-        ]
-        
-        for wheel in wheels_to_get:
-            wheel_name = wheel["name"]
-            prefix = wheel["function_prefix"]
-            
-            wheel_data = {}
-            try:
-                # Try to get R, G, B, and Y (master) values
-                for channel, channel_name in [("R", "red"), ("G", "green"), ("B", "blue"), ("Y", "master")]:
-                    # Build the function name dynamically
-                    function_name = f"{prefix}{channel}"
-                    
-                    if hasattr(current_grade, function_name):
-                        # Call the function with the node index
-                        getter_func = getattr(current_grade, function_name)
-                        value = getter_func(target_node_index)
-                        wheel_data[channel_name] = value
-                
-                if wheel_data:
-                    color_wheels["wheels"][wheel_name] = wheel_data
-            except Exception as e:
-                color_wheels["wheels"][wheel_name] = {"error": f"Could not get {wheel_name} wheel: {str(e)}"}
+        # Try to get saturation
+        try:
+            if hasattr(current_grade, "GetSaturation"):
+                additional_controls["saturation"] = current_grade.GetSaturation(target_node_index)
+        except:
+            pass
         
-        # Try to get additional common color controls
+        # Try to get color temperature
         try:
-            additional_controls = {}
-            
-            # Try to get contrast
-            try:
-                if hasattr(current_grade, "GetContrast"):
-                    additional_controls["contrast"] = current_grade.GetContrast(target_node_index)
-            except:
-                pass
-            
-            # Try to get saturation
-            try:
-                if hasattr(current_grade, "GetSaturation"):
-                    additional_controls["saturation"] = current_grade.GetSaturation(target_node_index)
-            except:
-                pass
-            
-            # Try to get color temperature
-            try:
-                if hasattr(current_grade, "GetColorTemp"):
-                    additional_controls["color_temp"] = current_grade.GetColorTemp(target_node_index)
-            except:
-                pass
-            
-            # Try to get tint
-            try:
-                if hasattr(current_grade, "GetTint"):
-                    additional_controls["tint"] = current_grade.GetTint(target_node_index)
-            except:
-                pass
-            
-            # Add additional controls if any were found
-            if additional_controls:
-                color_wheels["additional_controls"] = additional_controls
+            if hasattr(current_grade, "GetColorTemp"):
+                additional_controls["color_temp"] = current_grade.GetColorTemp(target_node_index)
         except:
             pass
         
-        return color_wheels
+        # Try to get tint
+        try:
+            if hasattr(current_grade, "GetTint"):
+                additional_controls["tint"] = current_grade.GetTint(target_node_index)
+        except:
+            pass
         
-    except Exception as e:
-        return {"error": f"Error getting color wheel parameters: {str(e)}"}
+        # Add additional controls if any were found
+        if additional_controls:
+            color_wheels["additional_controls"] = additional_controls
+    except:
+        pass
+    
+    return color_wheels
 
+def get_current_grade_info(resolve) -> Dict[str, Any]:
+    """Get the current node and its color wheel parameters together.
+    
+    Both lookups run in one resolve_scope(), so the timeline and current clip
+    are fetched from Resolve only once.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+    
+    Returns:
+        Dictionary with the "node" and "wheels" information
+    """
+    with resolve_scope():
+        return {
+            "node": get_current_node(resolve),
+            "wheels": get_color_wheels(resolve)
+        }
+
+@resolve_call("setting color wheel parameter", as_dict=False)
 def set_color_wheel_param(resolve, wheel: str, param: str, value: float, node_index: int = None) -> str:
     """Set a color wheel parameter for a node.
     
@@ -692,32 +783,14 @@ def set_color_wheel_param(resolve, wheel: str, param: str, value: float, node_in
         return "Error: Not connected to DaVinci Resolve"
     
     # Validate wheel
-    valid_wheels = ['lift', 'gamma', 'gain', 'offset']
-    if wheel.lower() not in valid_wheels:
-        return f"Error: Invalid wheel name. Must be one of: {', '.join(valid_wheels)}"
+    if wheel.lower() not in COLOR_WHEEL_FUNCTIONS:
+        return f"Error: Invalid wheel name. Must be one of: {', '.join(COLOR_WHEEL_FUNCTIONS)}"
     
     # Validate parameter
-    valid_params = ['red', 'green', 'blue', 'master']
-    if param.lower() not in valid_params:
-        return f"Error: Invalid parameter name. Must be one of: {', '.join(valid_params)}"
-    
-    logger.info(f"Setting {wheel} {param} to {value}")
-    
-    # Map parameter names to channel identifiers used in the API
-    param_to_channel = {
-        'red': 'R',
-        'green': 'G',
-        'blue': 'B',
-        'master': 'Y'
-    }
+    if param.lower() not in WHEEL_PARAM_CHANNELS:
+        return f"Error: Invalid parameter name. Must be one of: {', '.join(WHEEL_PARAM_CHANNELS)}"
     
-    # Map wheel names to function name prefixes used in the API
-    wheel_to_function_prefix = {
-        'lift': 'SetLift',
-        'gamma': 'SetGamma',
-        'gain': 'SetGain',
-        'offset': 'SetOffset'
-    }
+    logger.info("Setting %s %s to %s", wheel, param, value)
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
@@ -733,10 +806,10 @@ def set_color_wheel_param(resolve, wheel: str, param: str, value: float, node_in
     current_page = resolve.GetCurrentPage()
     if current_page.lower() != "color":
         # Try to switch to color page
-        logger.info(f"Currently on {current_page} page, switching to color page")
+        logger.info("Currently on %s page, switching to color page", current_page)
         result = resolve.OpenPage("color")
         if not result:
-            logger.error(f"Failed to switch to Color page. Current page is: {current_page}")
+            logger.error("Failed to switch to Color page. Current page is: %s", current_page)
             return f"Error: Failed to switch to Color page. Current page is: {current_page}"
         logger.info("Successfully switched to color page")
     
@@ -746,112 +819,313 @@ def set_color_wheel_param(resolve, wheel: str, param: str, value: float, node_in
         logger.error("No timeline currently active")
         return "Error: No timeline currently active"
     
+    # Use the helper function to ensure a clip is selected
+    clip_selected, current_clip, message = ensure_clip_selected(resolve, current_timeline)
+    
+    if not clip_selected or not current_clip:
+        logger.error("No clip could be selected automatically")
+        return f"Error: {message}. Please select a clip manually in DaVinci Resolve."
+    
+    logger.info("Working with clip: %s", current_clip.GetName())
+    
+    # Get the clip's grade
+    # This is where the NoneType error typically occurs
+    logger.info("Attempting to get current grade")
+    
+    # First method: Direct approach
     try:
-        # Use the helper function to ensure a clip is selected
-        clip_selected, current_clip, message = ensure_clip_selected(resolve, current_timeline)
-        
-        if not clip_selected or not current_clip:
-            logger.error("No clip could be selected automatically")
-            return f"Error: {message}. Please select a clip manually in DaVinci Resolve."
-        
-        logger.info(f"Working with clip: {current_clip.GetName()}")
-        
-        # Get the clip's grade
-        # This is where the NoneType error typically occurs
-        logger.info("Attempting to get current grade")
+        current_grade = current_clip.GetCurrentGrade()
+        if current_grade:
+            logger.info("Successfully got current grade using GetCurrentGrade()")
+        else:
+            logger.warning("GetCurrentGrade() returned None")
+    except Exception as e:
+        logger.error("Error getting current grade via GetCurrentGrade(): %s", e)
+        current_grade = None
+    
+    # Alternative approach if the first method failed
+    if not current_grade:
+        logger.info("Attempting alternative methods to access grade functionality")
         
-        # First method: Direct approach
+        # Try to select the clip first to ensure it's active
         try:
+            # Ensure clip is selected in the timeline
+            logger.info("Trying to select the clip in timeline again")
+            current_timeline.SetCurrentVideoItem(current_clip)
+            forget_current_item()
+            logger.info("Selected clip %s in timeline", current_clip.GetName())
+            
+            # Try to get grade again after selection
             current_grade = current_clip.GetCurrentGrade()
             if current_grade:
-                logger.info("Successfully got current grade using GetCurrentGrade()")
-            else:
-                logger.warning("GetCurrentGrade() returned None")
-        except Exception as e:
-            logger.error(f"Error getting current grade via GetCurrentGrade(): {str(e)}")
-            current_grade = None
-        
-        # Alternative approach if the first method failed
-        if not current_grade:
-            logger.info("Attempting alternative methods to access grade functionality")
-            
-            # Try to select the clip first to ensure it's active
-            try:
-                # Ensure clip is selected in the timeline
-                logger.info("Trying to select the clip in timeline again")
-                current_timeline.SetCurrentVideoItem(current_clip)
-                logger.info(f"Selected clip {current_clip.GetName()} in timeline")
-                
-                # Try to get grade again after selection
-                current_grade = current_clip.GetCurrentGrade()
-                if current_grade:
-                    logger.info("Successfully got current grade after selection")
-            except Exception as e:
-                logger.error(f"Error in alternative selection approach: {str(e)}")
-        
-        # Check if we have a valid grade object
-        if not current_grade:
-            logger.error("Could not get grade object after multiple attempts")
-            return "Error setting color wheel parameter: Cannot access grade object. The clip may not be properly graded yet."
-        
-        logger.info("Proceeding with parameter setting with valid grade object")
-        
-        # Determine which node to set parameter for
-        target_node_index = node_index
-        if target_node_index is None:
-            # Use the currently selected node
-            logger.info("Getting current node index")
-            target_node_index = current_grade.GetCurrentNode()
-            if target_node_index < 1:
-                logger.error("No node is currently selected")
-                return "Error: No node is currently selected"
-            logger.info(f"Using current node: {target_node_index}")
-        else:
-            # Validate the provided node index
-            logger.info(f"Validating provided node index: {target_node_index}")
-            node_count = current_grade.GetNodeCount()
-            if target_node_index < 1 or target_node_index > node_count:
-                logger.error(f"Invalid node index {target_node_index}. Valid range: 1-{node_count}")
-                return f"Error: Invalid node index {target_node_index}. Valid range: 1-{node_count}"
-        
-        # Get node name for better reporting
-        node_name = ""
-        try:
-            logger.info(f"Getting name for node {target_node_index}")
-            node_name = current_grade.GetNodeName(target_node_index) or f"Node {target_node_index}"
-            logger.info(f"Node name: {node_name}")
+                logger.info("Successfully got current grade after selection")
         except Exception as e:
-            logger.warning(f"Could not get node name: {str(e)}")
-            node_name = f"Node {target_node_index}"
-        
-        # Build the function name to call
-        channel = param_to_channel[param.lower()]
-        function_prefix = wheel_to_function_prefix[wheel.lower()]
-        function_name = f"{function_prefix}{channel}"
-        logger.info(f"Function to call: {function_name}")
-        
-        # Check if the function exists
-        if not hasattr(current_grade, function_name):
-            logger.error(f"Function '{function_name}' not found in DaVinci Resolve API")
-            return f"Error: Function '{function_name}' not found in DaVinci Resolve API for setting {wheel} {param}"
-        
-        # Get the setter function
-        setter_func = getattr(current_grade, function_name)
-        
-        # Set the parameter value
-        logger.info(f"Calling {function_name}({target_node_index}, {value})")
-        result = setter_func(target_node_index, value)
-        
-        if result:
-            logger.info(f"Successfully set {wheel} {param} to {value} for {node_name}")
-            return f"Successfully set {wheel} {param} to {value} for {node_name}"
-        else:
-            logger.error(f"Failed to set {wheel} {param} to {value} for {node_name}")
-            return f"Failed to set {wheel} {param} to {value} for {node_name}"
-        
+            logger.error("Error in alternative selection approach: %s", e)
+    
+    # Check if we have a valid grade object
+    if not current_grade:
+        logger.error("Could not get grade object after multiple attempts")
+        return "Error setting color wheel parameter: Cannot access grade object. The clip may not be properly graded yet."
+    
+    logger.info("Proceeding with parameter setting with valid grade object")
+    
+    # Determine which node to set parameter for
+    target_node_index = node_index
+    if target_node_index is None:
+        # Use the currently selected node
+        logger.info("Getting current node index")
+        target_node_index = current_grade.GetCurrentNode()
+        if target_node_index < 1:
+            logger.error("No node is currently selected")
+            return "Error: No node is currently selected"
+        logger.info("Using current node: %s", target_node_index)
+    else:
+        # Validate the provided node index
+        logger.info("Validating provided node index: %s", target_node_index)
+        node_count = current_grade.GetNodeCount()
+        if target_node_index < 1 or target_node_index > node_count:
+            logger.error("Invalid node index %s. Valid range: 1-%s", target_node_index, node_count)
+            return f"Error: Invalid node index {target_node_index}. Valid range: 1-{node_count}"
+    
+    # Get node name for better reporting
+    node_name = ""
+    try:
+        logger.info("Getting name for node %s", target_node_index)
+        node_name = current_grade.GetNodeName(target_node_index) or f"Node {target_node_index}"
+        logger.info("Node name: %s", node_name)
     except Exception as e:
-        logger.error(f"Error setting color wheel parameter: {str(e)}")
-        return f"Error setting color wheel parameter: {str(e)}"
+        logger.warning("Could not get node name: %s", e)
+        node_name = f"Node {target_node_index}"
+    
+    # Build the function name to call
+    channel = WHEEL_PARAM_CHANNELS[param.lower()]
+    function_name = f"Set{COLOR_WHEEL_FUNCTIONS[wheel.lower()]}{channel}"
+    logger.info("Function to call: %s", function_name)
+    
+    # Check if the function exists
+    if not hasattr(current_grade, function_name):
+        logger.error("Function '%s' not found in DaVinci Resolve API", function_name)
+        return f"Error: Function '{function_name}' not found in DaVinci Resolve API for setting {wheel} {param}"
+    
+    # Get the setter function
+    setter_func = getattr(current_grade, function_name)
+    
+    # Set the parameter value
+    logger.info("Calling %s(%s, %s)", function_name, target_node_index, value)
+    result = setter_func(target_node_index, value)
+    
+    if result:
+        logger.info("Successfully set %s %s to %s for %s", wheel, param, value, node_name)
+        return f"Successfully set {wheel} {param} to {value} for {node_name}"
+    else:
+        logger.error("Failed to set %s %s to %s for %s", wheel, param, value, node_name)
+        return f"Failed to set {wheel} {param} to {value} for {node_name}"
+
+def normalize_cdl_values(name: str, values: Union[Sequence[float], str]) -> List[float]:
+    """Turn a CDL red/green/blue triple into three floats.
+    
+    Args:
+        name: Name of the CDL component, used in error messages (e.g. "slope")
+        values: Three numbers, or a string of three numbers separated by spaces or commas
+    
+    Returns:
+        List with the red, green and blue values
+    
+    Raises:
+        ValueError: If there aren't exactly 3 numeric values
+    """
+    if isinstance(values, str):
+        values = CDL_VALUE_SEPARATOR.split(values.strip())
+    
+    if len(values) != 3:
+        raise ValueError(f"{name} must have exactly 3 values (red, green, blue), got {len(values)}")
+    
+    try:
+        return [float(value) for value in values]
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} values must be numbers, got {values!r}") from None
+
+def build_cdl_map(node_index: int, slope: Union[Sequence[float], str], offset: Union[Sequence[float], str],
+                  power: Union[Sequence[float], str], saturation: Union[float, str] = 1.0) -> Dict[str, str]:
+    """Build the CDL map expected by TimelineItem.SetCDL.
+    
+    Args:
+        node_index: 1-based index of the node to apply the CDL to
+        slope: Red, green and blue slope values (a sequence or a "R G B" string)
+        offset: Red, green and blue offset values (a sequence or a "R G B" string)
+        power: Red, green and blue power values (a sequence or a "R G B" string)
+        saturation: Saturation value
+    
+    Returns:
+        Dictionary with the CDL values formatted as Resolve expects them
+    
+    Raises:
+        ValueError: If a component doesn't have exactly 3 numeric values, or saturation isn't a number
+    """
+    slope = normalize_cdl_values("slope", slope)
+    offset = normalize_cdl_values("offset", offset)
+    power = normalize_cdl_values("power", power)
+    try:
+        saturation = float(saturation)
+    except (TypeError, ValueError):
+        raise ValueError(f"saturation must be a number, got {saturation!r}") from None
+    
+    return {
+        "NodeIndex": str(int(node_index)),
+        "Slope": " ".join(map("{:.4f}".format, slope)),
+        "Offset": " ".join(map("{:.4f}".format, offset)),
+        "Power": " ".join(map("{:.4f}".format, power)),
+        "Saturation": "{:.4f}".format(saturation),
+    }
+
+@resolve_call("applying CDL", as_dict=False)
+def set_cdl(resolve, slope: Union[Sequence[float], str], offset: Union[Sequence[float], str],
+            power: Union[Sequence[float], str], saturation: float = 1.0, node_index: int = 1, track_type: str = "video",
+            track_index: int = 1, item_index: Optional[int] = None) -> str:
+    """Apply ASC CDL values to a node of a timeline item's grade.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        slope: Red, green and blue slope values (a sequence or a "R G B" string)
+        offset: Red, green and blue offset values (a sequence or a "R G B" string)
+        power: Red, green and blue power values (a sequence or a "R G B" string)
+        saturation: Saturation value
+        node_index: 1-based index of the node to apply the CDL to
+        track_type: Type of the track containing the item
+        track_index: 1-based index of the track containing the item
+        item_index: 1-based index of the item in the track (uses the current clip if None)
+    
+    Returns:
+        String indicating success or failure with detailed error message
+    """
+    try:
+        cdl = build_cdl_map(node_index, slope, offset, power, saturation)
+    except (TypeError, ValueError) as e:
+        return f"Error: Invalid CDL values: {str(e)}"
+    
+    timeline_item, error = get_timeline_item(resolve, Track(track_type, track_index), item_index)
+    if error:
+        return f"Error: {error}"
+    
+    if timeline_item.SetCDL(cdl):
+        logger.info("Applied CDL %s to '%s'", cdl, timeline_item.GetName())
+        return f"Successfully applied CDL to node {node_index} of '{timeline_item.GetName()}'"
+    else:
+        return f"Failed to apply CDL to node {node_index} of '{timeline_item.GetName()}'"
+
+def parse_cdl_row(row: Sequence[float]) -> Tuple[int, Dict[str, str]]:
+    """Turn one set_cdl_batch row into a node index and its CDL map.
+    
+    Args:
+        row: [node_index, slope R G B, offset R G B, power R G B] with an
+             optional trailing saturation (defaults to 1.0)
+    
+    Returns:
+        Tuple containing (node_index, CDL map for TimelineItem.SetCDL)
+    
+    Raises:
+        ValueError: If the row has the wrong length, the node index isn't a
+                    whole number or a CDL value isn't a number
+    """
+    if len(row) not in (10, 11):
+        raise ValueError(f"Expected 10 or 11 values per row, got {len(row)}")
+    
+    # Rows arrive as lists of floats, so 2.0 is accepted as node 2
+    node_index = row[0]
+    is_whole = isinstance(node_index, int) or (isinstance(node_index, float) and node_index.is_integer())
+    if isinstance(node_index, bool) or not is_whole or node_index < 1:
+        raise ValueError(f"Node index must be a whole number of at least 1, got {node_index!r}")
+    node_index = int(node_index)
+    
+    saturation = row[10] if len(row) == 11 else 1.0
+    return node_index, build_cdl_map(node_index, row[1:4], row[4:7], row[7:10], saturation)
+
+@resolve_call("applying CDL batch")
+def set_cdl_batch(resolve, rows: Sequence[Sequence[float]], track_type: str = "video", track_index: int = 1,
+                  item_index: Optional[int] = None) -> Dict[str, Any]:
+    """Apply CDL values to several nodes of one timeline item.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        rows: One row per node: [node_index, slope R G B, offset R G B, power R G B]
+              with an optional trailing saturation (defaults to 1.0)
+        track_type: Type of the track containing the item
+        track_index: 1-based index of the track containing the item
+        item_index: 1-based index of the item in the track (uses the current clip if None)
+    
+    Returns:
+        Dictionary with per-node results
+    """
+    if not rows:
+        return {"error": "No CDL rows specified"}
+    
+    timeline_item, error = get_timeline_item(resolve, Track(track_type, track_index), item_index)
+    if error:
+        return {"error": error}
+    
+    results = []
+    for row in rows:
+        try:
+            node_index, cdl = parse_cdl_row(row)
+        except (TypeError, ValueError) as e:
+            extras = {"node_index": row[0]} if isinstance(row, (list, tuple)) and row else {}
+            results.append(OpResult(False, error=f"Invalid CDL row: {str(e)}", extras=extras).to_dict())
+            continue
+        results.append(OpResult(is_success(timeline_item.SetCDL(cdl)), extras={"node_index": node_index}).to_dict())
+    
+    return {
+        "success": all(r["success"] for r in results),
+        "clip_name": timeline_item.GetName(),
+        "results": results
+    }
+
+@resolve_call("exporting clip thumbnail")
+def export_current_clip_thumbnail(resolve, output_path: str = None) -> Dict[str, Any]:
+    """Write the current clip's thumbnail to an image file instead of returning its pixels.
+    
+    Resolve hands the thumbnail over as base64-encoded raw RGB, which would bloat
+    the response, so the pixels are written out as a binary PPM and only a file
+    URI plus the image metadata are returned.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        output_path: Where to write the image (uses a temporary .ppm file if None)
+    
+    Returns:
+        Dictionary with the thumbnail URI, dimensions, format and size in bytes
+    """
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
+    
+    current_page = resolve.GetCurrentPage()
+    if current_page.lower() != "color":
+        return {"error": f"Not on Color page. Current page is: {current_page}"}
+    
+    thumbnail = current_timeline.GetCurrentClipThumbnailImage()
+    if not thumbnail or not thumbnail.get("data"):
+        return {"error": "No thumbnail available for the current clip"}
+    
+    width = int(thumbnail["width"])
+    height = int(thumbnail["height"])
+    pixels = base64.b64decode(thumbnail["data"])
+    
+    if not output_path:
+        with tempfile.NamedTemporaryFile(prefix="resolve_thumbnail_", suffix=".ppm", delete=False) as f:
+            output_path = f.name
+    
+    with open(output_path, "wb") as f:
+        f.write(f"P6\n{width} {height}\n255\n".encode("ascii"))
+        f.write(pixels)
+    
+    return {
+        "thumbnail_uri": Path(output_path).resolve().as_uri(),
+        "width": width,
+        "height": height,
+        "format": "PPM",
+        "source_format": thumbnail.get("format", ""),
+        "size": len(pixels)
+    }
 
 def ensure_clip_selected(resolve, timeline) -> Tuple[bool, Optional[Any], str]:
     """Ensures a clip is selected in the timeline, selecting the first clip if needed.
@@ -866,7 +1140,7 @@ def ensure_clip_selected(resolve, timeline) -> Tuple[bool, Optional[Any], str]:
     # First check if there's already a clip selected
     current_clip = timeline.GetCurrentVideoItem()
     if current_clip:
-        logger.info(f"Clip already selected: {current_clip.GetName()}")
+        logger.info("Clip already selected: %s", current_clip.GetName())
         return True, current_clip, f"Using currently selected clip: {current_clip.GetName()}"
     
     # No clip selected, try to select the first clip
@@ -874,44 +1148,45 @@ def ensure_clip_selected(resolve, timeline) -> Tuple[bool, Optional[Any], str]:
     try:
         # Get video tracks
         video_track_count = timeline.GetTrackCount("video")
-        logger.info(f"Timeline has {video_track_count} video tracks")
+        logger.info("Timeline has %s video tracks", video_track_count)
         
         # Check each track for clips
         for track_index in range(1, video_track_count + 1):
-            logger.info(f"Checking video track {track_index}")
+            logger.info("Checking video track %s", track_index)
             
             # Get clips in this track
             track_items = timeline.GetItemListInTrack("video", track_index)
             if not track_items or len(track_items) == 0:
-                logger.info(f"No clips in track {track_index}")
+                logger.info("No clips in track %s", track_index)
                 continue
                 
-            logger.info(f"Found {len(track_items)} clips in track {track_index}")
+            logger.info("Found %s clips in track %s", len(track_items), track_index)
             
             # Try to select the first clip
             first_clip = track_items[0]
             if first_clip:
                 clip_name = first_clip.GetName()
-                logger.info(f"Attempting to select clip: {clip_name}")
+                logger.info("Attempting to select clip: %s", clip_name)
                 
                 # Set it as the current clip
                 timeline.SetCurrentVideoItem(first_clip)
+                forget_current_item()
                 
                 # Verify selection
                 selected_clip = timeline.GetCurrentVideoItem()
                 if selected_clip and selected_clip.GetName() == clip_name:
-                    logger.info(f"Successfully selected first clip: {clip_name}")
+                    logger.info("Successfully selected first clip: %s", clip_name)
                     return True, selected_clip, f"Automatically selected clip: {clip_name}"
                 else:
                     logger.warning("Failed to verify clip selection")
             
             # If we got here, we couldn't select a clip in this track
-            logger.warning(f"Could not select a clip in track {track_index}")
+            logger.warning("Could not select a clip in track %s", track_index)
         
         # If we reach here, we couldn't find or select any clips
         logger.warning("No clips found in any video track, or could not select any")
         return False, None, "Could not find any clips in the timeline to select"
         
     except Exception as e:
-        logger.error(f"Error attempting to select a clip: {str(e)}")
+        logger.error("Error attempting to select a clip: %s", e)
         return False, None, f"Error selecting clip: {str(e)}" 
\ No newline at end of file
@@ -3,11 +3,36 @@
 DaVinci Resolve Delivery Page Operations
 """
 
+import time
 import logging
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+from .timeline_item_operations import forget_active_timeline
 
 logger = logging.getLogger("davinci-resolve-mcp.delivery")
 
+# Response templates for render queue status polling; copied before use
+EMPTY_RENDER_QUEUE_STATUS = {
+    "status": "empty",
+    "message": "Render queue is empty",
+    "jobs": []
+}
+RENDER_JOB_TEMPLATE = {
+    "id": None,
+    "name": "Unknown",
+    "status": "Unknown"
+}
+
+# Shared precondition failures; every entry point returns a fresh copy
+NO_RESOLVE_ERROR = {"error": "No connection to DaVinci Resolve"}
+NO_PROJECT_MANAGER_ERROR = {"error": "Failed to get Project Manager"}
+NO_PROJECT_ERROR = {"error": "No project is currently open"}
+RENDER_QUEUE_ALREADY_EMPTY = {
+    "success": True,
+    "message": "Render queue is already empty",
+    "jobs_removed": 0
+}
+
 def get_render_presets(resolve) -> List[Dict[str, Any]]:
     """Get all available render presets in the current project.
     
@@ -19,22 +44,22 @@ def get_render_presets(resolve) -> List[Dict[str, Any]]:
     """
     if not resolve:
         logger.error("No connection to DaVinci Resolve")
-        return {"error": "No connection to DaVinci Resolve"}
+        return dict(NO_RESOLVE_ERROR)
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         logger.error("Failed to get Project Manager")
-        return {"error": "Failed to get Project Manager"}
+        return dict(NO_PROJECT_MANAGER_ERROR)
     
     current_project = project_manager.GetCurrentProject()
     if not current_project:
         logger.error("No project is currently open")
-        return {"error": "No project is currently open"}
+        return dict(NO_PROJECT_ERROR)
     
     # Switch to the Deliver page
     page = resolve.GetCurrentPage()
     if page != "deliver":
-        logger.info(f"Switching from {page} page to deliver page")
+        logger.info("Switching from %s page to deliver page", page)
         resolve.OpenPage("deliver")
     
     render_settings = current_project.GetRenderSettings()
@@ -70,11 +95,11 @@ def get_render_presets(resolve) -> List[Dict[str, Any]]:
                     if frame_rate:
                         preset_info["details"]["frame_rate"] = frame_rate
             except Exception as e:
-                logger.warning(f"Could not get detailed information for preset {preset}: {str(e)}")
+                logger.warning("Could not get detailed information for preset %s: %s", preset, e)
             
             presets.append(preset_info)
     except Exception as e:
-        logger.warning(f"Could not get project presets: {str(e)}")
+        logger.warning("Could not get project presets: %s", e)
     
     # Get system presets
     try:
@@ -89,7 +114,7 @@ def get_render_presets(resolve) -> List[Dict[str, Any]]:
             # Similar detailed information retrieval could be added here
             presets.append(preset_info)
     except Exception as e:
-        logger.warning(f"Could not get system presets: {str(e)}")
+        logger.warning("Could not get system presets: %s", e)
     
     return presets
 
@@ -114,39 +139,40 @@ def add_to_render_queue(
     """
     if not resolve:
         logger.error("No connection to DaVinci Resolve")
-        return {"error": "No connection to DaVinci Resolve"}
+        return dict(NO_RESOLVE_ERROR)
     
-    logger.info(f"Adding timeline to render queue with preset: {preset_name}")
+    logger.info("Adding timeline to render queue with preset: %s", preset_name)
     if timeline_name:
-        logger.info(f"Using specified timeline: {timeline_name}")
+        logger.info("Using specified timeline: %s", timeline_name)
     else:
         logger.info("Using current timeline")
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         logger.error("Failed to get Project Manager")
-        return {"error": "Failed to get Project Manager"}
+        return dict(NO_PROJECT_MANAGER_ERROR)
     
     current_project = project_manager.GetCurrentProject()
     if not current_project:
         logger.error("No project is currently open")
-        return {"error": "No project is currently open"}
+        return dict(NO_PROJECT_ERROR)
     
     # Switch to the Deliver page
     page = resolve.GetCurrentPage()
     if page != "deliver":
-        logger.info(f"Switching from {page} page to deliver page")
+        logger.info("Switching from %s page to deliver page", page)
         resolve.OpenPage("deliver")
     
     # Get the timeline to render
     if timeline_name:
         timeline = current_project.GetTimelineByName(timeline_name)
         if not timeline:
-            logger.error(f"Timeline '{timeline_name}' not found")
+            logger.error("Timeline '%s' not found", timeline_name)
             return {"error": f"Timeline '{timeline_name}' not found"}
         
         # Set it as the current timeline
         current_project.SetCurrentTimeline(timeline)
+        forget_active_timeline()
     else:
         timeline = current_project.GetCurrentTimeline()
         if not timeline:
@@ -155,12 +181,12 @@ def add_to_render_queue(
     
     # Get timeline name for reporting
     actual_timeline_name = timeline.GetName()
-    logger.info(f"Using timeline: {actual_timeline_name}")
+    logger.info("Using timeline: %s", actual_timeline_name)
     
     # Use our helper function to ensure render settings are initialized
     success, render_settings_interface, message = ensure_render_settings(resolve, current_project)
     if not success or not render_settings_interface:
-        logger.error(f"Failed to initialize render settings: {message}")
+        logger.error("Failed to initialize render settings: %s", message)
         return {"error": message}
     
     # Use our helper function to validate the preset
@@ -168,25 +194,25 @@ def add_to_render_queue(
         render_settings_interface, preset_name
     )
     if not preset_valid:
-        logger.error(f"Invalid preset: {preset_message}")
+        logger.error("Invalid preset: %s", preset_message)
         return {"error": preset_message}
     
     # Apply the render preset
     settings_to_apply = {"SelectPreset": preset_name}
-    logger.info(f"Applying render preset: {preset_name}")
+    logger.info("Applying render preset: %s", preset_name)
     
     # Add any additional render settings if provided
     if render_settings:
-        logger.info(f"Adding additional render settings: {render_settings}")
+        logger.info("Adding additional render settings: %s", render_settings)
         settings_to_apply.update(render_settings)
     
     try:
         if not render_settings_interface.SetRenderSettings(settings_to_apply):
-            logger.error(f"Failed to apply render preset '{preset_name}'")
+            logger.error("Failed to apply render preset '%s'", preset_name)
             return {"error": f"Failed to apply render preset '{preset_name}'"}
         logger.info("Successfully applied render preset")
     except Exception as e:
-        logger.error(f"Error applying render preset: {str(e)}")
+        logger.error("Error applying render preset: %s", e)
         return {"error": f"Error applying render preset: {str(e)}"}
     
     # Add to render queue
@@ -197,10 +223,10 @@ def add_to_render_queue(
             logger.info("Using in/out range for render")
             result = current_project.AddRenderJobToRenderQueue()
         else:
-            logger.info(f"Adding entire timeline '{actual_timeline_name}' to render queue")
+            logger.info("Adding entire timeline '%s' to render queue", actual_timeline_name)
             result = current_project.AddTimelineToRenderQueue(actual_timeline_name)
     except Exception as e:
-        logger.error(f"Exception while adding to render queue: {str(e)}")
+        logger.error("Exception while adding to render queue: %s", e)
         
         # Try alternative approach - sometimes a different order helps
         try:
@@ -209,7 +235,6 @@ def add_to_render_queue(
             render_settings_interface.SetRenderSettings(settings_to_apply)
             
             # Try adding again after a small delay
-            import time
             time.sleep(0.5)
             
             if use_in_out_range:
@@ -217,11 +242,11 @@ def add_to_render_queue(
             else:
                 result = current_project.AddTimelineToRenderQueue(actual_timeline_name)
         except Exception as nested_e:
-            logger.error(f"Alternative approach also failed: {str(nested_e)}")
+            logger.error("Alternative approach also failed: %s", nested_e)
             return {"error": f"Failed to add to render queue: {str(e)}. Alternative approach also failed: {str(nested_e)}"}
     
     if result:
-        logger.info(f"Successfully added '{actual_timeline_name}' to render queue with preset '{preset_name}'")
+        logger.info("Successfully added '%s' to render queue with preset '%s'", actual_timeline_name, preset_name)
         return {
             "success": True,
             "message": f"Added '{actual_timeline_name}' to render queue with preset '{preset_name}'",
@@ -244,24 +269,24 @@ def start_render(resolve) -> Dict[str, Any]:
     """
     if not resolve:
         logger.error("No connection to DaVinci Resolve")
-        return {"error": "No connection to DaVinci Resolve"}
+        return dict(NO_RESOLVE_ERROR)
     
     logger.info("Starting render process")
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         logger.error("Failed to get Project Manager")
-        return {"error": "Failed to get Project Manager"}
+        return dict(NO_PROJECT_MANAGER_ERROR)
     
     current_project = project_manager.GetCurrentProject()
     if not current_project:
         logger.error("No project is currently open")
-        return {"error": "No project is currently open"}
+        return dict(NO_PROJECT_ERROR)
     
     # Switch to the Deliver page
     page = resolve.GetCurrentPage()
     if page != "deliver":
-        logger.info(f"Switching from {page} page to deliver page")
+        logger.info("Switching from %s page to deliver page", page)
         resolve.OpenPage("deliver")
     
     # Start rendering
@@ -271,12 +296,12 @@ def start_render(resolve) -> Dict[str, Any]:
         try:
             queue_items = current_project.GetRenderJobList()
             if queue_items:
-                logger.info(f"Found {len(queue_items)} jobs in render queue")
+                logger.info("Found %s jobs in render queue", len(queue_items))
             else:
                 logger.warning("GetRenderJobList() returned None or empty list")
                 queue_items = []
         except Exception as e:
-            logger.error(f"Error getting render job list: {str(e)}")
+            logger.error("Error getting render job list: %s", e)
             queue_items = []
         
         if not queue_items or len(queue_items) == 0:
@@ -296,7 +321,7 @@ def start_render(resolve) -> Dict[str, Any]:
             logger.info("Newer StartRendering() API not available, using StartRenderingJob()")
             result = current_project.StartRenderingJob()
         except Exception as e:
-            logger.error(f"Error starting render: {str(e)}")
+            logger.error("Error starting render: %s", e)
             result = False
             
         if result:
@@ -311,7 +336,7 @@ def start_render(resolve) -> Dict[str, Any]:
             return {"error": "Failed to start rendering", "jobs_count": len(queue_items)}
             
     except Exception as e:
-        logger.error(f"Exception while starting render: {str(e)}")
+        logger.error("Exception while starting render: %s", e)
         return {"error": f"Failed to start rendering: {str(e)}"}
 
 def get_render_queue_status(resolve) -> Dict[str, Any]:
@@ -325,22 +350,22 @@ def get_render_queue_status(resolve) -> Dict[str, Any]:
     """
     if not resolve:
         logger.error("No connection to DaVinci Resolve")
-        return {"error": "No connection to DaVinci Resolve"}
+        return dict(NO_RESOLVE_ERROR)
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         logger.error("Failed to get Project Manager")
-        return {"error": "Failed to get Project Manager"}
+        return dict(NO_PROJECT_MANAGER_ERROR)
     
     current_project = project_manager.GetCurrentProject()
     if not current_project:
         logger.error("No project is currently open")
-        return {"error": "No project is currently open"}
+        return dict(NO_PROJECT_ERROR)
     
     # Switch to the Deliver page
     page = resolve.GetCurrentPage()
     if page != "deliver":
-        logger.info(f"Switching from {page} page to deliver page")
+        logger.info("Switching from %s page to deliver page", page)
         resolve.OpenPage("deliver")
     
     try:
@@ -348,22 +373,20 @@ def get_render_queue_status(resolve) -> Dict[str, Any]:
         queue_items = current_project.GetRenderJobList()
         
         if not queue_items:
-            return {
-                "status": "empty",
-                "message": "Render queue is empty",
-                "jobs": []
-            }
+            return dict(EMPTY_RENDER_QUEUE_STATUS, jobs=[])
             
         # Get details for each job
         jobs = []
         is_rendering = False
         
+        # Not every Resolve version exposes the per-job progress getters; look
+        # them up once instead of trapping the failure on every job
+        get_frame_progress = getattr(current_project, "GetRenderJobFrameProgress", None)
+        get_time_remaining = getattr(current_project, "GetRenderJobEstimatedTimeRemaining", None)
+        
         for job_id in queue_items:
-            job_info = {
-                "id": job_id,
-                "name": "Unknown",
-                "status": "Unknown"
-            }
+            job_info = RENDER_JOB_TEMPLATE.copy()
+            job_info["id"] = job_id
             
             try:
                 # Try to get job name (usually timeline name)
@@ -377,34 +400,31 @@ def get_render_queue_status(resolve) -> Dict[str, Any]:
                 if status == "Rendering":
                     is_rendering = True
                 
-                # Try to get additional job properties if available
-                try:
-                    # Frame progress might be available for rendering jobs
-                    progress = current_project.GetRenderJobFrameProgress(job_id)
+                # Frame progress might be available for rendering jobs
+                if get_frame_progress is not None:
+                    progress = get_frame_progress(job_id)
                     if progress:
                         job_info["progress"] = progress
-                        
-                    # Get estimated remaining time if available
-                    time_remaining = current_project.GetRenderJobEstimatedTimeRemaining(job_id)
+                
+                # Get estimated remaining time if available
+                if get_time_remaining is not None:
+                    time_remaining = get_time_remaining(job_id)
                     if time_remaining:
                         job_info["time_remaining"] = time_remaining
-                except:
-                    # Not all properties are available for all job states
-                    pass
                 
             except Exception as e:
-                logger.warning(f"Could not get details for job {job_id}: {str(e)}")
+                logger.warning("Could not get details for job %s: %s", job_id, e)
             
             jobs.append(job_info)
         
         # Determine overall render queue status
+        complete_count = sum(1 for job in jobs if job["status"] == "Complete")
         if is_rendering:
             queue_status = "rendering"
-        elif any(job["status"] == "Complete" for job in jobs):
-            if all(job["status"] == "Complete" for job in jobs):
-                queue_status = "complete"
-            else:
-                queue_status = "partial_complete"
+        elif complete_count == len(jobs):
+            queue_status = "complete"
+        elif complete_count:
+            queue_status = "partial_complete"
         else:
             queue_status = "ready"
         
@@ -416,7 +436,7 @@ def get_render_queue_status(resolve) -> Dict[str, Any]:
         }
             
     except Exception as e:
-        logger.error(f"Exception while getting render queue status: {str(e)}")
+        logger.error("Exception while getting render queue status: %s", e)
         return {"error": f"Failed to get render queue status: {str(e)}"}
 
 def clear_render_queue(resolve) -> Dict[str, Any]:
@@ -430,22 +450,22 @@ def clear_render_queue(resolve) -> Dict[str, Any]:
     """
     if not resolve:
         logger.error("No connection to DaVinci Resolve")
-        return {"error": "No connection to DaVinci Resolve"}
+        return dict(NO_RESOLVE_ERROR)
     
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         logger.error("Failed to get Project Manager")
-        return {"error": "Failed to get Project Manager"}
+        return dict(NO_PROJECT_MANAGER_ERROR)
     
     current_project = project_manager.GetCurrentProject()
     if not current_project:
         logger.error("No project is currently open")
-        return {"error": "No project is currently open"}
+        return dict(NO_PROJECT_ERROR)
     
     # Switch to the Deliver page
     page = resolve.GetCurrentPage()
     if page != "deliver":
-        logger.info(f"Switching from {page} page to deliver page")
+        logger.info("Switching from %s page to deliver page", page)
         resolve.OpenPage("deliver")
     
     try:
@@ -454,11 +474,7 @@ def clear_render_queue(resolve) -> Dict[str, Any]:
         initial_count = len(queue_items) if queue_items else 0
         
         if initial_count == 0:
-            return {
-                "success": True,
-                "message": "Render queue is already empty",
-                "jobs_removed": 0
-            }
+            return dict(RENDER_QUEUE_ALREADY_EMPTY)
         
         # Check if any jobs are currently rendering
         is_rendering = False
@@ -477,10 +493,9 @@ def clear_render_queue(resolve) -> Dict[str, Any]:
             try:
                 current_project.StopRendering()
                 # Small delay to allow DaVinci Resolve to update job statuses
-                import time
                 time.sleep(0.5)  
             except Exception as e:
-                logger.warning(f"Issue stopping rendering: {str(e)}")
+                logger.warning("Issue stopping rendering: %s", e)
         
         # Clear the render queue
         result = current_project.DeleteAllRenderJobs()
@@ -496,7 +511,7 @@ def clear_render_queue(resolve) -> Dict[str, Any]:
             return {"error": "Failed to clear render queue", "jobs_count": initial_count}
             
     except Exception as e:
-        logger.error(f"Exception while clearing render queue: {str(e)}")
+        logger.error("Exception while clearing render queue: %s", e)
         return {"error": f"Failed to clear render queue: {str(e)}"}
 
 def ensure_render_settings(resolve, current_project) -> Tuple[bool, Optional[Any], str]:
@@ -518,7 +533,7 @@ def ensure_render_settings(resolve, current_project) -> Tuple[bool, Optional[Any
         else:
             logger.warning("GetRenderSettings() returned None")
     except Exception as e:
-        logger.error(f"Error getting render settings interface: {str(e)}")
+        logger.error("Error getting render settings interface: %s", e)
         render_settings_interface = None
     
     # Alternative approach if render settings is None
@@ -541,12 +556,11 @@ def ensure_render_settings(resolve, current_project) -> Tuple[bool, Optional[Any
             logger.info("Successfully got render settings interface after page refresh")
             return True, render_settings_interface, "Render settings interface obtained after page refresh"
     except Exception as e:
-        logger.error(f"Error in page refresh approach: {str(e)}")
+        logger.error("Error in page refresh approach: %s", e)
     
     # Try one more approach - sometimes a delay helps
     try:
         logger.info("Trying with a small delay")
-        import time
         time.sleep(1.0)  # Short delay
         
         render_settings_interface = current_project.GetRenderSettings()
@@ -554,7 +568,7 @@ def ensure_render_settings(resolve, current_project) -> Tuple[bool, Optional[Any
             logger.info("Successfully got render settings interface after delay")
             return True, render_settings_interface, "Render settings interface obtained after delay"
     except Exception as e:
-        logger.error(f"Error in delay approach: {str(e)}")
+        logger.error("Error in delay approach: %s", e)
     
     # If still no render settings, we've failed
     logger.error("Could not get render settings interface after multiple attempts")
@@ -576,17 +590,17 @@ def validate_render_preset(render_settings_interface, preset_name: str) -> Tuple
         system_presets = render_settings_interface.GetSystemPresetList() or []
         
         all_presets = project_presets + system_presets
-        logger.info(f"Found {len(project_presets)} project presets and {len(system_presets)} system presets")
+        logger.info("Found %s project presets and %s system presets", len(project_presets), len(system_presets))
         
         if preset_name in project_presets:
-            logger.info(f"Found '{preset_name}' in project presets")
+            logger.info("Found '%s' in project presets", preset_name)
             return True, all_presets, f"Valid project preset: {preset_name}"
         elif preset_name in system_presets:
-            logger.info(f"Found '{preset_name}' in system presets")
+            logger.info("Found '%s' in system presets", preset_name)
             return True, all_presets, f"Valid system preset: {preset_name}"
         else:
-            logger.error(f"Render preset '{preset_name}' not found")
+            logger.error("Render preset '%s' not found", preset_name)
             return False, all_presets, f"Preset '{preset_name}' not found. Available presets: {', '.join(all_presets)}"
     except Exception as e:
-        logger.error(f"Error while checking presets: {str(e)}")
+        logger.error("Error while checking presets: %s", e)
         return False, [], f"Error checking render presets: {str(e)}" 
\ No newline at end of file
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+DaVinci Resolve MCP API Helpers
+"""
+
+import functools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("davinci-resolve-mcp.api")
+
+# Wording for on/off settings in responses
+ENABLED_STATE = {True: "enabled", False: "disabled"}
+
+def is_success(result: Any) -> bool:
+    """Check a Resolve API return value for success.
+    
+    Resolve setters return plain True/False (or None), so those are answered by
+    identity; anything else falls back to truthiness.
+    """
+    if result is True:
+        return True
+    if result is None or result is False:
+        return False
+    return bool(result)
+
+def resolve_call(action: str, as_dict: bool = True) -> Callable:
+    """Decorator that turns exceptions raised by a Resolve call into an error result.
+    
+    Args:
+        action: What the function does, used in the error message (e.g. "getting track items")
+        as_dict: Return {"error": message} if True, otherwise an "Error ..." string
+    
+    Returns:
+        Decorator wrapping the function
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                message = f"Error {action}: {str(e)}"
+                logger.error("%s: %s", func.__name__, message)
+                return {"error": message} if as_dict else message
+        return wrapper
+    return decorator
+
+@dataclass
+class OpResult:
+    """Outcome of a single operation, converted to a dict only when returned to the client."""
+    success: bool
+    message: str = ""
+    error: Optional[str] = None
+    extras: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result, leaving out empty fields."""
+        result = {"success": self.success}
+        if self.message:
+            result["message"] = self.message
+        if self.error is not None:
+            result["error"] = self.error
+        result.update(self.extras)
+        return result
@@ -7,6 +7,8 @@ import logging
 import os
 from typing import List, Dict, Any
 
+from .timeline_item_operations import forget_active_timeline, get_active_timeline, get_track_items, invalidate_item_cache
+
 logger = logging.getLogger("davinci-resolve-mcp.media")
 
 def list_media_pool_clips(resolve) -> List[Dict[str, Any]]:
@@ -212,6 +214,21 @@ def get_bin_contents(resolve, bin_name: str) -> List[Dict[str, Any]]:
     clips = target_folder.GetClipList()
     return format_clip_list(clips, bin_name)
 
+def index_clips_by_name(clips) -> Dict[str, Any]:
+    """Map clip names to clips in one pass, keeping the first clip for duplicate names.
+    
+    Args:
+        clips: Media pool clips to index (None entries are skipped)
+    
+    Returns:
+        Dictionary mapping clip name to clip
+    """
+    clips_by_name = {}
+    for clip in clips:
+        if clip:
+            clips_by_name.setdefault(clip.GetName(), clip)
+    return clips_by_name
+
 def format_clip_list(clips, bin_name: str) -> List[Dict[str, Any]]:
     """Helper function to format clip info from a clip list."""
     if not clips:
@@ -234,53 +251,21 @@ def format_clip_list(clips, bin_name: str) -> List[Dict[str, Any]]:
 
 def list_timeline_clips(resolve) -> List[Dict[str, Any]]:
     """List all clips in the current timeline."""
-    if resolve is None:
-        return [{"error": "Not connected to DaVinci Resolve"}]
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return [{"error": "Failed to get Project Manager"}]
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return [{"error": "No project currently open"}]
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return [{"error": "No timeline currently active"}]
-    
-    # Get all video tracks
-    video_tracks = current_timeline.GetTrackCount("video")
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return [{"error": error}]
     
+    # Note: Track indices in Resolve API are 1-based
     clip_info = []
-    for track_index in range(1, video_tracks + 1):
-        # Note: Track indices in Resolve API are 1-based
-        clips = current_timeline.GetItemListInTrack("video", track_index)
-        
-        for clip in clips:
-            if clip:
-                clip_info.append({
-                    "name": clip.GetName(),
-                    "track": f"V{track_index}",
-                    "start_frame": clip.GetStart(),
-                    "end_frame": clip.GetEnd(),
-                    "duration": clip.GetDuration()
-                })
-    
-    # Get audio tracks as well
-    audio_tracks = current_timeline.GetTrackCount("audio")
-    for track_index in range(1, audio_tracks + 1):
-        clips = current_timeline.GetItemListInTrack("audio", track_index)
-        
-        for clip in clips:
-            if clip:
-                clip_info.append({
-                    "name": clip.GetName(),
-                    "track": f"A{track_index}",
-                    "start_frame": clip.GetStart(),
-                    "end_frame": clip.GetEnd(),
-                    "duration": clip.GetDuration()
-                })
+    for track_type, track_prefix in (("video", "V"), ("audio", "A")):
+        for track_index in range(1, current_timeline.GetTrackCount(track_type) + 1):
+            clip_info.extend({
+                "name": clip.GetName(),
+                "track": f"{track_prefix}{track_index}",
+                "start_frame": clip.GetStart(),
+                "end_frame": clip.GetEnd(),
+                "duration": clip.GetDuration()
+            } for clip in get_track_items(current_timeline, track_type, track_index) if clip)
     
     return clip_info if clip_info else [{"info": "No clips found in the current timeline"}]
 
@@ -330,6 +315,7 @@ def add_clip_to_timeline(resolve, clip_name: str, timeline_name: str = None) ->
             if t and t.GetName() == timeline_name:
                 timeline = t
                 current_project.SetCurrentTimeline(timeline)
+                forget_active_timeline()
                 break
         
         if not timeline:
@@ -343,6 +329,7 @@ def add_clip_to_timeline(resolve, clip_name: str, timeline_name: str = None) ->
     # Add clip to timeline
     # We need to use media_pool.AppendToTimeline() which expects a list of clips
     result = media_pool.AppendToTimeline([target_clip])
+    invalidate_item_cache()
     
     if result and len(result) > 0:
         return f"Successfully added clip '{clip_name}' to timeline"
@@ -408,6 +395,7 @@ def delete_media(resolve, clip_name: str) -> str:
     # Delete the clip
     try:
         result = media_pool.DeleteClips([target_clip])
+        invalidate_item_cache()
         if result:
             return f"Successfully deleted clip '{clip_name}' from Media Pool"
         else:
@@ -556,16 +544,11 @@ def auto_sync_audio(resolve, clip_names: List[str], sync_method: str = "waveform
                 all_clips.extend(folder_clips)
     
     # Find clips by name
-    clips_to_sync = []
+    clips_by_name = index_clips_by_name(all_clips)
     for name in clip_names:
-        found = False
-        for clip in all_clips:
-            if clip and clip.GetName() == name:
-                clips_to_sync.append(clip)
-                found = True
-                break
-        if not found:
+        if name not in clips_by_name:
             return f"Error: Clip '{name}' not found in Media Pool"
+    clips_to_sync = [clips_by_name[name] for name in clip_names]
     
     # Set the clips as selected in media pool
     try:
@@ -665,18 +648,9 @@ def unlink_clips(resolve, clip_names: List[str]) -> str:
                 all_clips.extend(folder_clips)
     
     # Find clips by name
-    clips_to_unlink = []
-    not_found_clips = []
-    
-    for name in clip_names:
-        found = False
-        for clip in all_clips:
-            if clip and clip.GetName() == name:
-                clips_to_unlink.append(clip)
-                found = True
-                break
-        if not found:
-            not_found_clips.append(name)
+    clips_by_name = index_clips_by_name(all_clips)
+    clips_to_unlink = [clips_by_name[name] for name in clip_names if name in clips_by_name]
+    not_found_clips = [name for name in clip_names if name not in clips_by_name]
     
     if not_found_clips:
         return f"Error: Clips not found in Media Pool: {', '.join(not_found_clips)}"
@@ -758,18 +732,9 @@ def relink_clips(resolve, clip_names: List[str], media_paths: List[str] = None,
                 all_clips.extend(folder_clips)
     
     # Find clips by name
-    clips_to_relink = []
-    not_found_clips = []
-    
-    for name in clip_names:
-        found = False
-        for clip in all_clips:
-            if clip and clip.GetName() == name:
-                clips_to_relink.append(clip)
-                found = True
-                break
-        if not found:
-            not_found_clips.append(name)
+    clips_by_name = index_clips_by_name(all_clips)
+    clips_to_relink = [clips_by_name[name] for name in clip_names if name in clips_by_name]
+    not_found_clips = [name for name in clip_names if name not in clips_by_name]
     
     if not_found_clips:
         return f"Error: Clips not found in Media Pool: {', '.join(not_found_clips)}"
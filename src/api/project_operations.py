@@ -4,7 +4,9 @@ DaVinci Resolve Project Operations
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List
+
+from .timeline_item_operations import invalidate_resolve_cache
 
 logger = logging.getLogger("davinci-resolve-mcp.project")
 
@@ -55,6 +57,7 @@ def open_project(resolve, name: str) -> str:
         return f"Error: Project '{name}' not found. Available projects: {', '.join(projects)}"
     
     result = project_manager.LoadProject(name)
+    invalidate_resolve_cache()
     if result:
         return f"Successfully opened project '{name}'"
     else:
@@ -78,6 +81,7 @@ def create_project(resolve, name: str) -> str:
         return f"Error: Project '{name}' already exists"
     
     result = project_manager.CreateProject(name)
+    invalidate_resolve_cache()
     if result:
         return f"Successfully created project '{name}'"
     else:
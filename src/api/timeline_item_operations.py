@@ -0,0 +1,750 @@
+#!/usr/bin/env python3
+"""
+DaVinci Resolve Timeline Item Operations
+"""
+
+import logging
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
+
+from .helpers import ENABLED_STATE, OpResult, is_success, resolve_call
+
+logger = logging.getLogger("davinci-resolve-mcp.timeline_item")
+
+# Track types accepted by the Resolve timeline API
+VALID_TRACK_TYPES = frozenset({"video", "audio", "subtitle"})
+
+# A timeline track, addressed by type and 1-based index
+Track = namedtuple("Track", "type index")
+DEFAULT_TRACK = Track("video", 1)
+
+# How long a fetched track item list stays valid, in seconds
+ITEM_LIST_TTL = 0.25
+
+# (timeline_id, track_type, track_index) -> (generation, fetched_at, items)
+_item_list_cache: Dict[Tuple[str, str, int], Tuple[int, float, List[Any]]] = {}
+
+# Bumped by invalidate_item_cache(); entries from an older generation are stale
+_item_list_generation = 0
+
+def get_track_items(timeline, track_type: str, track_index: int) -> List[Any]:
+    """Get the items in a timeline track, reusing a recent fetch if available.
+    
+    Args:
+        timeline: The timeline containing the track
+        track_type: Type of the track ('video', 'audio' or 'subtitle')
+        track_index: 1-based index of the track
+    
+    Returns:
+        List of timeline items in the track (empty if the track has none)
+    """
+    key = (str(timeline.GetUniqueId()), track_type, track_index)
+    generation = _item_list_generation
+    now = time.monotonic()
+    
+    cached = _item_list_cache.get(key)
+    if cached and cached[0] == generation and now - cached[1] < ITEM_LIST_TTL:
+        return cached[2]
+    
+    # Tag the fetch with the generation it started in, so a list fetched while
+    # another thread invalidated the cache is never served afterwards
+    items = timeline.GetItemListInTrack(track_type, track_index) or []
+    _item_list_cache[key] = (generation, now, items)
+    return items
+
+def invalidate_item_cache() -> None:
+    """Mark all cached track item lists as stale. Call after anything that adds or removes timeline items."""
+    global _item_list_generation
+    _item_list_generation += 1
+    _item_list_cache.clear()
+
+# A settable timeline item property: the Resolve property name and a format
+# string describing the change
+PropertySpec = namedtuple("PropertySpec", "property_name description")
+
+# Settable property groups of the timeline item tools:
+# group -> {parameter name: PropertySpec}
+# Boolean values are sent to Resolve as 1/0 and described as enabled/disabled.
+ITEM_PROPERTY_GROUPS: Dict[str, Dict[str, PropertySpec]] = {
+    "composite": {
+        "composite_mode": PropertySpec("CompositeMode", "composite mode to '{}'"),
+        "opacity": PropertySpec("Opacity", "opacity to {}"),
+    },
+    "retime": {
+        "speed": PropertySpec("Speed", "speed to {}x"),
+        "process": PropertySpec("RetimeProcess", "retime process to '{}'"),
+    },
+    "stabilization": {
+        "enabled": PropertySpec("StabilizationEnable", "stabilization {}"),
+        "method": PropertySpec("StabilizationMethod", "stabilization method to '{}'"),
+        "strength": PropertySpec("StabilizationStrength", "stabilization strength to {}"),
+    },
+    "audio": {
+        "volume": PropertySpec("Volume", "volume to {}"),
+        "pan": PropertySpec("Pan", "pan to {}"),
+        "eq_enabled": PropertySpec("EQEnable", "EQ {}"),
+    },
+}
+
+# Accepted values of the enumerated timeline item properties
+COMPOSITE_MODES = (
+    'Normal', 'Add', 'Subtract', 'Difference', 'Multiply', 'Screen',
+    'Overlay', 'Hardlight', 'Softlight', 'Darken', 'Lighten', 'ColorDodge',
+    'ColorBurn', 'Exclusion', 'Hue', 'Saturation', 'Color', 'Luminosity'
+)
+RETIME_PROCESSES = ('NearestFrame', 'FrameBlend', 'OpticalFlow')
+STABILIZATION_METHODS = ('Perspective', 'Similarity', 'Translation')
+
+# Transform properties settable on video timeline items
+TRANSFORM_PROPERTIES = [
+    'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'Rotation',
+    'AnchorPointX', 'AnchorPointY', 'Pitch', 'Yaw'
+]
+
+# Crop sides settable on video timeline items
+CROP_TYPES = ['Left', 'Right', 'Top', 'Bottom']
+
+# Numeric properties of video items that are set directly, outside the property groups
+PLAIN_VIDEO_PROPERTIES = frozenset(TRANSFORM_PROPERTIES + [f"Crop{side}" for side in CROP_TYPES])
+
+# Property groups settable on video and audio items
+ITEM_TYPE_GROUPS = {
+    "video": ("composite", "retime", "stabilization"),
+    "audio": ("audio",),
+}
+
+# Keyframeable timeline item properties
+KEYFRAME_VIDEO_PROPERTIES = [
+    'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'Rotation', 'AnchorPointX', 'AnchorPointY',
+    'Pitch', 'Yaw', 'Opacity', 'CropLeft', 'CropRight', 'CropTop', 'CropBottom'
+]
+KEYFRAME_AUDIO_PROPERTIES = ['Volume', 'Pan']
+KEYFRAME_PROPERTIES = KEYFRAME_VIDEO_PROPERTIES + KEYFRAME_AUDIO_PROPERTIES
+
+# Per-request memo of Resolve lookups; None outside of a resolve_scope()
+_scope_cache: ContextVar[Optional[Dict[str, Any]]] = ContextVar("resolve_scope_cache", default=None)
+
+# How long the current timeline/item stay remembered across requests, in seconds
+HANDLE_TTL = 0.1
+
+# "timeline" / "current_item" -> (fetched_at, handle)
+_handle_cache: Dict[str, Tuple[float, Any]] = {}
+
+def _recall_handle(scope: Optional[Dict[str, Any]], key: str) -> Optional[Any]:
+    """Look up a remembered Resolve handle in the current scope, then in the short-lived cache."""
+    if scope is not None and key in scope:
+        return scope[key]
+    
+    cached = _handle_cache.get(key)
+    if cached and time.monotonic() - cached[0] < HANDLE_TTL:
+        if scope is not None:
+            scope[key] = cached[1]
+        return cached[1]
+    return None
+
+def _remember_handle(scope: Optional[Dict[str, Any]], key: str, handle: Any) -> None:
+    """Remember a Resolve handle for the current scope and the next few requests."""
+    _handle_cache[key] = (time.monotonic(), handle)
+    if scope is not None:
+        scope[key] = handle
+
+@contextmanager
+def resolve_scope():
+    """Share Resolve lookups (such as the current timeline) across the calls made inside the block.
+    
+    Lookups are made lazily on first use and forgotten when the block exits, so
+    chained operations inside one request don't re-query Resolve for the same
+    objects.
+    """
+    token = _scope_cache.set({})
+    try:
+        yield
+    finally:
+        _scope_cache.reset(token)
+
+def forget_active_timeline() -> None:
+    """Drop the remembered timeline (and its current item).
+    
+    Call after switching timelines.
+    """
+    _handle_cache.pop("timeline", None)
+    _handle_cache.pop("current_item", None)
+    scope = _scope_cache.get()
+    if scope is not None:
+        scope.pop("timeline", None)
+        scope.pop("current_item", None)
+
+def forget_current_item() -> None:
+    """Drop the remembered current video item. Call after selecting a clip."""
+    _handle_cache.pop("current_item", None)
+    scope = _scope_cache.get()
+    if scope is not None:
+        scope.pop("current_item", None)
+
+def invalidate_resolve_cache() -> None:
+    """Drop every remembered Resolve handle. Call after opening, creating or closing a project."""
+    _handle_cache.clear()
+    forget_active_timeline()
+
+def get_active_timeline(resolve) -> Tuple[Optional[Any], Optional[str]]:
+    """Get the current timeline of the current project.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+    
+    Returns:
+        Tuple containing (timeline, error_message); error_message is None on success
+    """
+    scope = _scope_cache.get()
+    current_timeline = _recall_handle(scope, "timeline")
+    if current_timeline is not None:
+        return current_timeline, None
+    
+    if resolve is None:
+        return None, "Not connected to DaVinci Resolve"
+    
+    project_manager = resolve.GetProjectManager()
+    if not project_manager:
+        return None, "Failed to get Project Manager"
+    
+    current_project = project_manager.GetCurrentProject()
+    if not current_project:
+        return None, "No project currently open"
+    
+    current_timeline = current_project.GetCurrentTimeline()
+    if not current_timeline:
+        return None, "No timeline currently active"
+    
+    _remember_handle(scope, "timeline", current_timeline)
+    return current_timeline, None
+
+def find_timeline_item(timeline, timeline_item_id: str,
+                       track_types: Tuple[str, ...] = ("video", "audio")) -> Tuple[Optional[Any], Optional[str]]:
+    """Find a timeline item by its unique ID.
+    
+    Args:
+        timeline: The timeline to search
+        timeline_item_id: The ID of the timeline item to find
+        track_types: Track types to search, in search order
+    
+    Returns:
+        Tuple containing (timeline_item, track_type), or (None, None) if no item matches
+    """
+    for track_type in track_types:
+        track_count = timeline.GetTrackCount(track_type)
+        
+        for track_index in range(1, track_count + 1):
+            for item in get_track_items(timeline, track_type, track_index):
+                if str(item.GetUniqueId()) == timeline_item_id:
+                    return item, track_type
+    
+    return None, None
+
+def get_current_timeline_item(resolve) -> Tuple[Optional[Any], Optional[str]]:
+    """Get the current video item of the current timeline.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+    
+    Returns:
+        Tuple containing (timeline_item, error_message); error_message is None on success
+    """
+    scope = _scope_cache.get()
+    current_item = _recall_handle(scope, "current_item")
+    if current_item is not None:
+        return current_item, None
+    
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return None, error
+    
+    current_item = current_timeline.GetCurrentVideoItem()
+    if not current_item:
+        return None, "No clip is currently selected in the timeline"
+    
+    _remember_handle(scope, "current_item", current_item)
+    return current_item, None
+
+def get_timeline_item_at(resolve, track: Track, item_index: int) -> Tuple[Optional[Any], Optional[str]]:
+    """Get a timeline item by its position in a track.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        track: The track containing the item
+        item_index: 1-based index of the item in the track
+    
+    Returns:
+        Tuple containing (timeline_item, error_message); error_message is None on success
+    """
+    if track.type not in VALID_TRACK_TYPES:
+        return None, f"Invalid track type '{track.type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}"
+    
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return None, error
+    
+    items = get_track_items(current_timeline, *track)
+    if not items or item_index < 1 or item_index > len(items):
+        return None, f"Invalid item index {item_index}. {track.type.capitalize()} track {track.index} has {len(items)} items"
+    
+    return items[item_index - 1], None
+
+def get_timeline_item(resolve, track: Track = DEFAULT_TRACK,
+                      item_index: Optional[int] = None) -> Tuple[Optional[Any], Optional[str]]:
+    """Get a timeline item by its position, or the current video item if item_index is None.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        track: The track containing the item
+        item_index: 1-based index of the item in the track (uses the current video item if None)
+    
+    Returns:
+        Tuple containing (timeline_item, error_message); error_message is None on success
+    """
+    if item_index is None:
+        return get_current_timeline_item(resolve)
+    return get_timeline_item_at(resolve, track, item_index)
+
+def _is_number(value: Any) -> bool:
+    """Check for an int or float value (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _in_range(value: Any, low: float, high: float) -> bool:
+    """Check for a number between low and high, inclusive."""
+    return _is_number(value) and low <= value <= high
+
+def _validate_composite(values: Dict[str, Any]) -> Optional[str]:
+    """Check the composite group values; returns an error message or None."""
+    composite_mode = values.get("composite_mode")
+    if composite_mode and composite_mode not in COMPOSITE_MODES:
+        return f"Invalid composite mode. Must be one of: {', '.join(COMPOSITE_MODES)}"
+    
+    opacity = values.get("opacity")
+    if opacity is not None and not _in_range(opacity, 0.0, 1.0):
+        return "Opacity must be between 0.0 and 1.0"
+    return None
+
+def _validate_retime(values: Dict[str, Any]) -> Optional[str]:
+    """Check the retime group values; returns an error message or None."""
+    speed = values.get("speed")
+    if speed is not None and not (_is_number(speed) and speed > 0):
+        return "Speed must be greater than 0"
+    
+    process = values.get("process")
+    if process and process not in RETIME_PROCESSES:
+        return f"Invalid retime process. Must be one of: {', '.join(RETIME_PROCESSES)}"
+    return None
+
+def _validate_stabilization(values: Dict[str, Any]) -> Optional[str]:
+    """Check the stabilization group values; returns an error message or None."""
+    enabled = values.get("enabled")
+    if enabled is not None and not isinstance(enabled, bool):
+        return "Enabled must be true or false"
+    
+    method = values.get("method")
+    if method and method not in STABILIZATION_METHODS:
+        return f"Invalid stabilization method. Must be one of: {', '.join(STABILIZATION_METHODS)}"
+    
+    strength = values.get("strength")
+    if strength is not None and not _in_range(strength, 0.0, 1.0):
+        return "Strength must be between 0.0 and 1.0"
+    return None
+
+def _validate_audio(values: Dict[str, Any]) -> Optional[str]:
+    """Check the audio group values; returns an error message or None."""
+    volume = values.get("volume")
+    if volume is not None and not (_is_number(volume) and volume >= 0.0):
+        return "Volume must be greater than or equal to 0.0"
+    
+    pan = values.get("pan")
+    if pan is not None and not _in_range(pan, -1.0, 1.0):
+        return "Pan must be between -1.0 and 1.0"
+    
+    eq_enabled = values.get("eq_enabled")
+    if eq_enabled is not None and not isinstance(eq_enabled, bool):
+        return "EQ enabled must be true or false"
+    return None
+
+# group -> value checks shared by the set_timeline_item_* tools and the bulk tool
+_GROUP_VALIDATORS = {
+    "composite": _validate_composite,
+    "retime": _validate_retime,
+    "stabilization": _validate_stabilization,
+    "audio": _validate_audio,
+}
+
+def validate_property_group(group: str, values: Dict[str, Any]) -> Optional[str]:
+    """Check values for one ITEM_PROPERTY_GROUPS group before anything is sent to Resolve.
+    
+    Args:
+        group: Name of the property group (e.g. 'composite', 'audio')
+        values: Parameter values keyed by parameter name; None or empty values are skipped
+    
+    Returns:
+        An error message, or None if the values can be applied
+    """
+    if group not in ITEM_PROPERTY_GROUPS:
+        return f"Invalid property group '{group}'. Must be one of: {', '.join(ITEM_PROPERTY_GROUPS)}"
+    
+    params = list(ITEM_PROPERTY_GROUPS[group])
+    unknown = [param for param in values if param not in ITEM_PROPERTY_GROUPS[group]]
+    if unknown:
+        return f"Unknown {group} parameters: {', '.join(unknown)}. Must be among: {', '.join(params)}"
+    
+    if all(values.get(param) is None or values.get(param) == "" for param in params):
+        return f"Must specify at least one of {', '.join(params[:-1])} or {params[-1]}"
+    
+    return _GROUP_VALIDATORS[group](values)
+
+def validate_item_property(track_type: str, property_name: str, value: Any) -> Optional[str]:
+    """Check a single SetProperty call against the rules of the tool that sets that property.
+    
+    Args:
+        track_type: Type of the track holding the item ('video' or 'audio')
+        property_name: Resolve property name (e.g. 'ZoomX', 'Opacity', 'Volume')
+        value: Value to set
+    
+    Returns:
+        An error message, or None if the value can be applied
+    """
+    if value is None or value == "":
+        return f"No value given for {property_name}"
+    
+    is_audio = track_type == "audio"
+    if not is_audio and property_name in PLAIN_VIDEO_PROPERTIES:
+        return None if _is_number(value) else f"{property_name} must be a number"
+    
+    for group in ITEM_TYPE_GROUPS["audio" if is_audio else "video"]:
+        for param, spec in ITEM_PROPERTY_GROUPS[group].items():
+            if spec.property_name == property_name:
+                return _GROUP_VALIDATORS[group]({param: value})
+    
+    return f"Property '{property_name}' cannot be set on {track_type} items"
+
+def validate_keyframe(timeline_item, track_type: str, property_name: str, frame: int) -> Optional[str]:
+    """Check that a property of a timeline item can be keyframed at a frame.
+    
+    Args:
+        timeline_item: The timeline item to keyframe
+        track_type: Type of the track holding the item ('video' or 'audio')
+        property_name: The name of the property to keyframe
+        frame: Frame position of the keyframe
+    
+    Returns:
+        An error message, or None if the keyframe can be added or deleted
+    """
+    if property_name not in KEYFRAME_PROPERTIES:
+        return f"Invalid property name. Must be one of: {', '.join(KEYFRAME_PROPERTIES)}"
+    
+    is_audio = track_type == "audio"
+    if is_audio and property_name not in KEYFRAME_AUDIO_PROPERTIES:
+        return f"Property '{property_name}' is not available for audio items"
+    
+    if not is_audio and property_name not in KEYFRAME_VIDEO_PROPERTIES and timeline_item.GetType() != "Video":
+        return f"Property '{property_name}' is not available for this item type"
+    
+    # The frame must be within the item's range
+    start_frame = timeline_item.GetStart()
+    end_frame = timeline_item.GetEnd()
+    if frame < start_frame or frame > end_frame:
+        return f"Frame {frame} is outside the item's range ({start_frame} to {end_frame})"
+    
+    return None
+
+def set_item_property_group(timeline_item, group: str, values: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """Set the given properties of one ITEM_PROPERTY_GROUPS group on a timeline item.
+    
+    Args:
+        timeline_item: The timeline item to modify
+        group: Name of the property group (e.g. 'composite', 'audio')
+        values: Parameter values keyed by parameter name; None or empty values are skipped
+    
+    Returns:
+        Tuple containing (all_succeeded, descriptions of the changes made)
+    """
+    success = True
+    changes = []
+    
+    for param, spec in ITEM_PROPERTY_GROUPS[group].items():
+        value = values.get(param)
+        if value is None or value == "":
+            continue
+        
+        if isinstance(value, bool):
+            result = timeline_item.SetProperty(spec.property_name, 1 if value else 0)
+            changes.append(spec.description.format(ENABLED_STATE[value]))
+        else:
+            result = timeline_item.SetProperty(spec.property_name, value)
+            changes.append(spec.description.format(value))
+        
+        if not is_success(result):
+            success = False
+    
+    return success, changes
+
+def get_item_properties(timeline_item, timeline_item_id: Optional[str] = None) -> Dict[str, Any]:
+    """Collect the basic, video and audio properties of a timeline item.
+    
+    Args:
+        timeline_item: The timeline item to read
+        timeline_item_id: The item's ID, if already known (saves a lookup)
+    
+    Returns:
+        Dictionary with the item's properties
+    """
+    # Get basic properties
+    properties = {
+        "id": timeline_item_id if timeline_item_id is not None else str(timeline_item.GetUniqueId()),
+        "name": timeline_item.GetName(),
+        "type": timeline_item.GetType(),
+        "start_frame": timeline_item.GetStart(),
+        "end_frame": timeline_item.GetEnd(),
+        "duration": timeline_item.GetDuration()
+    }
+    
+    # Get additional properties if it's a video item
+    if timeline_item.GetType() == "Video":
+        # Transform properties
+        properties["transform"] = {
+            "position": {
+                "x": timeline_item.GetProperty("Pan"),
+                "y": timeline_item.GetProperty("Tilt")
+            },
+            "zoom": timeline_item.GetProperty("ZoomX"),  # ZoomX/ZoomY can be different for non-uniform scaling
+            "zoom_x": timeline_item.GetProperty("ZoomX"),
+            "zoom_y": timeline_item.GetProperty("ZoomY"),
+            "rotation": timeline_item.GetProperty("Rotation"),
+            "anchor_point": {
+                "x": timeline_item.GetProperty("AnchorPointX"),
+                "y": timeline_item.GetProperty("AnchorPointY")
+            },
+            "pitch": timeline_item.GetProperty("Pitch"),
+            "yaw": timeline_item.GetProperty("Yaw")
+        }
+        
+        # Crop properties
+        properties["crop"] = {
+            "left": timeline_item.GetProperty("CropLeft"),
+            "right": timeline_item.GetProperty("CropRight"),
+            "top": timeline_item.GetProperty("CropTop"),
+            "bottom": timeline_item.GetProperty("CropBottom")
+        }
+        
+        # Composite properties
+        properties["composite"] = {
+            "mode": timeline_item.GetProperty("CompositeMode"),
+            "opacity": timeline_item.GetProperty("Opacity")
+        }
+        
+        # Dynamic zoom properties
+        properties["dynamic_zoom"] = {
+            "enabled": timeline_item.GetProperty("DynamicZoomEnable"),
+            "mode": timeline_item.GetProperty("DynamicZoomMode")
+        }
+        
+        # Retime properties
+        properties["retime"] = {
+            "speed": timeline_item.GetProperty("Speed"),
+            "process": timeline_item.GetProperty("RetimeProcess")
+        }
+        
+        # Stabilization properties
+        properties["stabilization"] = {
+            "enabled": timeline_item.GetProperty("StabilizationEnable"),
+            "method": timeline_item.GetProperty("StabilizationMethod"),
+            "strength": timeline_item.GetProperty("StabilizationStrength")
+        }
+    
+    # Audio-specific properties
+    if timeline_item.GetType() == "Audio" or timeline_item.GetMediaType() == "Audio":
+        properties["audio"] = {
+            "volume": timeline_item.GetProperty("Volume"),
+            "pan": timeline_item.GetProperty("Pan"),
+            "eq_enabled": timeline_item.GetProperty("EQEnable"),
+            "normalize_enabled": timeline_item.GetProperty("NormalizeEnable"),
+            "normalize_level": timeline_item.GetProperty("NormalizeLevel")
+        }
+    
+    return properties
+
+def select_track_items(items: List[Any], item_indices) -> Tuple[List[int], Tuple[Any, ...]]:
+    """Pick the items at several 1-based positions of a track item list in one step.
+    
+    Args:
+        items: Items of a track, as returned by get_track_items
+        item_indices: 1-based positions to pick; out-of-range positions are dropped
+    
+    Returns:
+        Tuple containing (valid_indices, items at those indices)
+    """
+    item_count = len(items)
+    valid_indices = [i for i in item_indices if 0 < i <= item_count]
+    if not valid_indices:
+        return [], ()
+    if len(valid_indices) == 1:
+        return valid_indices, (items[valid_indices[0] - 1],)
+    return valid_indices, itemgetter(*[i - 1 for i in valid_indices])(items)
+
+@resolve_call("getting track item properties")
+def get_track_item_properties(resolve, item_indices: List[int], track_type: str = "video",
+                              track_index: int = 1) -> Dict[str, Any]:
+    """Get properties of several items in one track, fetching the track's item list once.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        item_indices: 1-based indices of the items in the track
+        track_type: Type of the track ('video', 'audio' or 'subtitle')
+        track_index: 1-based index of the track
+    
+    Returns:
+        Dictionary mapping each item index to its properties (or an error entry)
+    """
+    if track_type not in VALID_TRACK_TYPES:
+        return {"error": f"Invalid track type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}"}
+    
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
+    
+    items = get_track_items(current_timeline, track_type, track_index)
+    
+    # The returned item list is used as-is (no copy); the result dict is sized up front
+    results = dict.fromkeys(item_indices)
+    valid_indices, selected_items = select_track_items(items, results)
+    
+    for item_index, item in zip(valid_indices, selected_items):
+        results[item_index] = get_item_properties(item)
+    for item_index, value in results.items():
+        if value is None:
+            results[item_index] = {"error": f"Invalid item index {item_index}. Track has {len(items)} items"}
+    
+    return results
+
+@resolve_call("setting track item properties")
+def set_track_item_property_group(resolve, group: str, values: Dict[str, Any], item_indices: List[int],
+                                  track_type: str = "video", track_index: int = 1) -> Dict[str, Any]:
+    """Set the same ITEM_PROPERTY_GROUPS values on several items of one track.
+    
+    The track's item list is fetched once and the items are picked from it by
+    position, so each item costs only its SetProperty calls.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        group: Name of the property group (e.g. 'composite', 'stabilization')
+        values: Parameter values keyed by parameter name
+        item_indices: 1-based indices of the items in the track
+        track_type: Type of the track ('video', 'audio' or 'subtitle')
+        track_index: 1-based index of the track
+    
+    Returns:
+        Dictionary with the number of items updated and the failed items
+    """
+    error = validate_property_group(group, values)
+    if error:
+        return {"error": error}
+    
+    if track_type not in VALID_TRACK_TYPES:
+        return {"error": f"Invalid track type '{track_type}'. Must be one of: {', '.join(sorted(VALID_TRACK_TYPES))}"}
+    
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
+    
+    items = get_track_items(current_timeline, track_type, track_index)
+    valid_indices, selected_items = select_track_items(items, item_indices)
+    
+    selected = set(valid_indices)
+    failures = [OpResult(False, error=f"Invalid item index {item_index}. Track has {len(items)} items",
+                         extras={"item_index": item_index}).to_dict()
+                for item_index in item_indices if item_index not in selected]
+    success_count = 0
+    
+    for item_index, item in zip(valid_indices, selected_items):
+        success, changes = set_item_property_group(item, group, values)
+        if success:
+            success_count += 1
+        else:
+            failures.append(OpResult(False, error=f"Failed to set some {group} properties",
+                                     extras={"item_index": item_index, "changes": changes}).to_dict())
+    
+    return {
+        "success": not failures,
+        "success_count": success_count,
+        "failures": failures
+    }
+
+@resolve_call("running timeline item operations")
+def batch_timeline_item_ops(resolve, timeline_item_id: str, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run several property/keyframe operations against one timeline item.
+    
+    The item is looked up once and every operation is applied to it in order.
+    Each operation is a dict with an "op" key and its arguments:
+        {"op": "set", "property": "Pan", "value": 10.0}
+        {"op": "add_keyframe", "property": "ZoomX", "frame": 100, "value": 1.2}
+        {"op": "delete_keyframe", "property": "ZoomX", "frame": 100}
+    Operations are checked like the matching single-item tools; an operation
+    that fails its checks is reported and not sent to Resolve.
+    
+    Args:
+        resolve: The DaVinci Resolve instance
+        timeline_item_id: The ID of the timeline item to modify
+        ops: List of operation dicts to apply
+    
+    Returns:
+        Dictionary with one result entry per operation, or an error
+    """
+    if not ops:
+        return {"error": "No operations specified"}
+    
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
+    
+    timeline_item, track_type = find_timeline_item(current_timeline, timeline_item_id)
+    if not timeline_item:
+        return {"error": f"Timeline item with ID '{timeline_item_id}' not found"}
+    
+    def set_property(op):
+        # Booleans are sent as 1/0, like the property group tools do
+        value = op["value"]
+        return timeline_item.SetProperty(op["property"], int(value) if isinstance(value, bool) else value)
+    
+    # op -> (check, apply)
+    dispatch = {
+        "set": (lambda op: validate_item_property(track_type, op["property"], op["value"]), set_property),
+        "add_keyframe": (lambda op: validate_keyframe(timeline_item, track_type, op["property"], op["frame"]),
+                         lambda op: timeline_item.AddKeyframe(op["property"], op["frame"], op["value"])),
+        "delete_keyframe": (lambda op: validate_keyframe(timeline_item, track_type, op["property"], op["frame"]),
+                            lambda op: timeline_item.DeleteKeyframe(op["property"], op["frame"])),
+    }
+    
+    results = []
+    for op in ops:
+        op_name = op.get("op")
+        if op_name not in dispatch:
+            results.append(OpResult(False, error=f"Unknown operation. Must be one of: {', '.join(dispatch)}",
+                                    extras={"op": op_name}))
+            continue
+        
+        check, apply = dispatch[op_name]
+        try:
+            error = check(op)
+            if error:
+                results.append(OpResult(False, error=error, extras={"op": op_name}))
+            else:
+                results.append(OpResult(is_success(apply(op)), extras={"op": op_name}))
+        except KeyError as e:
+            results.append(OpResult(False, error=f"Missing argument {e}", extras={"op": op_name}))
+        except Exception as e:
+            logger.error("Error running '%s' on timeline item %s: %s", op_name, timeline_item_id, e)
+            results.append(OpResult(False, error=str(e), extras={"op": op_name}))
+    
+    return {
+        "success": all(r.success for r in results),
+        "timeline_item": timeline_item.GetName(),
+        "results": [r.to_dict() for r in results]
+    }
@@ -3,11 +3,17 @@
 DaVinci Resolve Timeline Operations
 """
 
+import re
 import logging
 from typing import List, Dict, Any, Optional
 
+from .timeline_item_operations import forget_active_timeline, get_active_timeline, invalidate_item_cache
+
 logger = logging.getLogger("davinci-resolve-mcp.timeline")
 
+# HH:MM:SS:FF, with ';' accepted as the drop-frame separator
+TIMECODE_PATTERN = re.compile(r"^\d{2}:\d{2}:\d{2}[:;]\d{2}$")
+
 def list_timelines(resolve) -> List[str]:
     """List all timelines in the current project."""
     if resolve is None:
@@ -22,31 +28,17 @@ def list_timelines(resolve) -> List[str]:
         return ["Error: No project currently open"]
     
     timeline_count = current_project.GetTimelineCount()
-    timelines = []
-    
-    for i in range(1, timeline_count + 1):
-        timeline = current_project.GetTimelineByIndex(i)
-        if timeline:
-            timelines.append(timeline.GetName())
+    timelines = [timeline.GetName()
+                 for timeline in map(current_project.GetTimelineByIndex, range(1, timeline_count + 1))
+                 if timeline]
     
     return timelines if timelines else ["No timelines found in the current project"]
 
 def get_current_timeline_info(resolve) -> Dict[str, Any]:
     """Get information about the current timeline."""
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return {"error": "Failed to get Project Manager"}
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return {"error": "No project currently open"}
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return {"error": "No timeline currently active"}
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
     
     # Get basic timeline info
     info = {
@@ -88,6 +80,7 @@ def create_timeline(resolve, name: str) -> str:
     
     # Create the timeline
     timeline = media_pool.CreateEmptyTimeline(name)
+    forget_active_timeline()
     if timeline:
         return f"Successfully created timeline '{name}'"
     else:
@@ -121,6 +114,10 @@ def create_empty_timeline(resolve, name: str,
     if not name:
         return "Error: Timeline name cannot be empty"
     
+    # Reject malformed timecodes before making any calls into Resolve
+    if start_timecode is not None and not TIMECODE_PATTERN.match(start_timecode):
+        return f"Error: Invalid start timecode '{start_timecode}'. Expected HH:MM:SS:FF"
+    
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         return "Error: Failed to get Project Manager"
@@ -160,7 +157,7 @@ def create_empty_timeline(resolve, name: str,
     
     # Apply settings before creating timeline
     for setting_name, setting_value in settings_to_modify.items():
-        logger.info(f"Setting project setting {setting_name} to {setting_value}")
+        logger.info("Setting project setting %s to %s", setting_name, setting_value)
         current_project.SetSetting(setting_name, setting_value)
     
     # Create the timeline
@@ -174,26 +171,27 @@ def create_empty_timeline(resolve, name: str,
     
     # Set the timeline as current to modify it
     current_project.SetCurrentTimeline(timeline)
+    forget_active_timeline()
     
     # Setup timecode if specified
     if start_timecode is not None:
         try:
             success = timeline.SetStartTimecode(start_timecode)
             if not success:
-                logger.warning(f"Failed to set start timecode to {start_timecode}")
+                logger.warning("Failed to set start timecode to %s", start_timecode)
         except Exception as e:
-            logger.error(f"Error setting start timecode: {str(e)}")
+            logger.error("Error setting start timecode: %s", e)
     
     # Add video tracks if specified
     if video_tracks is not None and video_tracks > 1:  # Timeline comes with 1 video track by default
         # Resolve does not have a direct API for adding tracks
         # This would need to be implemented using UI automation or future API versions
-        logger.info(f"Custom video track count ({video_tracks}) will need to be set manually")
+        logger.info("Custom video track count (%s) will need to be set manually", video_tracks)
     
     # Add audio tracks if specified
     if audio_tracks is not None and audio_tracks > 1:  # Timeline comes with 1 audio track by default
         # Resolve does not have a direct API for adding tracks
-        logger.info(f"Custom audio track count ({audio_tracks}) will need to be set manually")
+        logger.info("Custom audio track count (%s) will need to be set manually", audio_tracks)
     
     # Restore original settings if needed
     if original_settings:
@@ -226,6 +224,7 @@ def set_current_timeline(resolve, name: str) -> str:
         if timeline and timeline.GetName() == name:
             # Found the timeline, set it as current
             current_project.SetCurrentTimeline(timeline)
+            forget_active_timeline()
             # Verify it was set
             current_timeline = current_project.GetCurrentTimeline()
             if current_timeline and current_timeline.GetName() == name:
@@ -248,20 +247,9 @@ def add_marker(resolve, frame: Optional[int] = None, color: str = "Blue", note:
     Returns:
         String indicating success or failure with detailed error message
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Get timeline information
     try:
@@ -440,6 +428,7 @@ def delete_timeline(resolve, name: str) -> str:
         if another_timeline:
             # Switch to this timeline first
             current_project.SetCurrentTimeline(another_timeline)
+            forget_active_timeline()
         else:
             return f"Error: Cannot delete the only timeline in the project. Create a new timeline first."
     
@@ -447,6 +436,7 @@ def delete_timeline(resolve, name: str) -> str:
     try:
         # The DeleteTimelines method takes a list of timelines
         result = current_project.DeleteTimelines([target_timeline])
+        invalidate_item_cache()
         
         if result:
             return f"Successfully deleted timeline '{name}'"
@@ -29,7 +29,7 @@ def check_setup():
     """Check if the environment is properly set up."""
     env_status = check_environment_variables()
     if not env_status["all_set"]:
-        logger.warning(f"Setting default environment variables. Missing: {env_status['missing']}")
+        logger.warning("Setting default environment variables. Missing: %s", env_status['missing'])
         set_default_environment_variables()
         
     return True
@@ -8,8 +8,16 @@ Version: 1.3.8 - Improved Cursor Integration, Entry Point Standardization
 
 import os
 import sys
+import json
+import asyncio
+import contextvars
+import functools
 import logging
-from typing import List, Dict, Any, Optional, Union
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Any, Union
 
 # Add src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,7 +26,7 @@ if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
 # Import platform utilities
-from src.utils.platform import setup_environment, get_platform, get_resolve_paths
+from src.utils.platform import get_platform, get_resolve_paths
 
 # Setup platform-specific paths and environment variables
 paths = get_resolve_paths()
@@ -37,7 +45,6 @@ if RESOLVE_MODULES_PATH not in sys.path:
 from mcp.server.fastmcp import FastMCP
 
 # Import our utility functions
-from src.utils.platform import setup_environment, get_platform, get_resolve_paths
 from src.utils.object_inspection import (
     inspect_object,
     get_object_methods,
@@ -45,30 +52,6 @@ from src.utils.object_inspection import (
     print_object_help,
     convert_lua_to_python
 )
-from src.utils.layout_presets import (
-    list_layout_presets,
-    save_layout_preset,
-    load_layout_preset,
-    export_layout_preset,
-    import_layout_preset,
-    delete_layout_preset
-)
-from src.utils.app_control import (
-    quit_resolve_app,
-    get_app_state,
-    restart_resolve_app,
-    open_project_settings,
-    open_preferences
-)
-from src.utils.cloud_operations import (
-    create_cloud_project,
-    import_cloud_project,
-    restore_cloud_project,
-    get_cloud_project_list,
-    export_project_to_cloud,
-    add_user_to_cloud_project,
-    remove_user_from_cloud_project
-)
 from src.utils.project_properties import (
     get_all_project_properties,
     get_project_property,
@@ -94,14 +77,98 @@ logger = logging.getLogger("davinci-resolve-mcp")
 
 # Log server version and platform
 VERSION = "1.3.8"
-logger.info(f"Starting DaVinci Resolve MCP Server v{VERSION}")
-logger.info(f"Detected platform: {get_platform()}")
-logger.info(f"Using Resolve API path: {RESOLVE_API_PATH}")
-logger.info(f"Using Resolve library path: {RESOLVE_LIB_PATH}")
+logger.info("Starting DaVinci Resolve MCP Server v%s", VERSION)
+logger.info("Detected platform: %s", get_platform())
+logger.info("Using Resolve API path: %s", RESOLVE_API_PATH)
+logger.info("Using Resolve library path: %s", RESOLVE_LIB_PATH)
+
+# Cache modes accepted by the render cache, optimized media and proxy tools -> project setting value
+CACHE_MODES = {
+    "auto": "0",
+    "on": "1",
+    "off": "2"
+}
+
+# Keyframe interpolation types and keyframe modes accepted by the keyframe tools
+KEYFRAME_INTERPOLATION_TYPES = ['Linear', 'Bezier', 'Ease-In', 'Ease-Out']
+KEYFRAME_MODES = ['All', 'Color', 'Sizing']
+
+# SuperScale quality levels
+SUPERSCALE_QUALITY_NAMES = {
+    0: "Auto",
+    1: "Better Quality",
+    2: "Smoother"
+}
+
+# LUT export formats and sizes, serialized once for the lut-formats resource
+LUT_FORMATS = {
+    "formats": [
+        {
+            "name": "Cube",
+            "extension": ".cube",
+            "description": "Industry standard LUT format supported by most applications"
+        },
+        {
+            "name": "Davinci",
+            "extension": ".ilut",
+            "description": "DaVinci Resolve's native LUT format"
+        },
+        {
+            "name": "3dl",
+            "extension": ".3dl",
+            "description": "ASSIMILATE SCRATCH and some Autodesk applications"
+        },
+        {
+            "name": "Panasonic",
+            "extension": ".vlut",
+            "description": "Panasonic VariCam and other Panasonic cameras"
+        }
+    ],
+    "sizes": [
+        {
+            "name": "17Point",
+            "description": "Smaller file size, less precision (17x17x17)"
+        },
+        {
+            "name": "33Point",
+            "description": "Standard size with good balance of precision and file size (33x33x33)"
+        },
+        {
+            "name": "65Point",
+            "description": "Highest precision but larger file size (65x65x65)"
+        }
+    ]
+}
+LUT_FORMATS_JSON = json.dumps(LUT_FORMATS, indent=2)
+
+# LUT export format and size names -> values expected by ExportCurrentGradeAsLUT
+LUT_EXPORT_FORMATS = MappingProxyType({'Cube': 0, 'Davinci': 1, '3dl': 2, 'Panasonic': 3})
+LUT_EXPORT_SIZES = MappingProxyType({'17Point': 0, '33Point': 1, '65Point': 2})
+LUT_EXTENSIONS = MappingProxyType({lut["name"]: lut["extension"] for lut in LUT_FORMATS["formats"]})
 
 # Create MCP server instance
 mcp = FastMCP("DaVinciResolveMCP")
 
+# Worker thread for tools that block on long-running Resolve jobs (LUT
+# export, transcription, sync, media generation) or make many Resolve calls
+# in one request (batch and multi-item tools). A single thread, so these
+# tools never interleave their page switches and clip selections.
+RESOLVE_WORKER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resolve-worker")
+
+# Utility function to run a blocking tool off the event loop
+def in_resolve_worker(func):
+    """Run a blocking tool on RESOLVE_WORKER so the server keeps answering other requests meanwhile.
+    
+    The tool runs in a copy of the caller's context (as with asyncio.to_thread),
+    so an enclosing resolve_scope() is still visible to it.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(RESOLVE_WORKER, functools.partial(context.run, func, *args, **kwargs))
+    return wrapper
+
 # Initialize connection to DaVinci Resolve
 try:
     # Direct import from the Modules directory
@@ -109,19 +176,19 @@ try:
     import DaVinciResolveScript as dvr_script
     resolve = dvr_script.scriptapp("Resolve")
     if resolve:
-        logger.info(f"Connected to DaVinci Resolve: {resolve.GetProductName()} {resolve.GetVersionString()}")
+        logger.info("Connected to DaVinci Resolve: %s %s", resolve.GetProductName(), resolve.GetVersionString())
     else:
         logger.error("Failed to get Resolve object. Is DaVinci Resolve running?")
 except ImportError as e:
-    logger.error(f"Failed to import DaVinciResolveScript: {str(e)}")
+    logger.error("Failed to import DaVinciResolveScript: %s", e)
     logger.error("Check that DaVinci Resolve is installed and running.")
-    logger.error(f"RESOLVE_SCRIPT_API: {RESOLVE_API_PATH}")
-    logger.error(f"RESOLVE_SCRIPT_LIB: {RESOLVE_LIB_PATH}")
-    logger.error(f"RESOLVE_MODULES_PATH: {RESOLVE_MODULES_PATH}")
-    logger.error(f"sys.path: {sys.path}")
+    logger.error("RESOLVE_SCRIPT_API: %s", RESOLVE_API_PATH)
+    logger.error("RESOLVE_SCRIPT_LIB: %s", RESOLVE_LIB_PATH)
+    logger.error("RESOLVE_MODULES_PATH: %s", RESOLVE_MODULES_PATH)
+    logger.error("sys.path: %s", sys.path)
     resolve = None
 except Exception as e:
-    logger.error(f"Unexpected error initializing Resolve: {str(e)}")
+    logger.error("Unexpected error initializing Resolve: %s", e)
     resolve = None
 
 # ------------------
@@ -304,6 +371,7 @@ def open_project(name: str) -> str:
     Args:
         name: The name of the project to open
     """
+    from api.timeline_item_operations import invalidate_resolve_cache
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -320,6 +388,7 @@ def open_project(name: str) -> str:
         return f"Error: Project '{name}' not found. Available projects: {', '.join(projects)}"
     
     result = project_manager.LoadProject(name)
+    invalidate_resolve_cache()
     if result:
         return f"Successfully opened project '{name}'"
     else:
@@ -332,6 +401,7 @@ def create_project(name: str) -> str:
     Args:
         name: The name for the new project
     """
+    from api.timeline_item_operations import invalidate_resolve_cache
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -348,6 +418,7 @@ def create_project(name: str) -> str:
         return f"Error: Project '{name}' already exists"
     
     result = project_manager.CreateProject(name)
+    invalidate_resolve_cache()
     if result:
         return f"Successfully created project '{name}'"
     else:
@@ -381,10 +452,10 @@ def save_project() -> str:
             if hasattr(current_project, "SaveProject"):
                 result = current_project.SaveProject()
                 if result:
-                    logger.info(f"Project '{project_name}' saved using SaveProject method")
+                    logger.info("Project '%s' saved using SaveProject method", project_name)
                     success = True
         except Exception as e:
-            logger.error(f"Error in SaveProject method: {str(e)}")
+            logger.error("Error in SaveProject method: %s", e)
             error_message = str(e)
             
         # Method 2: Try project manager save method
@@ -393,10 +464,10 @@ def save_project() -> str:
                 if hasattr(project_manager, "SaveProject"):
                     result = project_manager.SaveProject()
                     if result:
-                        logger.info(f"Project '{project_name}' saved using ProjectManager.SaveProject method")
+                        logger.info("Project '%s' saved using ProjectManager.SaveProject method", project_name)
                         success = True
             except Exception as e:
-                logger.error(f"Error in ProjectManager.SaveProject method: {str(e)}")
+                logger.error("Error in ProjectManager.SaveProject method: %s", e)
                 if not error_message:
                     error_message = str(e)
         
@@ -404,15 +475,13 @@ def save_project() -> str:
         if not success:
             try:
                 # Get a temporary file path in the same location as other project files
-                import tempfile
-                import os
                 temp_dir = tempfile.gettempdir()
                 temp_file = os.path.join(temp_dir, f"{project_name}_temp.drp")
                 
                 # Try to export the project, which should trigger a save
                 result = project_manager.ExportProject(project_name, temp_file)
                 if result:
-                    logger.info(f"Project '{project_name}' saved via temporary export to {temp_file}")
+                    logger.info("Project '%s' saved via temporary export to %s", project_name, temp_file)
                     # Try to clean up temp file
                     try:
                         if os.path.exists(temp_file):
@@ -421,7 +490,7 @@ def save_project() -> str:
                         pass
                     success = True
             except Exception as e:
-                logger.error(f"Error in export method: {str(e)}")
+                logger.error("Error in export method: %s", e)
                 if not error_message:
                     error_message = str(e)
                     
@@ -432,7 +501,7 @@ def save_project() -> str:
             return f"Successfully saved project '{project_name}'"
             
     except Exception as e:
-        logger.error(f"Error saving project: {str(e)}")
+        logger.error("Error saving project: %s", e)
         return f"Error saving project: {str(e)}"
 
 @mcp.tool()
@@ -441,6 +510,7 @@ def close_project() -> str:
     
     This closes the current project without saving. If you need to save, use the save_project function first.
     """
+    from api.timeline_item_operations import invalidate_resolve_cache
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -457,14 +527,15 @@ def close_project() -> str:
     # Close the project
     try:
         result = project_manager.CloseProject(current_project)
+        invalidate_resolve_cache()
         if result:
-            logger.info(f"Project '{project_name}' closed successfully")
+            logger.info("Project '%s' closed successfully", project_name)
             return f"Successfully closed project '{project_name}'"
         else:
-            logger.error(f"Failed to close project '{project_name}'")
+            logger.error("Failed to close project '%s'", project_name)
             return f"Failed to close project '{project_name}'"
     except Exception as e:
-        logger.error(f"Error closing project: {str(e)}")
+        logger.error("Error closing project: %s", e)
         return f"Error closing project: {str(e)}"
 
 # ------------------
@@ -491,7 +562,7 @@ def list_timelines() -> List[str]:
         return ["Error: No project currently open"]
     
     timeline_count = current_project.GetTimelineCount()
-    logger.info(f"Timeline count: {timeline_count}")
+    logger.info("Timeline count: %s", timeline_count)
     
     timelines = []
     
@@ -500,13 +571,13 @@ def list_timelines() -> List[str]:
         if timeline:
             timeline_name = timeline.GetName()
             timelines.append(timeline_name)
-            logger.info(f"Found timeline {i}: {timeline_name}")
+            logger.info("Found timeline %s: %s", i, timeline_name)
     
     if not timelines:
         logger.info("No timelines found in the current project")
         return ["No timelines found in the current project"]
     
-    logger.info(f"Returning {len(timelines)} timelines: {', '.join(timelines)}")
+    logger.info("Returning %s timelines: %s", len(timelines), ', '.join(timelines))
     return timelines
 
 @mcp.resource("resolve://current-timeline")
@@ -557,6 +628,8 @@ def create_timeline(name: str) -> str:
     Args:
         name: The name for the new timeline
     """
+    from api.timeline_item_operations import forget_active_timeline
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -577,6 +650,8 @@ def create_timeline(name: str) -> str:
     
     timeline = media_pool.CreateEmptyTimeline(name)
     if timeline:
+        # The new timeline becomes the current one
+        forget_active_timeline()
         return f"Successfully created timeline '{name}'"
     else:
         return f"Failed to create timeline '{name}'"
@@ -622,6 +697,8 @@ def set_current_timeline(name: str) -> str:
     Args:
         name: The name of the timeline to set as current
     """
+    from api.timeline_item_operations import forget_active_timeline
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -642,6 +719,7 @@ def set_current_timeline(name: str) -> str:
         timeline = current_project.GetTimelineByIndex(i)
         if timeline and timeline.GetName() == name:
             result = current_project.SetCurrentTimeline(timeline)
+            forget_active_timeline()
             if result:
                 return f"Successfully switched to timeline '{name}'"
             else:
@@ -734,6 +812,7 @@ def move_media_to_bin(clip_name: str, bin_name: str) -> str:
     return move_media_func(resolve, clip_name, bin_name)
 
 @mcp.tool()
+@in_resolve_worker
 def auto_sync_audio(clip_names: List[str], sync_method: str = "waveform", 
                    append_mode: bool = False, target_bin: str = None) -> str:
     """Sync audio between clips with customizable settings.
@@ -910,6 +989,12 @@ def get_color_wheel_params(node_index: int = None) -> Dict[str, Any]:
     from api.color_operations import get_color_wheels as get_wheels_func
     return get_wheels_func(resolve, node_index)
 
+@mcp.resource("resolve://color/current-grade")
+def get_current_grade_info() -> Dict[str, Any]:
+    """Get the current node and its color wheel parameters in the color page."""
+    from api.color_operations import get_current_grade_info as get_grade_info_func
+    return get_grade_info_func(resolve)
+
 @mcp.tool()
 def apply_lut(lut_path: str, node_index: int = None) -> str:
     """Apply a LUT to a node in the color page.
@@ -957,6 +1042,68 @@ def copy_grade(source_clip_name: str = None, target_clip_name: str = None, mode:
     from api.color_operations import copy_grade as copy_grade_func
     return copy_grade_func(resolve, source_clip_name, target_clip_name, mode)
 
+@mcp.tool()
+@in_resolve_worker
+def copy_grade_to_clips(target_clip_names: List[str], source_clip_name: str = None) -> Dict[str, Any]:
+    """Copy a grade from one clip to several clips in the color page.
+    
+    Args:
+        target_clip_names: Names of the clips to apply the grade to (the source clip itself is skipped)
+        source_clip_name: Name of the clip to copy the grade from (uses current clip if None)
+    """
+    from api.color_operations import copy_grade_to_clips as copy_grade_to_clips_func
+    from api.timeline_item_operations import resolve_scope
+    
+    # The timeline and current clip lookups are shared by the source and target resolution
+    with resolve_scope():
+        return copy_grade_to_clips_func(resolve, target_clip_names, source_clip_name)
+
+@mcp.tool()
+def set_cdl(slope: Union[List[float], str], offset: Union[List[float], str], power: Union[List[float], str],
+            saturation: float = 1.0, node_index: int = 1, track_type: str = "video", track_index: int = 1,
+            item_index: int = None) -> str:
+    """Apply ASC CDL values to a node of a clip's grade.
+    
+    Args:
+        slope: Red, green and blue slope values (e.g. [1.0, 1.0, 1.0] or "1.0 1.0 1.0")
+        offset: Red, green and blue offset values (e.g. [0.0, 0.0, 0.0] or "0.0 0.0 0.0")
+        power: Red, green and blue power values (e.g. [1.0, 1.0, 1.0] or "1.0 1.0 1.0")
+        saturation: Saturation value (1.0 leaves saturation unchanged)
+        node_index: Index of the node to apply the CDL to
+        track_type: Type of the track containing the clip ('video', 'audio' or 'subtitle')
+        track_index: Index of the track containing the clip
+        item_index: Index of the clip in the track (uses current clip if None)
+    """
+    from api.color_operations import set_cdl as set_cdl_func
+    return set_cdl_func(resolve, slope, offset, power, saturation, node_index,
+                        track_type, track_index, item_index)
+
+@mcp.tool()
+@in_resolve_worker
+def set_cdl_batch(rows: List[List[float]], track_type: str = "video", track_index: int = 1,
+                  item_index: int = None) -> Dict[str, Any]:
+    """Apply CDL values to several nodes of a clip's grade in one call.
+    
+    Args:
+        rows: One row per node: [node_index, slope R, G, B, offset R, G, B, power R, G, B],
+              optionally followed by saturation (defaults to 1.0)
+        track_type: Type of the track containing the clip ('video', 'audio' or 'subtitle')
+        track_index: Index of the track containing the clip
+        item_index: Index of the clip in the track (uses current clip if None)
+    """
+    from api.color_operations import set_cdl_batch as set_cdl_batch_func
+    return set_cdl_batch_func(resolve, rows, track_type, track_index, item_index)
+
+@mcp.tool()
+def export_clip_thumbnail(output_path: str = None) -> Dict[str, Any]:
+    """Export the current clip's thumbnail in the color page to an image file.
+    
+    Args:
+        output_path: Path to write the image to (uses a temporary .ppm file if None)
+    """
+    from api.color_operations import export_current_clip_thumbnail as export_thumbnail_func
+    return export_thumbnail_func(resolve, output_path)
+
 # ------------------
 # Delivery Page Operations
 # ------------------
@@ -1137,6 +1284,7 @@ def replace_clip(clip_name: str, replacement_path: str) -> str:
         return f"Error replacing clip: {str(e)}"
 
 @mcp.tool()
+@in_resolve_worker
 def transcribe_audio(clip_name: str, language: str = "en-US") -> str:
     """Transcribe audio for a clip.
     
@@ -1301,6 +1449,7 @@ def export_folder(folder_name: str, export_path: str, export_type: str = "DRB")
         return f"Error exporting folder: {str(e)}"
 
 @mcp.tool()
+@in_resolve_worker
 def transcribe_folder_audio(folder_name: str, language: str = "en-US") -> str:
     """Transcribe audio for all clips in a folder.
     
@@ -1455,13 +1604,9 @@ def get_cache_settings() -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Failed to get cache settings: {str(e)}"}
 
-@mcp.tool()
-def set_cache_mode(mode: str) -> str:
-    """Set cache mode for the current project.
-    
-    Args:
-        mode: Cache mode to set. Options: 'auto', 'on', 'off'
-    """
+# Utility function to set one of the project's auto/on/off cache mode settings
+def set_cache_mode_setting(setting_key: str, label: str, mode: str) -> str:
+    """Set a cache mode project setting (e.g. 'CacheMode') from an 'auto'/'on'/'off' mode name."""
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -1474,26 +1619,27 @@ def set_cache_mode(mode: str) -> str:
         return "Error: No project currently open"
     
     # Validate mode
-    valid_modes = ["auto", "on", "off"]
     mode = mode.lower()
-    if mode not in valid_modes:
-        return f"Error: Invalid cache mode. Must be one of: {', '.join(valid_modes)}"
-    
-    # Convert mode to API value
-    mode_map = {
-        "auto": "0",
-        "on": "1",
-        "off": "2"
-    }
+    if mode not in CACHE_MODES:
+        return f"Error: Invalid {label}. Must be one of: {', '.join(CACHE_MODES)}"
     
     try:
-        result = current_project.SetSetting("CacheMode", mode_map[mode])
+        result = current_project.SetSetting(setting_key, CACHE_MODES[mode])
         if result:
-            return f"Successfully set cache mode to '{mode}'"
+            return f"Successfully set {label} to '{mode}'"
         else:
-            return f"Failed to set cache mode to '{mode}'"
+            return f"Failed to set {label} to '{mode}'"
     except Exception as e:
-        return f"Error setting cache mode: {str(e)}"
+        return f"Error setting {label}: {str(e)}"
+
+@mcp.tool()
+def set_cache_mode(mode: str) -> str:
+    """Set cache mode for the current project.
+    
+    Args:
+        mode: Cache mode to set. Options: 'auto', 'on', 'off'
+    """
+    return set_cache_mode_setting("CacheMode", "cache mode", mode)
 
 @mcp.tool()
 def set_optimized_media_mode(mode: str) -> str:
@@ -1502,38 +1648,7 @@ def set_optimized_media_mode(mode: str) -> str:
     Args:
         mode: Optimized media mode to set. Options: 'auto', 'on', 'off'
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    # Validate mode
-    valid_modes = ["auto", "on", "off"]
-    mode = mode.lower()
-    if mode not in valid_modes:
-        return f"Error: Invalid optimized media mode. Must be one of: {', '.join(valid_modes)}"
-    
-    # Convert mode to API value
-    mode_map = {
-        "auto": "0",
-        "on": "1",
-        "off": "2"
-    }
-    
-    try:
-        result = current_project.SetSetting("OptimizedMediaMode", mode_map[mode])
-        if result:
-            return f"Successfully set optimized media mode to '{mode}'"
-        else:
-            return f"Failed to set optimized media mode to '{mode}'"
-    except Exception as e:
-        return f"Error setting optimized media mode: {str(e)}"
+    return set_cache_mode_setting("OptimizedMediaMode", "optimized media mode", mode)
 
 @mcp.tool()
 def set_proxy_mode(mode: str) -> str:
@@ -1542,38 +1657,7 @@ def set_proxy_mode(mode: str) -> str:
     Args:
         mode: Proxy mode to set. Options: 'auto', 'on', 'off'
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    # Validate mode
-    valid_modes = ["auto", "on", "off"]
-    mode = mode.lower()
-    if mode not in valid_modes:
-        return f"Error: Invalid proxy mode. Must be one of: {', '.join(valid_modes)}"
-    
-    # Convert mode to API value
-    mode_map = {
-        "auto": "0",
-        "on": "1",
-        "off": "2"
-    }
-    
-    try:
-        result = current_project.SetSetting("ProxyMode", mode_map[mode])
-        if result:
-            return f"Successfully set proxy mode to '{mode}'"
-        else:
-            return f"Failed to set proxy mode to '{mode}'"
-    except Exception as e:
-        return f"Error setting proxy mode: {str(e)}"
+    return set_cache_mode_setting("ProxyMode", "proxy mode", mode)
 
 @mcp.tool()
 def set_proxy_quality(quality: str) -> str:
@@ -1656,6 +1740,7 @@ def set_cache_path(path_type: str, path: str) -> str:
         return f"Error setting cache path: {str(e)}"
 
 @mcp.tool()
+@in_resolve_worker
 def generate_optimized_media(clip_names: List[str] = None) -> str:
     """Generate optimized media for specified clips or all clips if none specified.
     
@@ -1830,133 +1915,56 @@ def get_timeline_item_properties(timeline_item_id: str) -> Dict[str, Any]:
     Args:
         timeline_item_id: The ID of the timeline item to get properties for
     """
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item
+    from api.timeline_item_operations import get_item_properties as get_item_properties_func
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return {"error": "Failed to get Project Manager"}
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return {"error": "No project currently open"}
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return {"error": "No timeline currently active"}
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
     
     try:
         # Find the timeline item by ID
-        # We'll need to get all items from all tracks and check their IDs
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
-        
-        # If not found, search audio tracks
-        if not timeline_item:
-            for track_index in range(1, audio_track_count + 1):
-                items = current_timeline.GetItemListInTrack("audio", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            break
-                if timeline_item:
-                    break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id)
         
         if not timeline_item:
             return {"error": f"Timeline item with ID '{timeline_item_id}' not found"}
         
-        # Get basic properties
-        properties = {
-            "id": timeline_item_id,
-            "name": timeline_item.GetName(),
-            "type": timeline_item.GetType(),
-            "start_frame": timeline_item.GetStart(),
-            "end_frame": timeline_item.GetEnd(),
-            "duration": timeline_item.GetDuration()
-        }
-        
-        # Get additional properties if it's a video item
-        if timeline_item.GetType() == "Video":
-            # Transform properties
-            properties["transform"] = {
-                "position": {
-                    "x": timeline_item.GetProperty("Pan"),
-                    "y": timeline_item.GetProperty("Tilt")
-                },
-                "zoom": timeline_item.GetProperty("ZoomX"),  # ZoomX/ZoomY can be different for non-uniform scaling
-                "zoom_x": timeline_item.GetProperty("ZoomX"),
-                "zoom_y": timeline_item.GetProperty("ZoomY"),
-                "rotation": timeline_item.GetProperty("Rotation"),
-                "anchor_point": {
-                    "x": timeline_item.GetProperty("AnchorPointX"),
-                    "y": timeline_item.GetProperty("AnchorPointY")
-                },
-                "pitch": timeline_item.GetProperty("Pitch"),
-                "yaw": timeline_item.GetProperty("Yaw")
-            }
-            
-            # Crop properties
-            properties["crop"] = {
-                "left": timeline_item.GetProperty("CropLeft"),
-                "right": timeline_item.GetProperty("CropRight"),
-                "top": timeline_item.GetProperty("CropTop"),
-                "bottom": timeline_item.GetProperty("CropBottom")
-            }
-            
-            # Composite properties
-            properties["composite"] = {
-                "mode": timeline_item.GetProperty("CompositeMode"),
-                "opacity": timeline_item.GetProperty("Opacity")
-            }
-            
-            # Dynamic zoom properties
-            properties["dynamic_zoom"] = {
-                "enabled": timeline_item.GetProperty("DynamicZoomEnable"),
-                "mode": timeline_item.GetProperty("DynamicZoomMode")
-            }
-            
-            # Retime properties
-            properties["retime"] = {
-                "speed": timeline_item.GetProperty("Speed"),
-                "process": timeline_item.GetProperty("RetimeProcess")
-            }
-            
-            # Stabilization properties
-            properties["stabilization"] = {
-                "enabled": timeline_item.GetProperty("StabilizationEnable"),
-                "method": timeline_item.GetProperty("StabilizationMethod"),
-                "strength": timeline_item.GetProperty("StabilizationStrength")
-            }
-        
-        # Audio-specific properties
-        if timeline_item.GetType() == "Audio" or timeline_item.GetMediaType() == "Audio":
-            properties["audio"] = {
-                "volume": timeline_item.GetProperty("Volume"),
-                "pan": timeline_item.GetProperty("Pan"),
-                "eq_enabled": timeline_item.GetProperty("EQEnable"),
-                "normalize_enabled": timeline_item.GetProperty("NormalizeEnable"),
-                "normalize_level": timeline_item.GetProperty("NormalizeLevel")
-            }
-        
-        return properties
+        return get_item_properties_func(timeline_item, timeline_item_id)
         
     except Exception as e:
         return {"error": f"Error getting timeline item properties: {str(e)}"}
 
+@mcp.tool()
+@in_resolve_worker
+def get_track_item_properties(item_indices: List[int], track_type: str = "video",
+                              track_index: int = 1) -> Dict[str, Any]:
+    """Get properties of several timeline items in one track.
+    
+    Args:
+        item_indices: Indices of the items in the track (1-based)
+        track_type: Type of the track ('video', 'audio' or 'subtitle')
+        track_index: Index of the track (1-based)
+    """
+    from api.timeline_item_operations import get_track_item_properties as get_track_props_func
+    return get_track_props_func(resolve, item_indices, track_type, track_index)
+
+@mcp.tool()
+@in_resolve_worker
+def set_track_items_properties(group: str, values: Dict[str, Any], item_indices: List[int],
+                               track_type: str = "video", track_index: int = 1) -> Dict[str, Any]:
+    """Set the same composite, retime, stabilization or audio properties on several items of a track.
+    
+    Args:
+        group: Property group to set. Options: 'composite', 'retime', 'stabilization', 'audio'
+        values: Values keyed by parameter name, as accepted by the matching set_timeline_item_* tool
+                (e.g. {"enabled": true, "strength": 0.5} for 'stabilization')
+        item_indices: Indices of the items in the track (1-based)
+        track_type: Type of the track ('video', 'audio' or 'subtitle')
+        track_index: Index of the track (1-based)
+    """
+    from api.timeline_item_operations import set_track_item_property_group as set_track_props_func
+    return set_track_props_func(resolve, group, values, item_indices, track_type, track_index)
+
 @mcp.resource("resolve://timeline-items")
 def get_timeline_items() -> List[Dict[str, Any]]:
     """Get all items in the current timeline with their IDs and basic properties."""
@@ -2032,46 +2040,19 @@ def set_timeline_item_transform(timeline_item_id: str,
                       'AnchorPointY', 'Pitch', 'Yaw'
         property_value: The value to set for the property
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item, TRANSFORM_PROPERTIES
     
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate property name
-    valid_properties = [
-        'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'Rotation', 
-        'AnchorPointX', 'AnchorPointY', 'Pitch', 'Yaw'
-    ]
-    
-    if property_name not in valid_properties:
-        return f"Error: Invalid property name. Must be one of: {', '.join(valid_properties)}"
+    if property_name not in TRANSFORM_PROPERTIES:
+        return f"Error: Invalid property name. Must be one of: {', '.join(TRANSFORM_PROPERTIES)}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id, ("video",))
         
         if not timeline_item:
             return f"Error: Video timeline item with ID '{timeline_item_id}' not found"
@@ -2099,45 +2080,21 @@ def set_timeline_item_crop(timeline_item_id: str,
         crop_type: The type of crop to set. Options: 'Left', 'Right', 'Top', 'Bottom'
         crop_value: The value to set for the crop (typically 0.0 to 1.0)
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item, CROP_TYPES
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate crop type
-    valid_crop_types = ['Left', 'Right', 'Top', 'Bottom']
-    
-    if crop_type not in valid_crop_types:
-        return f"Error: Invalid crop type. Must be one of: {', '.join(valid_crop_types)}"
+    if crop_type not in CROP_TYPES:
+        return f"Error: Invalid crop type. Must be one of: {', '.join(CROP_TYPES)}"
     
     property_name = f"Crop{crop_type}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id, ("video",))
         
         if not timeline_item:
             return f"Error: Video timeline item with ID '{timeline_item_id}' not found"
@@ -2165,54 +2122,23 @@ def set_timeline_item_composite(timeline_item_id: str,
         composite_mode: Optional composite mode to set (e.g., 'Normal', 'Add', 'Multiply')
         opacity: Optional opacity value to set (0.0 to 1.0)
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import (
+        get_active_timeline, find_timeline_item, set_item_property_group, validate_property_group
+    )
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate inputs
-    if composite_mode is None and opacity is None:
-        return "Error: Must specify at least one of composite_mode or opacity"
-    
-    # Valid composite modes
-    valid_composite_modes = [
-        'Normal', 'Add', 'Subtract', 'Difference', 'Multiply', 'Screen', 
-        'Overlay', 'Hardlight', 'Softlight', 'Darken', 'Lighten', 'ColorDodge', 
-        'ColorBurn', 'Exclusion', 'Hue', 'Saturation', 'Color', 'Luminosity'
-    ]
-    
-    if composite_mode and composite_mode not in valid_composite_modes:
-        return f"Error: Invalid composite mode. Must be one of: {', '.join(valid_composite_modes)}"
-    
-    if opacity is not None and (opacity < 0.0 or opacity > 1.0):
-        return "Error: Opacity must be between 0.0 and 1.0"
+    values = {"composite_mode": composite_mode, "opacity": opacity}
+    error = validate_property_group("composite", values)
+    if error:
+        return f"Error: {error}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id, ("video",))
         
         if not timeline_item:
             return f"Error: Video timeline item with ID '{timeline_item_id}' not found"
@@ -2220,27 +2146,9 @@ def set_timeline_item_composite(timeline_item_id: str,
         if timeline_item.GetType() != "Video":
             return f"Error: Timeline item with ID '{timeline_item_id}' is not a video item"
         
-        success = True
-        
-        # Set composite mode if specified
-        if composite_mode:
-            result = timeline_item.SetProperty("CompositeMode", composite_mode)
-            if not result:
-                success = False
-        
-        # Set opacity if specified
-        if opacity is not None:
-            result = timeline_item.SetProperty("Opacity", opacity)
-            if not result:
-                success = False
+        success, changes = set_item_property_group(timeline_item, "composite", values)
         
         if success:
-            changes = []
-            if composite_mode:
-                changes.append(f"composite mode to '{composite_mode}'")
-            if opacity is not None:
-                changes.append(f"opacity to {opacity}")
-            
             return f"Successfully set {' and '.join(changes)} for timeline item '{timeline_item.GetName()}'"
         else:
             return f"Failed to set some composite properties for timeline item '{timeline_item.GetName()}'"
@@ -2258,73 +2166,30 @@ def set_timeline_item_retime(timeline_item_id: str,
         speed: Optional speed factor (e.g., 0.5 for 50%, 2.0 for 200%)
         process: Optional retime process. Options: 'NearestFrame', 'FrameBlend', 'OpticalFlow'
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import (
+        get_active_timeline, find_timeline_item, set_item_property_group, validate_property_group
+    )
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate inputs
-    if speed is None and process is None:
-        return "Error: Must specify at least one of speed or process"
-    
-    if speed is not None and speed <= 0:
-        return "Error: Speed must be greater than 0"
-    
-    valid_processes = ['NearestFrame', 'FrameBlend', 'OpticalFlow']
-    if process and process not in valid_processes:
-        return f"Error: Invalid retime process. Must be one of: {', '.join(valid_processes)}"
+    values = {"speed": speed, "process": process}
+    error = validate_property_group("retime", values)
+    if error:
+        return f"Error: {error}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id, ("video",))
         
         if not timeline_item:
             return f"Error: Video timeline item with ID '{timeline_item_id}' not found"
         
-        success = True
-        
-        # Set speed if specified
-        if speed is not None:
-            result = timeline_item.SetProperty("Speed", speed)
-            if not result:
-                success = False
-        
-        # Set retime process if specified
-        if process:
-            result = timeline_item.SetProperty("RetimeProcess", process)
-            if not result:
-                success = False
+        success, changes = set_item_property_group(timeline_item, "retime", values)
         
         if success:
-            changes = []
-            if speed is not None:
-                changes.append(f"speed to {speed}x")
-            if process:
-                changes.append(f"retime process to '{process}'")
-            
             return f"Successfully set {' and '.join(changes)} for timeline item '{timeline_item.GetName()}'"
         else:
             return f"Failed to set some retime properties for timeline item '{timeline_item.GetName()}'"
@@ -2344,48 +2209,23 @@ def set_timeline_item_stabilization(timeline_item_id: str,
         method: Optional stabilization method. Options: 'Perspective', 'Similarity', 'Translation'
         strength: Optional strength value (0.0 to 1.0)
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
+    from api.timeline_item_operations import (
+        get_active_timeline, find_timeline_item, set_item_property_group, validate_property_group
+    )
     
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate inputs
-    if enabled is None and method is None and strength is None:
-        return "Error: Must specify at least one parameter to modify"
-    
-    valid_methods = ['Perspective', 'Similarity', 'Translation']
-    if method and method not in valid_methods:
-        return f"Error: Invalid stabilization method. Must be one of: {', '.join(valid_methods)}"
-    
-    if strength is not None and (strength < 0.0 or strength > 1.0):
-        return "Error: Strength must be between 0.0 and 1.0"
+    values = {"enabled": enabled, "method": method, "strength": strength}
+    error = validate_property_group("stabilization", values)
+    if error:
+        return f"Error: {error}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id, ("video",))
         
         if not timeline_item:
             return f"Error: Video timeline item with ID '{timeline_item_id}' not found"
@@ -2393,35 +2233,9 @@ def set_timeline_item_stabilization(timeline_item_id: str,
         if timeline_item.GetType() != "Video":
             return f"Error: Timeline item with ID '{timeline_item_id}' is not a video item"
         
-        success = True
-        
-        # Set enabled if specified
-        if enabled is not None:
-            result = timeline_item.SetProperty("StabilizationEnable", 1 if enabled else 0)
-            if not result:
-                success = False
-        
-        # Set method if specified
-        if method:
-            result = timeline_item.SetProperty("StabilizationMethod", method)
-            if not result:
-                success = False
-        
-        # Set strength if specified
-        if strength is not None:
-            result = timeline_item.SetProperty("StabilizationStrength", strength)
-            if not result:
-                success = False
+        success, changes = set_item_property_group(timeline_item, "stabilization", values)
         
         if success:
-            changes = []
-            if enabled is not None:
-                changes.append(f"stabilization {'enabled' if enabled else 'disabled'}")
-            if method:
-                changes.append(f"stabilization method to '{method}'")
-            if strength is not None:
-                changes.append(f"stabilization strength to {strength}")
-            
             return f"Successfully set {' and '.join(changes)} for timeline item '{timeline_item.GetName()}'"
         else:
             return f"Failed to set some stabilization properties for timeline item '{timeline_item.GetName()}'"
@@ -2441,62 +2255,24 @@ def set_timeline_item_audio(timeline_item_id: str,
         pan: Optional pan value (-1.0 to 1.0, where -1.0 is left, 0 is center, 1.0 is right)
         eq_enabled: Optional boolean to enable/disable EQ
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
+    from api.timeline_item_operations import (
+        get_active_timeline, find_timeline_item, set_item_property_group, validate_property_group
+    )
     
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate inputs
-    if volume is None and pan is None and eq_enabled is None:
-        return "Error: Must specify at least one parameter to modify"
-    
-    if volume is not None and volume < 0.0:
-        return "Error: Volume must be greater than or equal to 0.0"
-    
-    if pan is not None and (pan < -1.0 or pan > 1.0):
-        return "Error: Pan must be between -1.0 and 1.0"
+    values = {"volume": volume, "pan": pan, "eq_enabled": eq_enabled}
+    error = validate_property_group("audio", values)
+    if error:
+        return f"Error: {error}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        is_audio = False
-        
-        # Search audio tracks first
-        for track_index in range(1, audio_track_count + 1):
-            items = current_timeline.GetItemListInTrack("audio", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        is_audio = True
-                        break
-            if timeline_item:
-                break
-        
-        # If not found in audio tracks, search video tracks (might be a video clip with audio)
-        if not timeline_item:
-            for track_index in range(1, video_track_count + 1):
-                items = current_timeline.GetItemListInTrack("video", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            break
-                if timeline_item:
-                    break
+        timeline_item, track_type = find_timeline_item(current_timeline, timeline_item_id, ("audio", "video"))
+        is_audio = track_type == "audio"
         
         if not timeline_item:
             return f"Error: Timeline item with ID '{timeline_item_id}' not found"
@@ -2505,35 +2281,9 @@ def set_timeline_item_audio(timeline_item_id: str,
         if not is_audio and timeline_item.GetMediaType() != "Audio":
             return f"Error: Timeline item with ID '{timeline_item_id}' does not have audio properties"
         
-        success = True
-        
-        # Set volume if specified
-        if volume is not None:
-            result = timeline_item.SetProperty("Volume", volume)
-            if not result:
-                success = False
-        
-        # Set pan if specified
-        if pan is not None:
-            result = timeline_item.SetProperty("Pan", pan)
-            if not result:
-                success = False
-        
-        # Set EQ enabled if specified
-        if eq_enabled is not None:
-            result = timeline_item.SetProperty("EQEnable", 1 if eq_enabled else 0)
-            if not result:
-                success = False
+        success, changes = set_item_property_group(timeline_item, "audio", values)
         
         if success:
-            changes = []
-            if volume is not None:
-                changes.append(f"volume to {volume}")
-            if pan is not None:
-                changes.append(f"pan to {pan}")
-            if eq_enabled is not None:
-                changes.append(f"EQ {'enabled' if eq_enabled else 'disabled'}")
-            
             return f"Successfully set {' and '.join(changes)} for timeline item '{timeline_item.GetName()}'"
         else:
             return f"Failed to set some audio properties for timeline item '{timeline_item.GetName()}'"
@@ -2544,6 +2294,22 @@ def set_timeline_item_audio(timeline_item_id: str,
 # Keyframe Control
 # ------------------
 
+@mcp.tool()
+@in_resolve_worker
+def batch_timeline_item_ops(timeline_item_id: str, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply several property and keyframe operations to one timeline item in a single call.
+    
+    Args:
+        timeline_item_id: The ID of the timeline item to modify
+        ops: List of operations, applied in order. Each is a dict with an 'op' key:
+             {'op': 'set', 'property': 'Pan', 'value': 10.0}
+             {'op': 'add_keyframe', 'property': 'ZoomX', 'frame': 100, 'value': 1.2}
+             {'op': 'delete_keyframe', 'property': 'ZoomX', 'frame': 100}
+             Each operation is checked like the matching set_timeline_item_* or keyframe tool.
+    """
+    from api.timeline_item_operations import batch_timeline_item_ops as batch_ops_func
+    return batch_ops_func(resolve, timeline_item_id, ops)
+
 @mcp.resource("resolve://timeline-item/{timeline_item_id}/keyframes/{property_name}")
 def get_timeline_item_keyframes(timeline_item_id: str, property_name: str) -> Dict[str, Any]:
     """Get keyframes for a specific timeline item by ID.
@@ -2552,50 +2318,17 @@ def get_timeline_item_keyframes(timeline_item_id: str, property_name: str) -> Di
         timeline_item_id: The ID of the timeline item to get keyframes for
         property_name: Optional property name to filter keyframes (e.g., 'Pan', 'ZoomX')
     """
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return {"error": "Failed to get Project Manager"}
+    from api.timeline_item_operations import (
+        get_active_timeline, find_timeline_item, KEYFRAME_VIDEO_PROPERTIES, KEYFRAME_AUDIO_PROPERTIES
+    )
     
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return {"error": "No project currently open"}
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return {"error": "No timeline currently active"}
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return {"error": error}
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
-        
-        # If not found, search audio tracks
-        if not timeline_item:
-            for track_index in range(1, audio_track_count + 1):
-                items = current_timeline.GetItemListInTrack("audio", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            break
-                if timeline_item:
-                    break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id)
         
         if not timeline_item:
             return {"error": f"Timeline item with ID '{timeline_item_id}' not found"}
@@ -2604,19 +2337,10 @@ def get_timeline_item_keyframes(timeline_item_id: str, property_name: str) -> Di
         keyframeable_properties = []
         keyframes = {}
         
-        # Common keyframeable properties for video items
-        video_properties = [
-            'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'Rotation', 'AnchorPointX', 'AnchorPointY',
-            'Pitch', 'Yaw', 'Opacity', 'CropLeft', 'CropRight', 'CropTop', 'CropBottom'
-        ]
-        
-        # Audio-specific keyframeable properties
-        audio_properties = ['Volume', 'Pan']
-        
         # Check if it's a video item
         if timeline_item.GetType() == "Video":
             # Check each property to see if it has keyframes
-            for prop in video_properties:
+            for prop in KEYFRAME_VIDEO_PROPERTIES:
                 if timeline_item.GetKeyframeCount(prop) > 0:
                     keyframeable_properties.append(prop)
                     
@@ -2637,7 +2361,7 @@ def get_timeline_item_keyframes(timeline_item_id: str, property_name: str) -> Di
         # Check if it has audio properties (could be video with audio or audio-only)
         if timeline_item.GetType() == "Audio" or timeline_item.GetMediaType() == "Audio":
             # Check each audio property for keyframes
-            for prop in audio_properties:
+            for prop in KEYFRAME_AUDIO_PROPERTIES:
                 if timeline_item.GetKeyframeCount(prop) > 0:
                     keyframeable_properties.append(prop)
                     
@@ -2693,82 +2417,29 @@ def add_keyframe(timeline_item_id: str, property_name: str, frame: int, value: f
         frame: Frame position for the keyframe
         value: Value to set at the keyframe
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
+    from api.timeline_item_operations import (
+        get_active_timeline, find_timeline_item, validate_keyframe, KEYFRAME_PROPERTIES
+    )
     
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Valid keyframeable properties
-    video_properties = [
-        'Pan', 'Tilt', 'ZoomX', 'ZoomY', 'Rotation', 'AnchorPointX', 'AnchorPointY',
-        'Pitch', 'Yaw', 'Opacity', 'CropLeft', 'CropRight', 'CropTop', 'CropBottom'
-    ]
-    
-    audio_properties = ['Volume', 'Pan']
-    
-    valid_properties = video_properties + audio_properties
-    
-    if property_name not in valid_properties:
-        return f"Error: Invalid property name. Must be one of: {', '.join(valid_properties)}"
+    if property_name not in KEYFRAME_PROPERTIES:
+        return f"Error: Invalid property name. Must be one of: {', '.join(KEYFRAME_PROPERTIES)}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        is_audio = False
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
-        
-        # If not found, search audio tracks
-        if not timeline_item:
-            for track_index in range(1, audio_track_count + 1):
-                items = current_timeline.GetItemListInTrack("audio", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            is_audio = True
-                            break
-                if timeline_item:
-                    break
+        timeline_item, track_type = find_timeline_item(current_timeline, timeline_item_id)
         
         if not timeline_item:
             return f"Error: Timeline item with ID '{timeline_item_id}' not found"
         
-        # Check if the specified property is valid for this item type
-        if is_audio and property_name not in audio_properties:
-            return f"Error: Property '{property_name}' is not available for audio items"
-        
-        if not is_audio and property_name not in video_properties and timeline_item.GetType() != "Video":
-            return f"Error: Property '{property_name}' is not available for this item type"
-            
-        # Validate frame is within the item's range
-        start_frame = timeline_item.GetStart()
-        end_frame = timeline_item.GetEnd()
-        
-        if frame < start_frame or frame > end_frame:
-            return f"Error: Frame {frame} is outside the item's range ({start_frame} to {end_frame})"
+        # Check the property is valid for this item type and the frame is within the item's range
+        error = validate_keyframe(timeline_item, track_type, property_name, frame)
+        if error:
+            return f"Error: {error}"
         
         # Add the keyframe
         result = timeline_item.AddKeyframe(property_name, frame, value)
@@ -2792,53 +2463,18 @@ def modify_keyframe(timeline_item_id: str, property_name: str, frame: int, new_v
         new_value: Optional new value for the keyframe
         new_frame: Optional new frame position for the keyframe
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     if new_value is None and new_frame is None:
         return "Error: Must specify at least one of new_value or new_frame"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
-        
-        # If not found, search audio tracks
-        if not timeline_item:
-            for track_index in range(1, audio_track_count + 1):
-                items = current_timeline.GetItemListInTrack("audio", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            break
-                if timeline_item:
-                    break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id)
         
         if not timeline_item:
             return f"Error: Timeline item with ID '{timeline_item_id}' not found"
@@ -2902,50 +2538,15 @@ def delete_keyframe(timeline_item_id: str, property_name: str, frame: int) -> st
         property_name: The name of the property with keyframe to delete
         frame: Frame position of the keyframe to delete
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
-        
-        # If not found, search audio tracks
-        if not timeline_item:
-            for track_index in range(1, audio_track_count + 1):
-                items = current_timeline.GetItemListInTrack("audio", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            break
-                if timeline_item:
-                    break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id)
         
         if not timeline_item:
             return f"Error: Timeline item with ID '{timeline_item_id}' not found"
@@ -2987,55 +2588,19 @@ def set_keyframe_interpolation(timeline_item_id: str, property_name: str, frame:
         frame: Frame position of the keyframe
         interpolation_type: Type of interpolation. Options: 'Linear', 'Bezier', 'Ease-In', 'Ease-Out'
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate interpolation type
-    valid_interpolation_types = ['Linear', 'Bezier', 'Ease-In', 'Ease-Out']
-    if interpolation_type not in valid_interpolation_types:
-        return f"Error: Invalid interpolation type. Must be one of: {', '.join(valid_interpolation_types)}"
+    if interpolation_type not in KEYFRAME_INTERPOLATION_TYPES:
+        return f"Error: Invalid interpolation type. Must be one of: {', '.join(KEYFRAME_INTERPOLATION_TYPES)}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
-        
-        # If not found, search audio tracks
-        if not timeline_item:
-            for track_index in range(1, audio_track_count + 1):
-                items = current_timeline.GetItemListInTrack("audio", track_index)
-                if items:
-                    for item in items:
-                        if str(item.GetUniqueId()) == timeline_item_id:
-                            timeline_item = item
-                            break
-                if timeline_item:
-                    break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id)
         
         if not timeline_item:
             return f"Error: Timeline item with ID '{timeline_item_id}' not found"
@@ -3094,42 +2659,19 @@ def enable_keyframes(timeline_item_id: str, keyframe_mode: str = "All") -> str:
         timeline_item_id: The ID of the timeline item
         keyframe_mode: Keyframe mode to enable. Options: 'All', 'Color', 'Sizing'
     """
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
+    from api.timeline_item_operations import get_active_timeline, find_timeline_item
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    current_timeline = current_project.GetCurrentTimeline()
-    if not current_timeline:
-        return "Error: No timeline currently active"
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
     
     # Validate keyframe mode
-    valid_keyframe_modes = ['All', 'Color', 'Sizing']
-    if keyframe_mode not in valid_keyframe_modes:
-        return f"Error: Invalid keyframe mode. Must be one of: {', '.join(valid_keyframe_modes)}"
+    if keyframe_mode not in KEYFRAME_MODES:
+        return f"Error: Invalid keyframe mode. Must be one of: {', '.join(KEYFRAME_MODES)}"
     
     try:
         # Find the timeline item by ID
-        video_track_count = current_timeline.GetTrackCount("video")
-        
-        timeline_item = None
-        
-        # Search video tracks
-        for track_index in range(1, video_track_count + 1):
-            items = current_timeline.GetItemListInTrack("video", track_index)
-            if items:
-                for item in items:
-                    if str(item.GetUniqueId()) == timeline_item_id:
-                        timeline_item = item
-                        break
-            if timeline_item:
-                break
+        timeline_item, _ = find_timeline_item(current_timeline, timeline_item_id, ("video",))
         
         if not timeline_item:
             return f"Error: Video timeline item with ID '{timeline_item_id}' not found"
@@ -3158,6 +2700,36 @@ def enable_keyframes(timeline_item_id: str, keyframe_mode: str = "All") -> str:
 # Color Preset Management
 # ------------------
 
+# How long a project's gallery album list stays valid, in seconds
+GALLERY_ALBUM_TTL = 2.0
+
+# project id -> (fetched_at, {album name: album})
+_gallery_album_cache: Dict[str, Any] = {}
+
+# Utility function to look up gallery albums by name without re-listing them on every call
+def get_gallery_albums(current_project, gallery) -> Dict[str, Any]:
+    """Get the gallery's albums keyed by name, reusing a recent listing if available.
+    
+    The first album wins when several share a name.
+    """
+    key = str(current_project.GetUniqueId())
+    now = time.monotonic()
+    
+    cached = _gallery_album_cache.get(key)
+    if cached and now - cached[0] < GALLERY_ALBUM_TTL:
+        return cached[1]
+    
+    albums_by_name = {}
+    for album in gallery.GetAlbums() or []:
+        albums_by_name.setdefault(album.GetName(), album)
+    _gallery_album_cache[key] = (now, albums_by_name)
+    return albums_by_name
+
+# Utility function to forget cached gallery albums after creating or deleting one
+def invalidate_gallery_album_cache() -> None:
+    """Drop all cached gallery album listings."""
+    _gallery_album_cache.clear()
+
 @mcp.resource("resolve://color/presets")
 def get_color_presets() -> List[Dict[str, Any]]:
     """Get all available color presets in the current project."""
@@ -3230,6 +2802,8 @@ def save_color_preset(clip_name: str = None, preset_name: str = None, album_name
         preset_name: Name to give the preset (uses clip name if None)
         album_name: Album to save the preset to (default: "DaVinci Resolve")
     """
+    from api.timeline_item_operations import forget_current_item
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -3268,6 +2842,7 @@ def save_color_preset(clip_name: str = None, preset_name: str = None, album_name
             
             # Select the clip
             current_timeline.SetCurrentSelectedItem(target_clip)
+            forget_current_item()
         
         # Get gallery
         gallery = current_project.GetGallery()
@@ -3275,18 +2850,12 @@ def save_color_preset(clip_name: str = None, preset_name: str = None, album_name
             return "Error: Failed to get gallery"
         
         # Get or create album
-        album = None
-        albums = gallery.GetAlbums()
-        
-        if albums:
-            for a in albums:
-                if a.GetName() == album_name:
-                    album = a
-                    break
+        album = get_gallery_albums(current_project, gallery).get(album_name)
         
         if not album:
             # Create a new album if it doesn't exist
             album = gallery.CreateAlbum(album_name)
+            invalidate_gallery_album_cache()
             if not album:
                 return f"Error: Failed to create album '{album_name}'"
         
@@ -3304,17 +2873,20 @@ def save_color_preset(clip_name: str = None, preset_name: str = None, album_name
                     final_preset_name = f"Preset {len(album.GetStills()) + 1}"
         
         # Capture still
-        result = gallery.GrabStill()
+        grabbed_still = gallery.GrabStill()
         
-        if not result:
+        if not grabbed_still:
             return "Error: Failed to grab still for the preset"
         
-        # Get the still that was just created
-        stills = album.GetStills()
-        if stills:
-            latest_still = stills[-1]  # Assume the last one is the one we just grabbed
+        # Newer builds return the still object itself; older ones only return a
+        # status flag, so fall back to re-listing the album in that case
+        if isinstance(grabbed_still, int):
+            stills = album.GetStills()
+            grabbed_still = stills[-1] if stills else None  # Assume the last one is the one we just grabbed
+        
+        if grabbed_still:
             # Set the label
-            latest_still.SetLabel(final_preset_name)
+            grabbed_still.SetLabel(final_preset_name)
         
         # Return to the original page if we switched
         if current_page != "color":
@@ -3339,6 +2911,8 @@ def apply_color_preset(preset_id: str = None, preset_name: str = None,
         clip_name: Name of the clip to apply preset to (uses current clip if None)
         album_name: Album containing the preset (default: "DaVinci Resolve")
     """
+    from api.timeline_item_operations import forget_current_item
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -3380,6 +2954,7 @@ def apply_color_preset(preset_id: str = None, preset_name: str = None,
             
             # Select the clip
             current_timeline.SetCurrentSelectedItem(target_clip)
+            forget_current_item()
         
         # Get gallery
         gallery = current_project.GetGallery()
@@ -3387,14 +2962,7 @@ def apply_color_preset(preset_id: str = None, preset_name: str = None,
             return "Error: Failed to get gallery"
         
         # Find the album
-        album = None
-        albums = gallery.GetAlbums()
-        
-        if albums:
-            for a in albums:
-                if a.GetName() == album_name:
-                    album = a
-                    break
+        album = get_gallery_albums(current_project, gallery).get(album_name)
         
         if not album:
             return f"Error: Album '{album_name}' not found"
@@ -3477,14 +3045,7 @@ def delete_color_preset(preset_id: str = None, preset_name: str = None,
             return "Error: Failed to get gallery"
         
         # Find the album
-        album = None
-        albums = gallery.GetAlbums()
-        
-        if albums:
-            for a in albums:
-                if a.GetName() == album_name:
-                    album = a
-                    break
+        album = get_gallery_albums(current_project, gallery).get(album_name)
         
         if not album:
             return f"Error: Album '{album_name}' not found"
@@ -3561,18 +3122,15 @@ def create_color_preset_album(album_name: str) -> str:
             return "Error: Failed to get gallery"
         
         # Check if album already exists
-        albums = gallery.GetAlbums()
-        
-        if albums:
-            for a in albums:
-                if a.GetName() == album_name:
-                    # Return to the original page if we switched
-                    if current_page != "color":
-                        resolve.OpenPage(current_page)
-                    return f"Album '{album_name}' already exists"
+        if album_name in get_gallery_albums(current_project, gallery):
+            # Return to the original page if we switched
+            if current_page != "color":
+                resolve.OpenPage(current_page)
+            return f"Album '{album_name}' already exists"
         
         # Create a new album
         album = gallery.CreateAlbum(album_name)
+        invalidate_gallery_album_cache()
         
         # Return to the original page if we switched
         if current_page != "color":
@@ -3619,14 +3177,7 @@ def delete_color_preset_album(album_name: str) -> str:
             return "Error: Failed to get gallery"
         
         # Find the album
-        album = None
-        albums = gallery.GetAlbums()
-        
-        if albums:
-            for a in albums:
-                if a.GetName() == album_name:
-                    album = a
-                    break
+        album = get_gallery_albums(current_project, gallery).get(album_name)
         
         if not album:
             # Return to the original page if we switched
@@ -3636,6 +3187,7 @@ def delete_color_preset_album(album_name: str) -> str:
         
         # Delete the album
         result = gallery.DeleteAlbum(album)
+        invalidate_gallery_album_cache()
         
         # Return to the original page if we switched
         if current_page != "color":
@@ -3653,6 +3205,7 @@ def delete_color_preset_album(album_name: str) -> str:
         return f"Error deleting album: {str(e)}"
 
 @mcp.tool()
+@in_resolve_worker
 def export_lut(clip_name: str = None, 
               export_path: str = None, 
               lut_format: str = "Cube", 
@@ -3665,9 +3218,17 @@ def export_lut(clip_name: str = None,
         lut_format: Format of the LUT. Options: 'Cube', 'Davinci', '3dl', 'Panasonic'
         lut_size: Size of the LUT. Options: '17Point', '33Point', '65Point'
     """
+    from api.timeline_item_operations import forget_current_item, get_track_items
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
+    # Validate LUT format and size before talking to Resolve
+    if lut_format not in LUT_EXPORT_FORMATS:
+        return f"Error: Invalid LUT format. Must be one of: {', '.join(LUT_EXPORT_FORMATS)}"
+    
+    if lut_size not in LUT_EXPORT_SIZES:
+        return f"Error: Invalid LUT size. Must be one of: {', '.join(LUT_EXPORT_SIZES)}"
+    
     project_manager = resolve.GetProjectManager()
     if not project_manager:
         return "Error: Failed to get Project Manager"
@@ -3690,10 +3251,8 @@ def export_lut(clip_name: str = None,
         # Get the specific clip or current clip
         if clip_name:
             # Find the clip by name in the timeline
-            timeline_clips = current_timeline.GetItemListInTrack("video", 1)
             target_clip = None
-            
-            for clip in timeline_clips:
+            for clip in get_track_items(current_timeline, "video", 1):
                 if clip.GetName() == clip_name:
                     target_clip = clip
                     break
@@ -3703,67 +3262,25 @@ def export_lut(clip_name: str = None,
             
             # Select the clip
             current_timeline.SetCurrentSelectedItem(target_clip)
+            forget_current_item()
+        elif not current_timeline.GetCurrentVideoItem():
+            return "Error: No clip is currently selected"
         
         # Generate export path if not provided
         if not export_path:
-            import tempfile
             clip_name_safe = clip_name if clip_name else "current_clip"
             clip_name_safe = clip_name_safe.replace(' ', '_').replace(':', '-')
-            
-            extension = ".cube"
-            if lut_format.lower() == "davinci":
-                extension = ".ilut"
-            elif lut_format.lower() == "3dl":
-                extension = ".3dl"
-            elif lut_format.lower() == "panasonic":
-                extension = ".vlut"
-                
-            export_path = os.path.join(tempfile.gettempdir(), f"{clip_name_safe}_lut{extension}")
-        
-        # Validate LUT format
-        valid_formats = ['Cube', 'Davinci', '3dl', 'Panasonic']
-        if lut_format not in valid_formats:
-            return f"Error: Invalid LUT format. Must be one of: {', '.join(valid_formats)}"
-        
-        # Validate LUT size
-        valid_sizes = ['17Point', '33Point', '65Point']
-        if lut_size not in valid_sizes:
-            return f"Error: Invalid LUT size. Must be one of: {', '.join(valid_sizes)}"
-        
-        # Map format string to numeric value expected by DaVinci Resolve API
-        format_map = {
-            'Cube': 0,
-            'Davinci': 1,
-            '3dl': 2,
-            'Panasonic': 3
-        }
-        
-        # Map size string to numeric value
-        size_map = {
-            '17Point': 0,
-            '33Point': 1,
-            '65Point': 2
-        }
-        
-        # Get current clip
-        current_clip = current_timeline.GetCurrentVideoItem()
-        if not current_clip:
-            return "Error: No clip is currently selected"
+            export_path = os.path.join(tempfile.gettempdir(), f"{clip_name_safe}_lut{LUT_EXTENSIONS[lut_format]}")
         
         # Create a directory for the export path if it doesn't exist
         export_dir = os.path.dirname(export_path)
         if export_dir and not os.path.exists(export_dir):
             os.makedirs(export_dir, exist_ok=True)
         
-        # Export the LUT
-        colorpage = resolve.GetCurrentPage() == "color"
-        if not colorpage:
-            resolve.OpenPage("color")
-        
         # Access Color page functionality 
         result = current_project.ExportCurrentGradeAsLUT(
-            format_map[lut_format], 
-            size_map[lut_size], 
+            LUT_EXPORT_FORMATS[lut_format], 
+            LUT_EXPORT_SIZES[lut_size], 
             export_path
         )
         
@@ -3783,55 +3300,20 @@ def export_lut(clip_name: str = None,
         return f"Error exporting LUT: {str(e)}"
 
 @mcp.resource("resolve://color/lut-formats")
-def get_lut_formats() -> Dict[str, Any]:
+def get_lut_formats() -> str:
     """Get available LUT export formats and sizes."""
-    formats = {
-        "formats": [
-            {
-                "name": "Cube",
-                "extension": ".cube",
-                "description": "Industry standard LUT format supported by most applications"
-            },
-            {
-                "name": "Davinci",
-                "extension": ".ilut",
-                "description": "DaVinci Resolve's native LUT format"
-            },
-            {
-                "name": "3dl",
-                "extension": ".3dl",
-                "description": "ASSIMILATE SCRATCH and some Autodesk applications"
-            },
-            {
-                "name": "Panasonic",
-                "extension": ".vlut",
-                "description": "Panasonic VariCam and other Panasonic cameras"
-            }
-        ],
-        "sizes": [
-            {
-                "name": "17Point",
-                "description": "Smaller file size, less precision (17x17x17)"
-            },
-            {
-                "name": "33Point",
-                "description": "Standard size with good balance of precision and file size (33x33x33)"
-            },
-            {
-                "name": "65Point",
-                "description": "Highest precision but larger file size (65x65x65)"
-            }
-        ]
-    }
-    return formats
+    return LUT_FORMATS_JSON
 
 @mcp.tool()
+@in_resolve_worker
 def export_all_powergrade_luts(export_dir: str) -> str:
     """Export all PowerGrade presets as LUT files.
     
     Args:
         export_dir: Directory to save the exported LUTs
     """
+    from api.timeline_item_operations import get_active_timeline
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -3843,6 +3325,10 @@ def export_all_powergrade_luts(export_dir: str) -> str:
     if not current_project:
         return "Error: No project currently open"
     
+    current_timeline, error = get_active_timeline(resolve)
+    if error:
+        return f"Error: {error}"
+    
     # Switch to color page
     current_page = resolve.GetCurrentPage()
     if current_page != "color":
@@ -3855,14 +3341,7 @@ def export_all_powergrade_luts(export_dir: str) -> str:
             return "Error: Failed to get gallery"
         
         # Get PowerGrade album
-        powergrade_album = None
-        albums = gallery.GetAlbums()
-        
-        if albums:
-            for album in albums:
-                if album.GetName() == "PowerGrade":
-                    powergrade_album = album
-                    break
+        powergrade_album = get_gallery_albums(current_project, gallery).get("PowerGrade")
         
         if not powergrade_album:
             return "Error: PowerGrade album not found"
@@ -4100,6 +3579,8 @@ def inspect_custom_object(object_path: str) -> Dict[str, Any]:
 @mcp.resource("resolve://layout-presets")
 def get_layout_presets() -> List[Dict[str, Any]]:
     """Get all available layout presets for DaVinci Resolve."""
+    from src.utils.layout_presets import list_layout_presets
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve"}
     
@@ -4113,6 +3594,8 @@ def save_layout_preset_tool(preset_name: str) -> str:
     Args:
         preset_name: Name for the saved preset
     """
+    from src.utils.layout_presets import save_layout_preset
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4130,6 +3613,8 @@ def load_layout_preset_tool(preset_name: str) -> str:
     Args:
         preset_name: Name of the preset to load
     """
+    from src.utils.layout_presets import load_layout_preset
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4148,6 +3633,8 @@ def export_layout_preset_tool(preset_name: str, export_path: str) -> str:
         preset_name: Name of the preset to export
         export_path: Path to export the preset file to
     """
+    from src.utils.layout_presets import export_layout_preset
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4166,6 +3653,8 @@ def import_layout_preset_tool(import_path: str, preset_name: str = None) -> str:
         import_path: Path to the preset file to import
         preset_name: Name to save the imported preset as (uses filename if None)
     """
+    from src.utils.layout_presets import import_layout_preset
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4187,6 +3676,8 @@ def delete_layout_preset_tool(preset_name: str) -> str:
     Args:
         preset_name: Name of the preset to delete
     """
+    from src.utils.layout_presets import delete_layout_preset
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4203,6 +3694,8 @@ def delete_layout_preset_tool(preset_name: str) -> str:
 @mcp.resource("resolve://app/state")
 def get_app_state_endpoint() -> Dict[str, Any]:
     """Get DaVinci Resolve application state information."""
+    from src.utils.app_control import get_app_state
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "connected": False}
     
@@ -4217,6 +3710,8 @@ def quit_app(force: bool = False, save_project: bool = True) -> str:
         force: Whether to force quit even if unsaved changes (potentially dangerous)
         save_project: Whether to save the project before quitting
     """
+    from src.utils.app_control import quit_resolve_app
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4235,6 +3730,8 @@ def restart_app(wait_seconds: int = 5) -> str:
     Args:
         wait_seconds: Seconds to wait between quit and restart
     """
+    from src.utils.app_control import restart_resolve_app
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4248,6 +3745,8 @@ def restart_app(wait_seconds: int = 5) -> str:
 @mcp.tool()
 def open_settings() -> str:
     """Open the Project Settings dialog in DaVinci Resolve."""
+    from src.utils.app_control import open_project_settings
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4261,6 +3760,8 @@ def open_settings() -> str:
 @mcp.tool()
 def open_app_preferences() -> str:
     """Open the Preferences dialog in DaVinci Resolve."""
+    from src.utils.app_control import open_preferences
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4278,6 +3779,8 @@ def open_app_preferences() -> str:
 @mcp.resource("resolve://cloud/projects")
 def get_cloud_projects() -> Dict[str, Any]:
     """Get list of available cloud projects."""
+    from src.utils.cloud_operations import get_cloud_project_list
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
@@ -4291,10 +3794,16 @@ def create_cloud_project_tool(project_name: str, folder_path: str = None) -> Dic
         project_name: Name for the new cloud project
         folder_path: Optional path for the cloud project folder
     """
+    from src.utils.cloud_operations import create_cloud_project
+    from api.timeline_item_operations import invalidate_resolve_cache
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
-    return create_cloud_project(resolve, project_name, folder_path)
+    # May load another project, so drop every remembered handle afterwards
+    result = create_cloud_project(resolve, project_name, folder_path)
+    invalidate_resolve_cache()
+    return result
 
 @mcp.tool()
 def import_cloud_project_tool(cloud_id: str, project_name: str = None) -> Dict[str, Any]:
@@ -4304,6 +3813,8 @@ def import_cloud_project_tool(cloud_id: str, project_name: str = None) -> Dict[s
         cloud_id: Cloud ID or reference of the project to import
         project_name: Optional custom name for the imported project (uses original name if None)
     """
+    from src.utils.cloud_operations import import_cloud_project
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
@@ -4317,6 +3828,8 @@ def restore_cloud_project_tool(cloud_id: str, project_name: str = None) -> Dict[
         cloud_id: Cloud ID or reference of the project to restore
         project_name: Optional custom name for the restored project (uses original name if None)
     """
+    from src.utils.cloud_operations import restore_cloud_project
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
@@ -4329,10 +3842,16 @@ def export_project_to_cloud_tool(project_name: str = None) -> Dict[str, Any]:
     Args:
         project_name: Optional name of project to export (uses current project if None)
     """
+    from src.utils.cloud_operations import export_project_to_cloud
+    from api.timeline_item_operations import invalidate_resolve_cache
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
-    return export_project_to_cloud(resolve, project_name)
+    # May load another project, so drop every remembered handle afterwards
+    result = export_project_to_cloud(resolve, project_name)
+    invalidate_resolve_cache()
+    return result
 
 @mcp.tool()
 def add_user_to_cloud_project_tool(cloud_id: str, user_email: str, permissions: str = "viewer") -> Dict[str, Any]:
@@ -4343,6 +3862,8 @@ def add_user_to_cloud_project_tool(cloud_id: str, user_email: str, permissions:
         user_email: Email of the user to add
         permissions: Permission level (viewer, editor, admin)
     """
+    from src.utils.cloud_operations import add_user_to_cloud_project
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
@@ -4356,6 +3877,8 @@ def remove_user_from_cloud_project_tool(cloud_id: str, user_email: str) -> Dict[
         cloud_id: Cloud ID of the project
         user_email: Email of the user to remove
     """
+    from src.utils.cloud_operations import remove_user_from_cloud_project
+    
     if resolve is None:
         return {"error": "Not connected to DaVinci Resolve", "success": False}
     
@@ -4497,6 +4020,8 @@ def set_superscale_settings_tool(enabled: bool, quality: int = 0) -> str:
         enabled: Whether SuperScale is enabled
         quality: SuperScale quality (0=Auto, 1=Better Quality, 2=Smoother)
     """
+    from api.helpers import ENABLED_STATE
+    
     if resolve is None:
         return "Error: Not connected to DaVinci Resolve"
     
@@ -4508,17 +4033,11 @@ def set_superscale_settings_tool(enabled: bool, quality: int = 0) -> str:
     if not current_project:
         return "Error: No project currently open"
     
-    quality_names = {
-        0: "Auto",
-        1: "Better Quality",
-        2: "Smoother"
-    }
-    
     result = set_superscale_settings(current_project, enabled, quality)
     
     if result:
-        status = "enabled" if enabled else "disabled"
-        quality_name = quality_names.get(quality, "Unknown")
+        status = ENABLED_STATE[bool(enabled)]
+        quality_name = SUPERSCALE_QUALITY_NAMES.get(quality, "Unknown")
         return f"Successfully {status} SuperScale with quality set to {quality_name}"
     else:
         return "Failed to set SuperScale settings"
@@ -4639,5 +4158,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        logger.error("Server error: %s", e)
         sys.exit(1) 
\ No newline at end of file
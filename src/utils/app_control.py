@@ -8,13 +8,12 @@ This module provides functions for controlling DaVinci Resolve application:
 - Handling basic application functions
 """
 
-import os
 import logging
 import time
 import sys
 import platform
 import subprocess
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.app_control")
@@ -44,7 +43,7 @@ def quit_resolve_app(resolve_obj, force: bool = False, save_project: bool = True
                 try:
                     project.SaveProject()
                 except Exception as e:
-                    logger.error(f"Failed to save project: {str(e)}")
+                    logger.error("Failed to save project: %s", e)
                     if not force:
                         logger.error("Aborting quit due to save failure")
                         return False
@@ -98,7 +97,7 @@ def quit_resolve_app(resolve_obj, force: bool = False, save_project: bool = True
         return False
         
     except Exception as e:
-        logger.error(f"Error quitting DaVinci Resolve: {str(e)}")
+        logger.error("Error quitting DaVinci Resolve: %s", e)
         return False
 
 def get_app_state(resolve_obj) -> Dict[str, Any]:
@@ -192,7 +191,7 @@ def restart_resolve_app(resolve_obj, wait_seconds: int = 5) -> bool:
             return False
         
         # Wait for the app to close
-        logger.info(f"Waiting {wait_seconds} seconds for Resolve to close")
+        logger.info("Waiting %s seconds for Resolve to close", wait_seconds)
         time.sleep(wait_seconds)
         
         # Start Resolve again
@@ -207,7 +206,7 @@ def restart_resolve_app(resolve_obj, wait_seconds: int = 5) -> bool:
         
         return True
     except Exception as e:
-        logger.error(f"Error restarting DaVinci Resolve: {str(e)}")
+        logger.error("Error restarting DaVinci Resolve: %s", e)
         return False
 
 def open_project_settings(resolve_obj) -> bool:
@@ -237,12 +236,12 @@ def open_project_settings(resolve_obj) -> bool:
         
         # Ensure we're on a page that supports project settings
         if current_page not in ['media', 'cut', 'edit', 'fusion', 'color', 'fairlight', 'deliver']:
-            logger.error(f"Can't open settings from page: {current_page}")
+            logger.error("Can't open settings from page: %s", current_page)
             return False
         
         return False  # Keyboard shortcuts not implemented yet
     except Exception as e:
-        logger.error(f"Error opening project settings: {str(e)}")
+        logger.error("Error opening project settings: %s", e)
         return False
 
 def open_preferences(resolve_obj) -> bool:
@@ -270,5 +269,5 @@ def open_preferences(resolve_obj) -> bool:
         # Alternative method - send keyboard shortcut based on platform
         return False  # Keyboard shortcuts not implemented yet
     except Exception as e:
-        logger.error(f"Error opening preferences: {str(e)}")
+        logger.error("Error opening preferences: %s", e)
         return False 
\ No newline at end of file
@@ -9,10 +9,8 @@ This module provides functions for working with DaVinci Resolve cloud projects:
 - Managing cloud project settings and metadata
 """
 
-import os
 import logging
-import json
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Any
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.cloud_operations")
@@ -75,7 +73,7 @@ def create_cloud_project(resolve_obj, project_name: str, folder_path: str = None
             return {"success": False, "error": f"Failed to create cloud project '{project_name}'"}
             
     except Exception as e:
-        logger.error(f"Error creating cloud project: {str(e)}")
+        logger.error("Error creating cloud project: %s", e)
         return {"success": False, "error": f"Error creating cloud project: {str(e)}"}
 
 def import_cloud_project(resolve_obj, cloud_id: str, project_name: str = None) -> Dict[str, Any]:
@@ -126,7 +124,7 @@ def import_cloud_project(resolve_obj, cloud_id: str, project_name: str = None) -
             return {"success": False, "error": f"Failed to import cloud project with ID '{cloud_id}'"}
             
     except Exception as e:
-        logger.error(f"Error importing cloud project: {str(e)}")
+        logger.error("Error importing cloud project: %s", e)
         return {"success": False, "error": f"Error importing cloud project: {str(e)}"}
 
 def restore_cloud_project(resolve_obj, cloud_id: str, project_name: str = None) -> Dict[str, Any]:
@@ -177,7 +175,7 @@ def restore_cloud_project(resolve_obj, cloud_id: str, project_name: str = None)
             return {"success": False, "error": f"Failed to restore cloud project with ID '{cloud_id}'"}
             
     except Exception as e:
-        logger.error(f"Error restoring cloud project: {str(e)}")
+        logger.error("Error restoring cloud project: %s", e)
         return {"success": False, "error": f"Error restoring cloud project: {str(e)}"}
 
 def get_cloud_project_list(resolve_obj) -> Dict[str, Any]:
@@ -229,7 +227,7 @@ def get_cloud_project_list(resolve_obj) -> Dict[str, Any]:
             return {"success": False, "error": "Failed to get cloud project list or none available"}
             
     except Exception as e:
-        logger.error(f"Error getting cloud project list: {str(e)}")
+        logger.error("Error getting cloud project list: %s", e)
         return {"success": False, "error": f"Error getting cloud project list: {str(e)}"}
 
 def export_project_to_cloud(resolve_obj, project_name: str = None) -> Dict[str, Any]:
@@ -293,7 +291,7 @@ def export_project_to_cloud(resolve_obj, project_name: str = None) -> Dict[str,
             return {"success": False, "error": f"Failed to export project '{project.GetName()}' to cloud"}
             
     except Exception as e:
-        logger.error(f"Error exporting project to cloud: {str(e)}")
+        logger.error("Error exporting project to cloud: %s", e)
         return {"success": False, "error": f"Error exporting project to cloud: {str(e)}"}
 
 def add_user_to_cloud_project(resolve_obj, cloud_id: str, user_email: str, 
@@ -350,7 +348,7 @@ def add_user_to_cloud_project(resolve_obj, cloud_id: str, user_email: str,
             }
             
     except Exception as e:
-        logger.error(f"Error adding user to cloud project: {str(e)}")
+        logger.error("Error adding user to cloud project: %s", e)
         return {"success": False, "error": f"Error adding user to cloud project: {str(e)}"}
 
 def remove_user_from_cloud_project(resolve_obj, cloud_id: str, user_email: str) -> Dict[str, Any]:
@@ -396,5 +394,5 @@ def remove_user_from_cloud_project(resolve_obj, cloud_id: str, user_email: str)
             }
             
     except Exception as e:
-        logger.error(f"Error removing user from cloud project: {str(e)}")
+        logger.error("Error removing user from cloud project: %s", e)
         return {"success": False, "error": f"Error removing user from cloud project: {str(e)}"} 
\ No newline at end of file
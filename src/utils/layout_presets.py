@@ -10,9 +10,10 @@ This module provides functions for working with DaVinci Resolve UI layout preset
 """
 
 import os
-import json
+import shutil
 import logging
-from typing import Dict, List, Any, Optional, Union
+import platform as platform_module
+from typing import Dict, List, Any
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.layout_presets")
@@ -34,9 +35,6 @@ def get_layout_preset_path(platform: str = None) -> str:
     Returns:
         Path to the layout presets directory
     """
-    import platform as platform_module
-    import os
-    
     # Determine platform if not specified
     if platform is None:
         platform = platform_module.system().lower()
@@ -146,10 +144,10 @@ def save_layout_preset(resolve_obj, preset_name: str, layout_type: str = "ui") -
             return ui_manager.SaveUILayout(safe_name)
         else:
             # Other layout types would be handled here
-            logger.error(f"Unsupported layout type: {layout_type}")
+            logger.error("Unsupported layout type: %s", layout_type)
             return False
     except Exception as e:
-        logger.error(f"Error saving layout preset: {str(e)}")
+        logger.error("Error saving layout preset: %s", e)
         return False
 
 def load_layout_preset(resolve_obj, preset_name: str, layout_type: str = "ui") -> bool:
@@ -177,10 +175,10 @@ def load_layout_preset(resolve_obj, preset_name: str, layout_type: str = "ui") -
             return ui_manager.LoadUILayout(preset_name)
         else:
             # Other layout types would be handled here
-            logger.error(f"Unsupported layout type: {layout_type}")
+            logger.error("Unsupported layout type: %s", layout_type)
             return False
     except Exception as e:
-        logger.error(f"Error loading layout preset: {str(e)}")
+        logger.error("Error loading layout preset: %s", e)
         return False
 
 def export_layout_preset(preset_name: str, export_path: str, layout_type: str = "ui") -> bool:
@@ -208,7 +206,7 @@ def export_layout_preset(preset_name: str, export_path: str, layout_type: str =
         
         # Ensure source file exists
         if not os.path.exists(source_path):
-            logger.error(f"Preset file not found: {source_path}")
+            logger.error("Preset file not found: %s", source_path)
             return False
         
         # Ensure destination directory exists
@@ -217,12 +215,11 @@ def export_layout_preset(preset_name: str, export_path: str, layout_type: str =
             os.makedirs(export_dir, exist_ok=True)
         
         # Copy the preset file
-        import shutil
         shutil.copy2(source_path, export_path)
         
         return True
     except Exception as e:
-        logger.error(f"Error exporting layout preset: {str(e)}")
+        logger.error("Error exporting layout preset: %s", e)
         return False
 
 def import_layout_preset(import_path: str, preset_name: str = None, layout_type: str = "ui") -> bool:
@@ -240,7 +237,7 @@ def import_layout_preset(import_path: str, preset_name: str = None, layout_type:
     try:
         # Ensure source file exists
         if not os.path.exists(import_path):
-            logger.error(f"Import file not found: {import_path}")
+            logger.error("Import file not found: %s", import_path)
             return False
         
         # Get the destination preset path
@@ -261,12 +258,11 @@ def import_layout_preset(import_path: str, preset_name: str = None, layout_type:
         dest_path = os.path.join(preset_dir, f"{safe_name}.layout")
         
         # Copy the preset file
-        import shutil
         shutil.copy2(import_path, dest_path)
         
         return True
     except Exception as e:
-        logger.error(f"Error importing layout preset: {str(e)}")
+        logger.error("Error importing layout preset: %s", e)
         return False
 
 def delete_layout_preset(preset_name: str, layout_type: str = "ui") -> bool:
@@ -293,7 +289,7 @@ def delete_layout_preset(preset_name: str, layout_type: str = "ui") -> bool:
         
         # Ensure file exists
         if not os.path.exists(preset_path):
-            logger.error(f"Preset file not found: {preset_path}")
+            logger.error("Preset file not found: %s", preset_path)
             return False
         
         # Delete the file
@@ -301,5 +297,5 @@ def delete_layout_preset(preset_name: str, layout_type: str = "ui") -> bool:
         
         return True
     except Exception as e:
-        logger.error(f"Error deleting layout preset: {str(e)}")
+        logger.error("Error deleting layout preset: %s", e)
         return False 
\ No newline at end of file
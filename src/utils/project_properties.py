@@ -8,10 +8,8 @@ This module provides functions for working with DaVinci Resolve project properti
 - Handling project-specific configurations
 """
 
-import os
 import logging
-import json
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Any
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.project_properties")
@@ -82,7 +80,7 @@ def get_all_project_properties(project_obj) -> Dict[str, Any]:
                     value = project_obj.GetSetting(prop_name)
                     properties[prop_name] = value
                 except Exception as e:
-                    logger.debug(f"Error getting property {prop_name}: {str(e)}")
+                    logger.debug("Error getting property %s: %s", prop_name, e)
             
             return properties
         else:
@@ -90,7 +88,7 @@ def get_all_project_properties(project_obj) -> Dict[str, Any]:
             return all_settings
             
     except Exception as e:
-        logger.error(f"Error getting project properties: {str(e)}")
+        logger.error("Error getting project properties: %s", e)
         return {"error": f"Error getting project properties: {str(e)}"}
 
 def get_project_property(project_obj, property_name: str) -> Any:
@@ -132,7 +130,7 @@ def get_project_property(project_obj, property_name: str) -> Any:
         
         return value
     except Exception as e:
-        logger.error(f"Error getting project property {property_name}: {str(e)}")
+        logger.error("Error getting project property %s: %s", property_name, e)
         return {"error": f"Error getting project property: {str(e)}"}
 
 def set_project_property(project_obj, property_name: str, property_value: Any) -> bool:
@@ -159,13 +157,13 @@ def set_project_property(project_obj, property_name: str, property_value: Any) -
                 try:
                     property_value = int(property_value)
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid integer value for property {property_name}: {property_value}")
+                    logger.warning("Invalid integer value for property %s: %s", property_name, property_value)
             
             elif property_type == "float":
                 try:
                     property_value = float(property_value)
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid float value for property {property_name}: {property_value}")
+                    logger.warning("Invalid float value for property %s: %s", property_name, property_value)
             
             elif property_type == "bool":
                 if isinstance(property_value, str):
@@ -176,7 +174,7 @@ def set_project_property(project_obj, property_name: str, property_value: Any) -
         return project_obj.SetSetting(property_name, property_value)
         
     except Exception as e:
-        logger.error(f"Error setting project property {property_name}: {str(e)}")
+        logger.error("Error setting project property %s: %s", property_name, e)
         return False
 
 def get_timeline_format_settings(project_obj) -> Dict[str, Any]:
@@ -243,7 +241,7 @@ def get_timeline_format_settings(project_obj) -> Dict[str, Any]:
         return settings
         
     except Exception as e:
-        logger.error(f"Error getting timeline format settings: {str(e)}")
+        logger.error("Error getting timeline format settings: %s", e)
         return {"error": f"Error getting timeline format settings: {str(e)}"}
 
 def set_timeline_format(project_obj, width: int, height: int, frame_rate: float, 
@@ -287,7 +285,7 @@ def set_timeline_format(project_obj, width: int, height: int, frame_rate: float,
         return success
         
     except Exception as e:
-        logger.error(f"Error setting timeline format: {str(e)}")
+        logger.error("Error setting timeline format: %s", e)
         return False
 
 def get_superscale_settings(project_obj) -> Dict[str, Any]:
@@ -334,7 +332,7 @@ def get_superscale_settings(project_obj) -> Dict[str, Any]:
         return settings
         
     except Exception as e:
-        logger.error(f"Error getting SuperScale settings: {str(e)}")
+        logger.error("Error getting SuperScale settings: %s", e)
         return {"error": f"Error getting SuperScale settings: {str(e)}"}
 
 def set_superscale_settings(project_obj, enabled: bool, quality: int = 0) -> bool:
@@ -355,7 +353,7 @@ def set_superscale_settings(project_obj, enabled: bool, quality: int = 0) -> boo
     try:
         # Validate quality value
         if quality not in [0, 1, 2]:
-            logger.warning(f"Invalid SuperScale quality value: {quality}. Using 0 (Auto)")
+            logger.warning("Invalid SuperScale quality value: %s. Using 0 (Auto)", quality)
             quality = 0
         
         # Set SuperScale properties
@@ -372,7 +370,7 @@ def set_superscale_settings(project_obj, enabled: bool, quality: int = 0) -> boo
         return success
         
     except Exception as e:
-        logger.error(f"Error setting SuperScale settings: {str(e)}")
+        logger.error("Error setting SuperScale settings: %s", e)
         return False
 
 def get_color_settings(project_obj) -> Dict[str, Any]:
@@ -419,7 +417,7 @@ def get_color_settings(project_obj) -> Dict[str, Any]:
         return settings
         
     except Exception as e:
-        logger.error(f"Error getting color settings: {str(e)}")
+        logger.error("Error getting color settings: %s", e)
         return {"error": f"Error getting color settings: {str(e)}"}
 
 def set_color_science_mode(project_obj, mode: str) -> bool:
@@ -456,14 +454,14 @@ def set_color_science_mode(project_obj, mode: str) -> bool:
             mode_value = mode_values.get(mode)
         
         if mode_value is None:
-            logger.error(f"Invalid color science mode: {mode}")
+            logger.error("Invalid color science mode: %s", mode)
             return False
         
         # Set the color science mode
         return set_project_property(project_obj, "colorScienceMode", mode_value)
         
     except Exception as e:
-        logger.error(f"Error setting color science mode: {str(e)}")
+        logger.error("Error setting color science mode: %s", e)
         return False
 
 def set_color_space(project_obj, color_space: str, gamma: str = None) -> bool:
@@ -496,7 +494,7 @@ def set_color_space(project_obj, color_space: str, gamma: str = None) -> bool:
         return success
         
     except Exception as e:
-        logger.error(f"Error setting color space: {str(e)}")
+        logger.error("Error setting color space: %s", e)
         return False
 
 def get_project_metadata(project_obj) -> Dict[str, Any]:
@@ -549,7 +547,7 @@ def get_project_metadata(project_obj) -> Dict[str, Any]:
         return metadata
         
     except Exception as e:
-        logger.error(f"Error getting project metadata: {str(e)}")
+        logger.error("Error getting project metadata: %s", e)
         return {"error": f"Error getting project metadata: {str(e)}"}
 
 def get_project_info(project_obj) -> Dict[str, Any]:
@@ -595,5 +593,5 @@ def get_project_info(project_obj) -> Dict[str, Any]:
         return project_info
         
     except Exception as e:
-        logger.error(f"Error getting project info: {str(e)}")
+        logger.error("Error getting project info: %s", e)
         return {"error": f"Error getting project info: {str(e)}"} 
\ No newline at end of file
@@ -22,7 +22,7 @@ def initialize_resolve():
             logger.error("Failed to get Resolve object. Is DaVinci Resolve running?")
             return None
         
-        logger.info(f"Connected to DaVinci Resolve: {resolve.GetProductName()} {resolve.GetVersionString()}")
+        logger.info("Connected to DaVinci Resolve: %s %s", resolve.GetProductName(), resolve.GetVersionString())
         return resolve
     
     except ImportError:
@@ -34,24 +34,24 @@ def initialize_resolve():
         
         if platform_name == 'darwin':
             logger.error("On macOS, typically:")
-            logger.error(f'export RESOLVE_SCRIPT_API="{paths["api_path"]}"')
-            logger.error(f'export RESOLVE_SCRIPT_LIB="{paths["lib_path"]}"')
-            logger.error(f'export PYTHONPATH="$PYTHONPATH:{paths["modules_path"]}"')
+            logger.error('export RESOLVE_SCRIPT_API="%s"', paths["api_path"])
+            logger.error('export RESOLVE_SCRIPT_LIB="%s"', paths["lib_path"])
+            logger.error('export PYTHONPATH="$PYTHONPATH:%s"', paths["modules_path"])
         elif platform_name == 'windows':
             logger.error("On Windows, typically:")
-            logger.error(f'set RESOLVE_SCRIPT_API={paths["api_path"]}')
-            logger.error(f'set RESOLVE_SCRIPT_LIB={paths["lib_path"]}')
-            logger.error(f'set PYTHONPATH=%PYTHONPATH%;{paths["modules_path"]}')
+            logger.error("set RESOLVE_SCRIPT_API=%s", paths["api_path"])
+            logger.error("set RESOLVE_SCRIPT_LIB=%s", paths["lib_path"])
+            logger.error("set PYTHONPATH=%%PYTHONPATH%%;%s", paths["modules_path"])
         elif platform_name == 'linux':
             logger.error("On Linux, typically:")
-            logger.error(f'export RESOLVE_SCRIPT_API="{paths["api_path"]}"')
-            logger.error(f'export RESOLVE_SCRIPT_LIB="{paths["lib_path"]}"')
-            logger.error(f'export PYTHONPATH="$PYTHONPATH:{paths["modules_path"]}"')
+            logger.error('export RESOLVE_SCRIPT_API="%s"', paths["api_path"])
+            logger.error('export RESOLVE_SCRIPT_LIB="%s"', paths["lib_path"])
+            logger.error('export PYTHONPATH="$PYTHONPATH:%s"', paths["modules_path"])
         
         return None
     
     except Exception as e:
-        logger.error(f"Unexpected error initializing Resolve: {str(e)}")
+        logger.error("Unexpected error initializing Resolve: %s", e)
         return None
 
 def check_environment_variables():
@@ -0,0 +1,12 @@
+"""
+Pytest configuration for the unit tests.
+
+The api package is imported the way the server imports it, with src/ on the path.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Unit tests for api.helpers.
+
+Usage:
+    python -m pytest tests/test_api_helpers.py
+"""
+
+import pytest
+
+from api.helpers import OpResult, is_success, resolve_call
+
+
+@pytest.mark.parametrize("result, expected", [
+    (True, True),
+    (False, False),
+    (None, False),
+    (1, True),
+    (0, False),
+    ("", False),
+    ("ok", True),
+    ([], False),
+    ([1], True),
+    ({"id": 1}, True),
+])
+def test_is_success(result, expected):
+    assert is_success(result) is expected
+
+
+def test_op_result_to_dict_leaves_out_empty_fields():
+    assert OpResult(True).to_dict() == {"success": True}
+
+
+def test_op_result_to_dict_includes_message_error_and_extras():
+    result = OpResult(False, message="tried", error="failed", extras={"node_index": 2})
+    assert result.to_dict() == {"success": False, "message": "tried", "error": "failed", "node_index": 2}
+
+
+def test_op_result_to_dict_keeps_empty_error_string():
+    assert OpResult(False, error="").to_dict() == {"success": False, "error": ""}
+
+
+def test_op_result_extras_are_not_shared():
+    first, second = OpResult(True), OpResult(True)
+    first.extras["op"] = "set"
+    assert second.to_dict() == {"success": True}
+
+
+def test_resolve_call_turns_exceptions_into_error_results():
+    @resolve_call("doing things")
+    def failing():
+        raise RuntimeError("boom")
+    
+    @resolve_call("doing things", as_dict=False)
+    def failing_str():
+        raise RuntimeError("boom")
+    
+    assert failing() == {"error": "Error doing things: boom"}
+    assert failing_str() == "Error doing things: boom"
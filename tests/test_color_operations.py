@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Resolve-independent parts of api.color_operations.
+
+Usage:
+    python -m pytest tests/test_color_operations.py
+"""
+
+import pytest
+
+from api import color_operations
+from api.color_operations import build_cdl_map, find_clips_by_name, normalize_cdl_values, parse_cdl_row
+
+
+class FakeClip:
+    """Stand-in for a timeline item that only knows its name."""
+    
+    def __init__(self, name):
+        self.name = name
+        self.name_calls = 0
+    
+    def GetName(self):
+        self.name_calls += 1
+        return self.name
+
+
+@pytest.mark.parametrize("values", [
+    [1, 0.5, 2],
+    (1.0, 0.5, 2.0),
+    "1 0.5 2",
+    "1,0.5,2",
+    "1, 0.5,  2",
+    "  1\t0.5\n2  ",
+    ["1", "0.5", "2"],
+])
+def test_normalize_cdl_values_accepts_sequences_and_strings(values):
+    assert normalize_cdl_values("slope", values) == [1.0, 0.5, 2.0]
+
+
+@pytest.mark.parametrize("values", [
+    [1.0, 1.0],
+    [1.0, 1.0, 1.0, 1.0],
+    "1.0 1.0",
+    "1.0 1.0 1.0 1.0",
+    "1,2,3,",
+    "",
+])
+def test_normalize_cdl_values_rejects_wrong_count(values):
+    with pytest.raises(ValueError, match="slope must have exactly 3 values"):
+        normalize_cdl_values("slope", values)
+
+
+@pytest.mark.parametrize("values", [
+    ["a", 1.0, 1.0],
+    [None, 1.0, 1.0],
+    "1.0 x 1.0",
+])
+def test_normalize_cdl_values_rejects_non_numeric(values):
+    with pytest.raises(ValueError, match="power values must be numbers"):
+        normalize_cdl_values("power", values)
+
+
+def test_build_cdl_map_formats_values_for_resolve():
+    cdl = build_cdl_map(2, [1, 1.5, 1], "0 0.1 0", "1,1,0.9", saturation="1.2")
+    assert cdl == {
+        "NodeIndex": "2",
+        "Slope": "1.0000 1.5000 1.0000",
+        "Offset": "0.0000 0.1000 0.0000",
+        "Power": "1.0000 1.0000 0.9000",
+        "Saturation": "1.2000",
+    }
+
+
+def test_build_cdl_map_defaults_saturation():
+    assert build_cdl_map(1, [1, 1, 1], [0, 0, 0], [1, 1, 1])["Saturation"] == "1.0000"
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"offset": [0, 0]}, "offset must have exactly 3 values"),
+    ({"power": "1 1 z"}, "power values must be numbers"),
+    ({"saturation": "high"}, "saturation must be a number"),
+    ({"saturation": None}, "saturation must be a number"),
+])
+def test_build_cdl_map_rejects_bad_components(kwargs, message):
+    args = {"slope": [1, 1, 1], "offset": [0, 0, 0], "power": [1, 1, 1]}
+    args.update(kwargs)
+    with pytest.raises(ValueError, match=message):
+        build_cdl_map(1, **args)
+
+
+def test_find_clips_by_name_returns_first_match_per_name():
+    first_a, second_a, b = FakeClip("A"), FakeClip("A"), FakeClip("B")
+    found = find_clips_by_name([first_a, None, second_a, b], ["A", "B", "missing"])
+    assert found == {"A": first_a, "B": b}
+
+
+def test_find_clips_by_name_stops_once_all_names_found():
+    clips = [FakeClip("A"), FakeClip("B"), FakeClip("C")]
+    assert find_clips_by_name(clips, ["A", "B"]) == {"A": clips[0], "B": clips[1]}
+    assert clips[2].name_calls == 0
+
+
+def test_find_clips_by_name_with_no_names():
+    assert find_clips_by_name([FakeClip("A")], []) == {}
+
+
+GOOD_ROW = [2, 1.1, 1.0, 1.0, 0.0, 0.0, 0.05, 1.0, 1.0, 0.9]
+
+
+@pytest.mark.parametrize("row, node_index, saturation", [
+    (GOOD_ROW, 2, "1.0000"),
+    ([2.0] + GOOD_ROW[1:], 2, "1.0000"),
+    (GOOD_ROW + [0.8], 2, "0.8000"),
+])
+def test_parse_cdl_row_accepts_good_rows(row, node_index, saturation):
+    parsed_index, cdl = parse_cdl_row(row)
+    assert parsed_index == node_index
+    assert isinstance(parsed_index, int)
+    assert cdl == {
+        "NodeIndex": str(node_index),
+        "Slope": "1.1000 1.0000 1.0000",
+        "Offset": "0.0000 0.0000 0.0500",
+        "Power": "1.0000 1.0000 0.9000",
+        "Saturation": saturation,
+    }
+
+
+@pytest.mark.parametrize("row", [GOOD_ROW[:9], GOOD_ROW + [1.0, 1.0], []])
+def test_parse_cdl_row_rejects_wrong_length(row):
+    with pytest.raises(ValueError, match="Expected 10 or 11 values per row"):
+        parse_cdl_row(row)
+
+
+@pytest.mark.parametrize("node_index", [1.5, 0, -1, float("nan"), float("inf"), "2", True])
+def test_parse_cdl_row_rejects_bad_node_index(node_index):
+    with pytest.raises(ValueError, match="Node index must be a whole number"):
+        parse_cdl_row([node_index] + GOOD_ROW[1:])
+
+
+class FakeTimelineItem:
+    """Stand-in for a timeline item that records the CDL maps it receives."""
+    
+    def __init__(self):
+        self.cdl_maps = []
+    
+    def GetName(self):
+        return "clip"
+    
+    def SetCDL(self, cdl):
+        self.cdl_maps.append(cdl)
+        return True
+
+
+def test_set_cdl_batch_reports_each_row(monkeypatch):
+    item = FakeTimelineItem()
+    monkeypatch.setattr(color_operations, "get_timeline_item", lambda *args: (item, None))
+    
+    rows = [[3.0] + GOOD_ROW[1:], GOOD_ROW[:5], [1.5] + GOOD_ROW[1:], 5, GOOD_ROW]
+    result = color_operations.set_cdl_batch(None, rows)
+    
+    assert result["success"] is False
+    assert len(result["results"]) == len(rows)
+    assert result["results"][0] == {"success": True, "node_index": 3}
+    assert result["results"][1]["success"] is False
+    assert "Expected 10 or 11 values per row, got 5" in result["results"][1]["error"]
+    assert result["results"][2]["success"] is False
+    assert "Node index must be a whole number" in result["results"][2]["error"]
+    assert result["results"][3]["success"] is False
+    assert "node_index" not in result["results"][3]
+    assert result["results"][4] == {"success": True, "node_index": 2}
+    assert [cdl["NodeIndex"] for cdl in item.cdl_maps] == ["3", "2"]
+
+
+class FakeTimeline:
+    """Stand-in for a timeline with one video track of named clips."""
+    
+    def __init__(self, clips):
+        self.clips = clips
+    
+    def GetUniqueId(self):
+        return "timeline"
+    
+    def GetTrackCount(self, track_type):
+        return 1
+    
+    def GetItemListInTrack(self, track_type, track_index):
+        return self.clips
+
+
+class FakeResolve:
+    """Stand-in for Resolve that stays on the Color page."""
+    
+    def GetCurrentPage(self):
+        return "color"
+
+
+def test_copy_grade_to_clips_reports_targets_that_are_all_the_source(monkeypatch):
+    timeline = FakeTimeline([FakeClip("A"), FakeClip("B")])
+    monkeypatch.setattr(color_operations, "get_active_timeline", lambda resolve: (timeline, None))
+    
+    result = color_operations.copy_grade_to_clips(FakeResolve(), ["A", "A"], source_clip_name="A")
+    
+    assert result == {"error": "All target clips are the source clip 'A'", "skipped": ["A", "A"]}
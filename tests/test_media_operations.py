@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Resolve-independent parts of api.media_operations.
+
+Usage:
+    python -m pytest tests/test_media_operations.py
+"""
+
+from api.media_operations import index_clips_by_name
+
+
+class FakeClip:
+    """Stand-in for a media pool item that only knows its name."""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def GetName(self):
+        return self.name
+
+
+def test_index_clips_by_name_keeps_first_clip_per_name():
+    first_a, second_a, b = FakeClip("A"), FakeClip("A"), FakeClip("B")
+    assert index_clips_by_name([first_a, None, b, second_a]) == {"A": first_a, "B": b}
+
+
+def test_index_clips_by_name_with_no_clips():
+    assert index_clips_by_name([]) == {}
+    assert index_clips_by_name([None]) == {}
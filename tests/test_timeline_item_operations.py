@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Resolve-independent parts of api.timeline_item_operations.
+
+Usage:
+    python -m pytest tests/test_timeline_item_operations.py
+"""
+
+import pytest
+
+from api.timeline_item_operations import (select_track_items, validate_item_property, validate_keyframe,
+                                          validate_property_group)
+
+
+ITEMS = ["a", "b", "c", "d"]
+
+
+class FakeItem:
+    """Stand-in for a timeline item spanning frames 100 to 200."""
+    
+    def __init__(self, item_type="Video"):
+        self.item_type = item_type
+    
+    def GetType(self):
+        return self.item_type
+    
+    def GetStart(self):
+        return 100
+    
+    def GetEnd(self):
+        return 200
+
+
+@pytest.mark.parametrize("indices, expected_indices, expected_items", [
+    ([1], [1], ("a",)),
+    ([4, 2], [4, 2], ("d", "b")),
+    ([1, 2, 3, 4], [1, 2, 3, 4], ("a", "b", "c", "d")),
+    ([2, 2], [2, 2], ("b", "b")),
+])
+def test_select_track_items_picks_items_in_request_order(indices, expected_indices, expected_items):
+    assert select_track_items(ITEMS, indices) == (expected_indices, expected_items)
+
+
+def test_select_track_items_drops_out_of_range_indices():
+    assert select_track_items(ITEMS, [0, 3, 5, -1]) == ([3], ("c",))
+
+
+@pytest.mark.parametrize("items, indices", [
+    (ITEMS, []),
+    (ITEMS, [0, 5]),
+    ([], [1]),
+])
+def test_select_track_items_with_nothing_to_pick(items, indices):
+    assert select_track_items(items, indices) == ([], ())
+
+
+def test_select_track_items_accepts_dict_keys():
+    assert select_track_items(ITEMS, dict.fromkeys([3, 1])) == ([3, 1], ("c", "a"))
+
+
+@pytest.mark.parametrize("group, values", [
+    ("composite", {"composite_mode": "Add"}),
+    ("composite", {"opacity": 0}),
+    ("composite", {"composite_mode": "Multiply", "opacity": 1.0}),
+    ("retime", {"speed": 0.5, "process": "OpticalFlow"}),
+    ("stabilization", {"enabled": False}),
+    ("stabilization", {"method": "Similarity", "strength": 0.5}),
+    ("audio", {"volume": 0.0, "pan": -1, "eq_enabled": True}),
+])
+def test_validate_property_group_accepts_valid_values(group, values):
+    assert validate_property_group(group, values) is None
+
+
+@pytest.mark.parametrize("group, values, message", [
+    ("lens", {"speed": 1.0}, "Invalid property group 'lens'"),
+    ("audio", {"gain": 1.0}, "Unknown audio parameters: gain"),
+    ("composite", {}, "Must specify at least one of composite_mode or opacity"),
+    ("stabilization", {"enabled": None, "method": ""}, "Must specify at least one of enabled, method or strength"),
+    ("composite", {"composite_mode": "Glow"}, "Invalid composite mode"),
+    ("composite", {"opacity": 1.5}, "Opacity must be between 0.0 and 1.0"),
+    ("composite", {"opacity": "0.5"}, "Opacity must be between 0.0 and 1.0"),
+    ("retime", {"speed": 0}, "Speed must be greater than 0"),
+    ("retime", {"process": "Blend"}, "Invalid retime process"),
+    ("stabilization", {"enabled": 1}, "Enabled must be true or false"),
+    ("stabilization", {"strength": -0.1}, "Strength must be between 0.0 and 1.0"),
+    ("audio", {"volume": -1.0}, "Volume must be greater than or equal to 0.0"),
+    ("audio", {"pan": 2}, "Pan must be between -1.0 and 1.0"),
+    ("audio", {"eq_enabled": "yes"}, "EQ enabled must be true or false"),
+])
+def test_validate_property_group_rejects_invalid_values(group, values, message):
+    assert message in validate_property_group(group, values)
+
+
+@pytest.mark.parametrize("track_type, property_name, value", [
+    ("video", "Pan", 12.5),
+    ("video", "CropLeft", 0.1),
+    ("video", "Opacity", 0.5),
+    ("video", "StabilizationEnable", True),
+    ("audio", "Pan", -0.5),
+    ("audio", "Volume", 1.0),
+])
+def test_validate_item_property_accepts_settable_properties(track_type, property_name, value):
+    assert validate_item_property(track_type, property_name, value) is None
+
+
+@pytest.mark.parametrize("track_type, property_name, value, message", [
+    ("video", "Pan", None, "No value given for Pan"),
+    ("video", "ZoomX", "big", "ZoomX must be a number"),
+    ("video", "Opacity", 2, "Opacity must be between 0.0 and 1.0"),
+    ("video", "Volume", 1.0, "Property 'Volume' cannot be set on video items"),
+    ("audio", "Pan", 5.0, "Pan must be between -1.0 and 1.0"),
+    ("audio", "ZoomX", 1.0, "Property 'ZoomX' cannot be set on audio items"),
+    ("video", "MadeUp", 1.0, "Property 'MadeUp' cannot be set on video items"),
+])
+def test_validate_item_property_rejects_invalid_sets(track_type, property_name, value, message):
+    assert validate_item_property(track_type, property_name, value) == message
+
+
+@pytest.mark.parametrize("track_type, property_name, frame", [
+    ("video", "ZoomX", 100),
+    ("video", "Opacity", 200),
+    ("audio", "Volume", 150),
+])
+def test_validate_keyframe_accepts_keyframeable_properties_in_range(track_type, property_name, frame):
+    assert validate_keyframe(FakeItem(), track_type, property_name, frame) is None
+
+
+@pytest.mark.parametrize("track_type, property_name, frame, message", [
+    ("video", "Speed", 150, "Invalid property name"),
+    ("audio", "ZoomX", 150, "Property 'ZoomX' is not available for audio items"),
+    ("video", "ZoomX", 99, "Frame 99 is outside the item's range (100 to 200)"),
+    ("video", "ZoomX", 201, "Frame 201 is outside the item's range (100 to 200)"),
+])
+def test_validate_keyframe_rejects_invalid_keyframes(track_type, property_name, frame, message):
+    assert message in validate_keyframe(FakeItem(), track_type, property_name, frame)
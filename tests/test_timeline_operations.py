@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Resolve-independent parts of api.timeline_operations.
+
+Usage:
+    python -m pytest tests/test_timeline_operations.py
+"""
+
+import pytest
+
+from api.timeline_operations import TIMECODE_PATTERN
+
+
+@pytest.mark.parametrize("timecode", [
+    "01:00:00:00",
+    "00:00:00:00",
+    "23:59:59:29",
+    "01:00:00;00",
+])
+def test_timecode_pattern_accepts_timecodes(timecode):
+    assert TIMECODE_PATTERN.match(timecode)
+
+
+@pytest.mark.parametrize("timecode", [
+    "1:00:00:00",
+    "01:00:00",
+    "01:00:00:00:00",
+    "01-00-00-00",
+    "01:00:00.00",
+    "aa:bb:cc:dd",
+    "01:00:00:00 ",
+    "",
+])
+def test_timecode_pattern_rejects_malformed_timecodes(timecode):
+    assert not TIMECODE_PATTERN.match(timecode)